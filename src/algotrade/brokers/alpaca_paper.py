@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import UTC, datetime
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from time import monotonic, sleep
 from typing import Any
 
@@ -31,6 +32,8 @@ class AlpacaPaperBroker:
         "pending_cancel",
         "calculated",
     }
+    # Alpaca caps one orders listing at 500 entries.
+    _MAX_ORDER_LISTING = 500
 
     def __init__(
         self,
@@ -158,6 +161,31 @@ class AlpacaPaperBroker:
         status = str(payload.get("status", "")).strip().lower()
         return status or None
 
+    def get_order_statuses(self, order_ids: list[str], after: str | None = None) -> dict[str, str]:
+        """Fetch latest statuses for many broker order ids in one listing request.
+
+        The listing covers at most as many orders as there are ids, submitted after ``after``
+        when given, so ids it does not reach are left out of the result.
+        """
+        wanted = {order_id for order_id in order_ids if order_id}
+        if not wanted:
+            return {}
+        params = {
+            "status": "all",
+            "direction": "desc",
+            "limit": str(min(len(wanted), self._MAX_ORDER_LISTING)),
+        }
+        if after:
+            params["after"] = after
+        payload = self._request("GET", "/v2/orders", params=params)
+        statuses: dict[str, str] = {}
+        for item in payload if isinstance(payload, list) else []:
+            order_id = str(item.get("id", ""))
+            status = str(item.get("status", "")).strip().lower()
+            if order_id in wanted and status:
+                statuses[order_id] = status
+        return statuses
+
     def close_all_positions(self, cancel_orders: bool = True) -> list[dict[str, Any]]:
         """Close every open position using Alpaca's server-side liquidation endpoint."""
         params = {"cancel_orders": "true"} if cancel_orders else None
@@ -264,6 +292,7 @@ class AlpacaPaperBroker:
         return normalized
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _is_crypto_symbol(symbol: str) -> bool:
         normalized = AlpacaPaperBroker.normalize_symbol(symbol)
         return normalized.endswith("USD") and len(normalized) >= 6
@@ -319,12 +348,9 @@ class AlpacaPaperBroker:
     def _parse_optional_float(value: Any) -> float | None:
         if value is None:
             return None
-        if isinstance(value, (int, float)):
-            return float(value)
-        text = str(value).strip()
-        if not text or text.lower() in {"none", "null"}:
-            return None
+        # float() accepts numbers and padded numeric strings directly; blanks and
+        # "none"/"null" markers fail conversion and fall through to None.
         try:
-            return float(text)
-        except ValueError:
+            return float(value)
+        except (TypeError, ValueError):
             return None
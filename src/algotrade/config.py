@@ -117,6 +117,7 @@ class Settings:
     max_passes: int | None = None
     backtest_max_steps: int | None = None
     interval_seconds: int = 5
+    parallel_fetch_workers: int = 1
     data_source: str = "auto"
     historical_data_dir: str = "historical_data"
     events_dir: str = "runs"
@@ -135,6 +136,8 @@ class Settings:
     alpaca_data_url: str = "https://data.alpaca.markets"
     timeframe: str = "1Day"
     backtest_starting_cash: float = 100000.0
+    emit_report: bool = True
+    report_blocking: bool = True
 
     @classmethod
     def from_env(cls) -> Self:
@@ -171,6 +174,7 @@ class Settings:
             interval_seconds=int(
                 os.getenv("INTERVAL_SECONDS") or os.getenv("POLLING_INTERVAL_SECONDS", "5")
             ),
+            parallel_fetch_workers=int(os.getenv("PARALLEL_FETCH_WORKERS", "1")),
             data_source=str(os.getenv("DATA_SOURCE", "auto")).strip().lower(),
             historical_data_dir=str(os.getenv("HISTORICAL_DATA_DIR", "historical_data")).strip(),
             events_dir=str(os.getenv("EVENTS_DIR", "runs")).strip(),
@@ -193,6 +197,8 @@ class Settings:
             ).strip(),
             timeframe=str(os.getenv("TIMEFRAME", "1Day")).strip(),
             backtest_starting_cash=float(os.getenv("BACKTEST_STARTING_CASH", "100000")),
+            emit_report=parse_bool(os.getenv("EMIT_REPORT"), True),
+            report_blocking=parse_bool(os.getenv("REPORT_BLOCKING"), True),
         )
         return raw.validate()
 
@@ -229,6 +235,8 @@ class Settings:
         """Validate settings fields."""
         if self.interval_seconds <= 0:
             raise ValueError("interval_seconds must be positive")
+        if self.parallel_fetch_workers <= 0:
+            raise ValueError("parallel_fetch_workers must be positive")
         if self.max_passes is not None and self.max_passes <= 0:
             raise ValueError("max_passes must be positive")
         if self.backtest_max_steps is not None and self.backtest_max_steps <= 0:
@@ -7,6 +7,7 @@ from time import sleep
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class AlpacaMarketDataProvider:
@@ -22,6 +23,7 @@ class AlpacaMarketDataProvider:
         limit: int = 500,
         timeout: int = 20,
         max_retries: int = 3,
+        pool_size: int = 10,
     ) -> None:
         self.data_base_url = data_base_url.rstrip("/")
         self.timeframe = self._normalize_timeframe(timeframe)
@@ -30,6 +32,11 @@ class AlpacaMarketDataProvider:
         self.timeout = timeout
         self.max_retries = max_retries
         self.session = requests.Session()
+        # Keep one kept-alive connection per concurrent fetch worker so cycles reuse TLS
+        # sessions instead of reconnecting when more requests are in flight than the default pool.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "APCA-API-KEY-ID": api_key,
@@ -50,6 +57,10 @@ class AlpacaMarketDataProvider:
             raise ValueError(f"No bars returned for {symbol}")
         return frame
 
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self.session.close()
+
     def _fetch_stock_bars(
         self,
         symbol: str,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
@@ -68,8 +69,10 @@ class CsvDataProvider:
                 raise ValueError(f"No CSV found for {symbol} under {self.data_dir}")
             self._bars_cache[symbol] = fallback_bars
             return fallback_bars
-        frame = pd.read_csv(path)
-        normalized = self._normalize_csv(frame, symbol)
+        stat = path.stat()
+        normalized = _read_normalized_csv(
+            type(self), str(path), stat.st_mtime_ns, stat.st_size, symbol
+        )
         self._bars_cache[symbol] = normalized
         return normalized
 
@@ -162,13 +165,14 @@ class CsvDataProvider:
             return self.data_dir / f"{normalized_symbol}.csv"
         return self.data_dir / market.upper() / f"{normalized_symbol}.csv"
 
-    def _normalize_csv(self, frame: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    @classmethod
+    def _normalize_csv(cls, frame: pd.DataFrame, symbol: str) -> pd.DataFrame:
         lower_to_original = {column.strip().lower(): column for column in frame.columns}
-        date_column = self._pick_date_column(lower_to_original)
-        rename_map = self._build_ohlcv_rename_map(lower_to_original, symbol)
+        date_column = cls._pick_date_column(lower_to_original)
+        rename_map = cls._build_ohlcv_rename_map(lower_to_original, symbol)
         normalized = frame.rename(columns=rename_map)
         normalized.index = pd.to_datetime(normalized[date_column], utc=True)
-        return self._normalize_ohlcv(normalized, symbol)
+        return cls._normalize_ohlcv(normalized, symbol)
 
     def _normalize_fallback(self, frame: pd.DataFrame, symbol: str) -> pd.DataFrame:
         normalized = frame.copy()
@@ -180,9 +184,10 @@ class CsvDataProvider:
             normalized.index = pd.to_datetime(normalized[date_column], utc=True)
         return self._normalize_ohlcv(normalized, symbol)
 
-    def _normalize_ohlcv(self, frame: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    @classmethod
+    def _normalize_ohlcv(cls, frame: pd.DataFrame, symbol: str) -> pd.DataFrame:
         lower_to_original = {column.strip().lower(): column for column in frame.columns}
-        rename_map = self._build_ohlcv_rename_map(lower_to_original, symbol)
+        rename_map = cls._build_ohlcv_rename_map(lower_to_original, symbol)
         normalized = frame.rename(columns=rename_map)
         normalized = normalized.sort_index()
         normalized = normalized[["open", "high", "low", "close", "volume"]].copy()
@@ -194,11 +199,12 @@ class CsvDataProvider:
             raise ValueError(f"{symbol}: data has no valid OHLCV rows")
         return normalized
 
-    def _pick_date_column(self, lower_to_original: dict[str, str]) -> str:
-        for candidate in self.date_column_candidates:
+    @classmethod
+    def _pick_date_column(cls, lower_to_original: dict[str, str]) -> str:
+        for candidate in cls.date_column_candidates:
             if candidate in lower_to_original:
                 return lower_to_original[candidate]
-        candidates = ", ".join(self.date_column_candidates)
+        candidates = ", ".join(cls.date_column_candidates)
         raise ValueError(f"CSV missing date column. Expected one of: {candidates}")
 
     @staticmethod
@@ -213,3 +219,19 @@ class CsvDataProvider:
                 raise ValueError(f"{symbol}: CSV missing required column '{name}'")
             rename_map[source] = name
         return rename_map
+
+
+@lru_cache(maxsize=256)
+def _read_normalized_csv(
+    provider_type: type[CsvDataProvider],
+    path: str,
+    mtime_ns: int,
+    size: int,
+    symbol: str,
+) -> pd.DataFrame:
+    """Parse and normalize a CSV once per file version, shared across provider instances.
+
+    Keying on modification time and size means edited or re-downloaded files are re-read.
+    Callers must treat the returned frame as read-only.
+    """
+    return provider_type._normalize_csv(pd.read_csv(path), symbol)
@@ -9,6 +9,7 @@ from .models import (
     OrderSide,
     PortfolioSnapshot,
     Position,
+    PositionArrays,
     RiskLimits,
 )
 
@@ -20,6 +21,7 @@ __all__ = [
     "OrderSide",
     "PortfolioSnapshot",
     "Position",
+    "PositionArrays",
     "RiskLimits",
     "TradeEvent",
 ]
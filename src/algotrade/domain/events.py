@@ -9,7 +9,12 @@ from typing import Any
 from .models import Mode
 
 
-@dataclass(frozen=True)
+def event_timestamp() -> str:
+    """Current UTC time in the ISO-8601 form used for ``TradeEvent.ts``."""
+    return datetime.now(tz=UTC).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
 class TradeEvent:
     """Single event written to JSONL."""
 
@@ -18,7 +23,7 @@ class TradeEvent:
     strategy_id: str
     event_type: str
     payload: dict[str, Any] = field(default_factory=dict)
-    ts: str = field(default_factory=lambda: datetime.now(tz=UTC).isoformat())
+    ts: str = field(default_factory=event_timestamp)
 
     def to_record(self) -> dict[str, Any]:
         """Convert event to serializable dict."""
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import cached_property
 from typing import Any, Literal
 
+import numpy as np
+
 Mode = Literal["backtest", "live"]
 
 
@@ -24,6 +29,35 @@ class Position:
     qty: float
 
 
+@dataclass(frozen=True)
+class PositionArrays:
+    """Column-oriented view of positions: sorted symbols aligned with a qty array."""
+
+    symbols: tuple[str, ...]
+    qty: np.ndarray
+    index: dict[str, int]
+
+    @classmethod
+    def from_positions(cls, positions: Mapping[str, Position]) -> PositionArrays:
+        """Build aligned arrays from a symbol-keyed position mapping."""
+        symbols = tuple(sorted(positions))
+        qty = np.fromiter(
+            (float(positions[symbol].qty) for symbol in symbols),
+            dtype=np.float64,
+            count=len(symbols),
+        )
+        return cls(
+            symbols=symbols,
+            qty=qty,
+            index={symbol: offset for offset, symbol in enumerate(symbols)},
+        )
+
+    def qty_for(self, symbol: str) -> float:
+        """Return the held quantity for a symbol, or zero when flat."""
+        offset = self.index.get(symbol)
+        return float(self.qty[offset]) if offset is not None else 0.0
+
+
 @dataclass(frozen=True)
 class PortfolioSnapshot:
     """Portfolio state used by strategies and risk checks."""
@@ -33,6 +67,11 @@ class PortfolioSnapshot:
     buying_power: float
     positions: dict[str, Position] = field(default_factory=dict)
 
+    @cached_property
+    def position_arrays(self) -> PositionArrays:
+        """Column-oriented positions, built once per snapshot."""
+        return PositionArrays.from_positions(self.positions)
+
 
 @dataclass(frozen=True)
 class Order:
@@ -46,7 +85,7 @@ class Order:
     client_order_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderRequest:
     """Order intent produced by the execution engine."""
 
@@ -56,6 +95,22 @@ class OrderRequest:
     order_type: str = "market"
     time_in_force: str = "day"
     client_order_id: str | None = None
+    symbol_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Normalized, interned symbol for set/dict membership checks downstream.
+        object.__setattr__(self, "symbol_key", sys.intern(str(self.symbol).strip().upper()))
+
+    def with_client_order_id(self, client_order_id: str) -> OrderRequest:
+        """Return a copy tagged with a client order id, without dataclasses.replace overhead."""
+        return OrderRequest(
+            symbol=self.symbol,
+            qty=self.qty,
+            side=self.side,
+            order_type=self.order_type,
+            time_in_force=self.time_in_force,
+            client_order_id=client_order_id,
+        )
 
 
 @dataclass(frozen=True)
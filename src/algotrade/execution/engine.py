@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from decimal import ROUND_DOWN, Decimal
 
+import numpy as np
+
 from algotrade.domain.models import OrderRequest, OrderSide, PortfolioSnapshot, Position, RiskLimits
 from algotrade.execution.risk import filter_orders_by_limits
 
@@ -16,18 +18,30 @@ def compute_orders(
     qty_precision: int = 6,
 ) -> list[OrderRequest]:
     """Translate current and target positions into delta orders."""
-    orders: list[OrderRequest] = []
+    if not targets:
+        return []
     normalized_min_trade_qty = max(float(min_trade_qty), 1e-9)
     precision = max(0, int(qty_precision))
-    for symbol, target_qty in sorted(targets.items()):
-        current_qty = float(current_positions.get(symbol, Position(symbol=symbol, qty=0)).qty)
-        delta = float(target_qty) - current_qty
+    symbols = sorted(targets)
+    target_qty = np.fromiter(
+        (float(targets[symbol]) for symbol in symbols), dtype=np.float64, count=len(symbols)
+    )
+    current_qty = np.fromiter(
+        (held_qty(current_positions, symbol) for symbol in symbols),
+        dtype=np.float64,
+        count=len(symbols),
+    )
+    deltas = target_qty - current_qty
+    # Quantizing only rounds toward zero, so deltas already below the minimum never trade.
+    orders: list[OrderRequest] = []
+    for offset in np.flatnonzero(np.abs(deltas) >= normalized_min_trade_qty).tolist():
+        delta = float(deltas[offset])
         qty = _quantize_down(abs(delta), precision)
         if qty < normalized_min_trade_qty:
             continue
         side = OrderSide.BUY if delta > 0 else OrderSide.SELL
         request = OrderRequest(
-            symbol=symbol,
+            symbol=symbols[offset],
             qty=qty,
             side=side,
             order_type=default_order_type,
@@ -36,6 +50,12 @@ def compute_orders(
     return orders
 
 
+def held_qty(positions: dict[str, Position], symbol: str) -> float:
+    """Return the held quantity for a symbol without allocating a placeholder position."""
+    position = positions.get(symbol)
+    return float(position.qty) if position is not None else 0.0
+
+
 def _quantize_down(value: float, precision: int) -> float:
     """Round toward zero at fixed precision to avoid oversizing fractional orders."""
     if precision <= 0:
@@ -23,7 +23,7 @@ def filter_orders_by_limits(
         ).qty
         signed_delta = order.qty if order.side is OrderSide.BUY else -order.qty
         proposed_qty = current_qty + signed_delta
-        symbol_forbids_short = order.symbol.upper() in blocked_short_symbols
+        symbol_forbids_short = order.symbol_key in blocked_short_symbols
         if proposed_qty < 0:
             if not limits.allow_short or symbol_forbids_short:
                 continue
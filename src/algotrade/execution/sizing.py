@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import numpy as np
+
+from algotrade.jit import NUMBA_AVAILABLE, njit
+
 
 def clamp_int(value: int, low: int, high: int) -> int:
     """Clamp an integer within inclusive bounds."""
@@ -19,3 +23,71 @@ def momentum_to_target(
     if momentum_score <= -threshold:
         return -max_abs_qty
     return 0
+
+
+def signal_strength(signal_values: np.ndarray, signal_cap: float) -> np.ndarray:
+    """Convert signed signals into normalized 0..1 strength scores."""
+    magnitude = np.abs(signal_values)
+    if signal_cap <= 0:
+        strength = np.ones_like(magnitude)
+    else:
+        strength = np.minimum(magnitude / float(signal_cap), 1.0)
+    return np.where(magnitude <= 1e-12, 0.0, strength)
+
+
+def bounded_notional_quantities(
+    signals: np.ndarray,
+    prices: np.ndarray,
+    equity: float,
+    min_fraction: float,
+    max_fraction: float,
+    signal_cap: float,
+) -> np.ndarray:
+    """Size signed signals into quantities worth ``min..max`` fractions of equity.
+
+    Symbols without a positive price or with a zero signal size to zero.
+    """
+    if NUMBA_AVAILABLE:
+        return _bounded_notional_kernel(
+            signals,
+            prices,
+            float(equity),
+            float(min_fraction),
+            float(max_fraction),
+            float(signal_cap),
+        )
+    tradable = (prices > 0) & (signals != 0)
+    safe_prices = np.where(tradable, prices, 1.0)
+    target_fraction = min_fraction + (
+        (max_fraction - min_fraction) * signal_strength(signals, signal_cap)
+    )
+    sized = (equity * target_fraction / safe_prices) * np.sign(signals)
+    return np.where(tradable, sized, 0.0)
+
+
+@njit(cache=True)
+def _bounded_notional_kernel(
+    signals: np.ndarray,
+    prices: np.ndarray,
+    equity: float,
+    min_fraction: float,
+    max_fraction: float,
+    signal_cap: float,
+) -> np.ndarray:
+    quantities = np.zeros(signals.shape[0])
+    span = max_fraction - min_fraction
+    for index in range(signals.shape[0]):
+        signal = signals[index]
+        price = prices[index]
+        if signal == 0.0 or not price > 0.0:
+            continue
+        magnitude = abs(signal)
+        if magnitude <= 1e-12:
+            strength = 0.0
+        elif signal_cap <= 0.0:
+            strength = 1.0
+        else:
+            strength = min(magnitude / signal_cap, 1.0)
+        qty = equity * (min_fraction + span * strength) / price
+        quantities[index] = qty if signal > 0 else -qty
+    return quantities
@@ -0,0 +1,29 @@
+"""Optional Numba compilation with a transparent pure-Python fallback."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+try:  # pragma: no cover - optional acceleration when Numba is installed.
+    import numba as _numba
+except ImportError:  # pragma: no cover - fallback path used in tests/CI.
+    _numba = None
+
+NUMBA_AVAILABLE = _numba is not None
+# ``numba.prange`` parallelizes loops inside ``njit(parallel=True)`` kernels; plain ``range``
+# keeps the same semantics when the kernel runs as ordinary Python.
+prange: Any = _numba.prange if _numba is not None else range
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Compile with ``numba.njit`` when installed; otherwise leave the function untouched."""
+    if _numba is not None:
+        return _numba.njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+        return function
+
+    return decorator
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import json
+import math
+import os
+import queue
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +15,15 @@ import plotly.express as px
 
 from algotrade.domain.events import TradeEvent
 
+try:  # pragma: no cover - optional acceleration when orjson is installed.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - fallback path used when orjson is absent.
+    _orjson = None
+
+_ORJSON_OPTIONS = _orjson.OPT_SORT_KEYS | _orjson.OPT_SERIALIZE_NUMPY if _orjson is not None else 0
+# Upper bound on queued chunks handed to one vectored write.
+_WRITE_BATCH = 256
+
 
 class JsonlEventSink:
     """Append-only JSONL writer."""
@@ -21,10 +34,157 @@ class JsonlEventSink:
         self.path = output_path
 
     def emit(self, event: TradeEvent) -> None:
-        record = event.to_record()
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record, sort_keys=True))
-            handle.write("\n")
+        with self.path.open("ab") as handle:
+            handle.write(_encode_record(event.to_record()) + b"\n")
+
+    def emit_many(self, events: list[TradeEvent]) -> None:
+        """Append several events with a single open and write."""
+        if not events:
+            return
+        data = b"".join(_encode_record(event.to_record()) + b"\n" for event in events)
+        with self.path.open("ab") as handle:
+            handle.write(data)
+
+    def flush(self) -> None:
+        """Block until emitted events are handed to the OS; writes are already synchronous."""
+
+    def close(self) -> None:
+        """Release writer resources; nothing is held open between writes."""
+
+
+class AsyncJsonlEventSink(JsonlEventSink):
+    """JSONL writer that encodes on the caller thread and writes on a background thread.
+
+    Events are queued as encoded bytes and written in drained batches (one ``writev`` where
+    available), so emitting never waits on disk I/O unless the bounded queue is full.
+    ``flush`` waits for queued events to reach the OS and ``close`` drains the queue before
+    stopping the writer. A failed write is re-raised from the next ``emit``, ``flush`` or
+    ``close`` on the caller thread.
+    """
+
+    def __init__(self, path: str, max_queue: int = 4096, drop_when_full: bool = False) -> None:
+        super().__init__(path)
+        self.drop_when_full = drop_when_full
+        self.dropped = 0
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=max_queue)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._closed = False
+        self._error: BaseException | None = None
+        self._writer = threading.Thread(target=self._drain, name="event-sink", daemon=True)
+        self._writer.start()
+
+    def emit(self, event: TradeEvent) -> None:
+        self._put(_encode_record(event.to_record()) + b"\n")
+
+    def emit_many(self, events: list[TradeEvent]) -> None:
+        if not events:
+            return
+        self._put(b"".join(_encode_record(event.to_record()) + b"\n" for event in events))
+
+    def flush(self) -> None:
+        if not self._closed:
+            self._queue.join()
+            self._raise_write_error()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        os.close(self._fd)
+        self._closed = True
+        self._raise_write_error()
+
+    def _put(self, chunk: bytes) -> None:
+        if self._closed:
+            with self.path.open("ab") as handle:
+                handle.write(chunk)
+            return
+        self._raise_write_error()
+        if not self.drop_when_full:
+            self._queue.put(chunk)
+            return
+        try:
+            self._queue.put_nowait(chunk)
+        except queue.Full:
+            self.dropped += 1
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _WRITE_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            chunks = [chunk for chunk in batch if chunk is not None]
+            try:
+                if chunks:
+                    _write_chunks(self._fd, chunks)
+            except Exception as exc:
+                # Keep draining so flush/close never block; the caller sees the first error.
+                if self._error is None:
+                    self._error = exc
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if None in batch:
+                return
+
+    def _raise_write_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+
+def _write_chunks(fd: int, chunks: list[bytes]) -> None:
+    """Write all chunks to ``fd``, using one scatter-gather syscall when the OS supports it."""
+    writev = getattr(os, "writev", None)
+    if writev is not None:
+        written = writev(fd, chunks)
+        total = sum(len(chunk) for chunk in chunks)
+        if written == total:
+            return
+        data = memoryview(b"".join(chunks))[written:]
+    else:
+        data = memoryview(b"".join(chunks))
+    while data:
+        data = data[os.write(fd, data) :]
+
+
+def _encode_record(record: dict[str, Any]) -> bytes:
+    """Serialize one event record as compact, sorted-key UTF-8 JSON.
+
+    Both encoders produce the same bytes: non-finite floats become ``null`` (orjson's
+    behaviour) rather than the non-standard ``NaN``/``Infinity`` tokens.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(record, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    try:
+        text = _dumps_compact(record)
+    except ValueError:
+        text = _dumps_compact(_null_non_finite(record))
+    return text.encode("utf-8")
+
+
+def _dumps_compact(record: Any) -> str:
+    return json.dumps(
+        record, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    )
+
+
+def _null_non_finite(value: Any) -> Any:
+    """Return ``value`` with NaN and infinite floats replaced by ``None``."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _null_non_finite(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_null_non_finite(item) for item in value]
+    return value
 
 
 def load_events(path: str | Path) -> list[dict[str, Any]]:
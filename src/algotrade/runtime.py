@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from collections import Counter
-from dataclasses import replace
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache, partial
 from pathlib import Path
-from time import perf_counter, sleep
+from time import monotonic, perf_counter, sleep
 from typing import Any
 from uuid import uuid4
 
+import numpy as np
+
 from algotrade.brokers.alpaca_paper import AlpacaPaperBroker
 from algotrade.brokers.backtest_broker import BacktestBroker
 from algotrade.brokers.base import Broker
@@ -17,43 +22,59 @@ from algotrade.data.alpaca_market_data import AlpacaMarketDataProvider
 from algotrade.data.base import MarketDataProvider
 from algotrade.data.csv_data import CsvDataProvider
 from algotrade.data.yfinance_data import YFinanceDataProvider
-from algotrade.domain.events import TradeEvent
+from algotrade.domain.events import TradeEvent, event_timestamp
 from algotrade.domain.models import (
     OrderRequest,
     OrderSide,
     PortfolioSnapshot,
     Position,
+    PositionArrays,
     RiskLimits,
 )
-from algotrade.execution.engine import apply_risk_gates, compute_orders
-from algotrade.logging.event_sink import JsonlEventSink, generate_plotly_report
+from algotrade.execution.engine import apply_risk_gates, compute_orders, held_qty
+from algotrade.execution.sizing import bounded_notional_quantities
+from algotrade.logging.event_sink import (
+    AsyncJsonlEventSink,
+    JsonlEventSink,
+    generate_plotly_report,
+)
 from algotrade.logging.logger import HumanLogger
 from algotrade.state.sqlite_store import SqliteStateStore
 from algotrade.state.store import OrderIntentRecord, StateStore
 from algotrade.strategy_core.base import Strategy
 from algotrade.strategy_core.registry import create_strategy
 
+_LOOKBACK_FIELDS = ("lookback_bars", "slow_ema_period", "rsi_period")
+_BROKER_STATUS_MAP = {
+    "filled": "filled_reconciled",
+    "partially_filled": "filled_reconciled",
+    "canceled": "closed_reconciled",
+    "cancelled": "closed_reconciled",
+    "rejected": "closed_reconciled",
+    "expired": "closed_reconciled",
+}
+_SIDE_VALUE = {side: side.value for side in OrderSide}
+
 
 class NoopStateStore:
     """No-op state store for backtest mode."""
 
     def record_run(self, run_id: str, mode: str, strategy_id: str, symbols: list[str]) -> None:
-        _ = (run_id, mode, strategy_id, symbols)
+        return None
 
     def save_intended_order(self, run_id: str, request: OrderRequest) -> None:
-        _ = (run_id, request)
+        return None
 
     def mark_submitted(self, client_order_id: str, broker_order_id: str, status: str) -> None:
-        _ = (client_order_id, broker_order_id, status)
+        return None
 
     def mark_reconciled(self, client_order_id: str, status: str) -> None:
-        _ = (client_order_id, status)
+        return None
 
     def list_active_intents(self) -> list[OrderIntentRecord]:
         return []
 
     def has_active_intent(self, symbol: str, side: str, qty: float) -> bool:
-        _ = (symbol, side, qty)
         return False
 
     def close(self) -> None:
@@ -249,38 +270,33 @@ def run(settings: Settings) -> int:
     events_path = run_directory / "events.jsonl"
     report_path = run_directory / "report.html"
 
-    event_sink = JsonlEventSink(str(events_path))
     human_logger = HumanLogger(level=settings.log_level)
-
-    state_store.record_run(run_id, settings.mode, strategy.strategy_id, settings.symbols)
-    human_logger.run_started(run_id, settings.mode, strategy.strategy_id, settings.symbols)
-    event_sink.emit(
-        TradeEvent(
-            run_id=run_id,
-            mode=settings.mode,
-            strategy_id=strategy.strategy_id,
-            event_type="run_started",
-            payload={"symbols": settings.symbols},
-        )
+    make_event = partial(
+        TradeEvent, run_id=run_id, mode=settings.mode, strategy_id=strategy.strategy_id
     )
-
-    if settings.mode == "live":
-        reconcile_state(
-            state_store=state_store,
-            broker=broker,
-            event_sink=event_sink,
-            human_logger=human_logger,
-            run_id=run_id,
-            settings=settings,
-        )
-
     run_metrics: dict[str, float | None] = {
         "start_equity": None,
         "previous_equity": None,
     }
 
     exit_code = 0
+    # Opened right before the try so every exit path drains and closes the writer thread.
+    event_sink = AsyncJsonlEventSink(str(events_path))
     try:
+        state_store.record_run(run_id, settings.mode, strategy.strategy_id, settings.symbols)
+        human_logger.run_started(run_id, settings.mode, strategy.strategy_id, settings.symbols)
+        event_sink.emit(make_event(event_type="run_started", payload={"symbols": settings.symbols}))
+
+        if settings.mode == "live":
+            reconcile_state(
+                state_store=state_store,
+                broker=broker,
+                event_sink=event_sink,
+                human_logger=human_logger,
+                run_id=run_id,
+                settings=settings,
+            )
+
         if settings.mode == "backtest":
             total_steps = resolve_backtest_total_steps(settings, data_provider)
             progress_interval = resolve_backtest_progress_interval(total_steps)
@@ -319,6 +335,7 @@ def run(settings: Settings) -> int:
                     )
         else:
             pass_limit = settings.live_pass_limit()
+            scheduler = CycleScheduler(float(settings.interval_seconds))
             if pass_limit is None:
                 while True:
                     execute_cycle(
@@ -332,7 +349,7 @@ def run(settings: Settings) -> int:
                         human_logger=human_logger,
                         run_metrics=run_metrics,
                     )
-                    sleep(float(settings.interval_seconds))
+                    wait_for_next_cycle(event_sink, make_event, scheduler)
             else:
                 for index in range(pass_limit):
                     execute_cycle(
@@ -347,20 +364,12 @@ def run(settings: Settings) -> int:
                         run_metrics=run_metrics,
                     )
                     if index < pass_limit - 1:
-                        sleep(float(settings.interval_seconds))
+                        wait_for_next_cycle(event_sink, make_event, scheduler)
     except KeyboardInterrupt:
         exit_code = 0
     except Exception as exc:
         human_logger.error(str(exc))
-        event_sink.emit(
-            TradeEvent(
-                run_id=run_id,
-                mode=settings.mode,
-                strategy_id=strategy.strategy_id,
-                event_type="error",
-                payload={"message": str(exc)},
-            )
-        )
+        event_sink.emit(make_event(event_type="error", payload={"message": str(exc)}))
         exit_code = 1
     finally:
         try:
@@ -379,9 +388,27 @@ def run(settings: Settings) -> int:
                 )
             except Exception:
                 pass
-            generate_plotly_report(str(events_path), str(report_path))
+            # The report reads the events file, so drain the background writer first.
+            try:
+                event_sink.close()
+            except Exception as exc:
+                human_logger.error(f"event sink close failed: {exc}")
+                exit_code = 1
+            report_future = None
+            if settings.emit_report:
+                # Render the report off the main thread so state teardown overlaps with it.
+                report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report")
+                report_future = report_executor.submit(
+                    generate_plotly_report, str(events_path), str(report_path)
+                )
+                report_executor.shutdown(wait=False)
         finally:
             state_store.close()
+            close_data_provider = getattr(data_provider, "close", None)
+            if callable(close_data_provider):
+                close_data_provider()
+        if report_future is not None and settings.report_blocking:
+            report_future.result()
 
     return exit_code
 
@@ -407,6 +434,57 @@ def build_liquidation_orders(
     return orders
 
 
+class CycleScheduler:
+    """Pace live cycles on fixed monotonic deadlines instead of sleeping after each cycle.
+
+    Sleeping a full interval after every cycle shifts the schedule by the cycle duration each
+    time. Deadlines are anchored to the first cycle start, so cycle duration does not accumulate;
+    when a cycle overruns one or more intervals the missed slots are skipped rather than replayed.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        clock: Callable[[], float] = monotonic,
+        sleeper: Callable[[float], None] = sleep,
+    ) -> None:
+        self.interval_seconds = interval_seconds
+        self._clock = clock
+        self._sleeper = sleeper
+        self._next_deadline = clock() + interval_seconds
+
+    def wait(self) -> float:
+        """Sleep until the next deadline and return how late the wake-up was, in milliseconds."""
+        now = self._clock()
+        if now >= self._next_deadline and self.interval_seconds > 0:
+            missed = int((now - self._next_deadline) // self.interval_seconds) + 1
+            self._next_deadline += missed * self.interval_seconds
+        remaining = self._next_deadline - now
+        if remaining > 0:
+            self._sleeper(remaining)
+        deadline = self._next_deadline
+        self._next_deadline = deadline + self.interval_seconds
+        return max(0.0, (self._clock() - deadline) * 1000.0)
+
+
+def wait_for_next_cycle(
+    event_sink: JsonlEventSink,
+    make_event: Callable[..., TradeEvent],
+    scheduler: CycleScheduler,
+) -> None:
+    """Wait for the next live cycle and record how far it started behind its deadline."""
+    drift_ms = scheduler.wait()
+    event_sink.emit(
+        make_event(
+            event_type="cycle_timing",
+            payload={
+                "cycle_drift_ms": round(drift_ms, 3),
+                "interval_seconds": scheduler.interval_seconds,
+            },
+        )
+    )
+
+
 def execute_cycle(
     settings: Settings,
     strategy: Strategy,
@@ -425,7 +503,44 @@ def execute_cycle(
             "previous_equity": None,
         }
 
-    if settings.mode == "live":
+    # Cycle events are buffered and written in batches; the finally block makes sure
+    # whatever was collected still reaches disk when the cycle raises.
+    pending_events: list[TradeEvent] = []
+    try:
+        _execute_cycle(
+            settings=settings,
+            strategy=strategy,
+            data_provider=data_provider,
+            broker=broker,
+            state_store=state_store,
+            run_id=run_id,
+            event_sink=event_sink,
+            human_logger=human_logger,
+            run_metrics=run_metrics,
+            pending_events=pending_events,
+        )
+    finally:
+        event_sink.emit_many(pending_events)
+
+
+def _execute_cycle(
+    settings: Settings,
+    strategy: Strategy,
+    data_provider: MarketDataProvider,
+    broker: Broker,
+    state_store: StateStore,
+    run_id: str,
+    event_sink: JsonlEventSink,
+    human_logger: HumanLogger,
+    run_metrics: dict[str, float | None],
+    pending_events: list[TradeEvent],
+) -> None:
+    mode = settings.mode
+    strategy_id = strategy.strategy_id
+    is_scalping = strategy_id == "scalping"
+    make_event = partial(TradeEvent, run_id=run_id, mode=mode, strategy_id=strategy_id)
+    include_details = mode == "backtest" or is_scalping
+    if mode == "live":
         reconcile_state(
             state_store=state_store,
             broker=broker,
@@ -435,13 +550,17 @@ def execute_cycle(
             settings=settings,
         )
 
-    positions = broker.get_positions()
-    bars_by_symbol = build_bars_by_symbol(settings.symbols, data_provider)
+    # Backtests always fetch serially so walk-forward providers stay deterministic.
+    fetch_workers = settings.parallel_fetch_workers if mode == "live" else 1
+    bars_by_symbol = build_bars_by_symbol(
+        symbols_in_order(tuple(settings.symbols)), data_provider, fetch_workers
+    )
     latest_prices = build_latest_prices(bars_by_symbol)
-    if settings.mode == "backtest" and isinstance(broker, BacktestBroker):
+    if mode == "backtest" and isinstance(broker, BacktestBroker):
         broker.update_market_prices(latest_prices)
     portfolio = broker.get_portfolio()
-    positions = broker.get_positions()
+    # The snapshot already carries positions; a second broker read would cost a round trip.
+    positions = portfolio.positions
     pnl_metrics = compute_equity_metrics(run_metrics, float(portfolio.equity))
     signal_targets = strategy.decide_targets(bars_by_symbol, portfolio)
     targets = resolve_target_quantities(
@@ -451,12 +570,15 @@ def execute_cycle(
         strategy=strategy,
         portfolio_snapshot=portfolio,
     )
+    sorted_targets = in_symbol_order(targets)
     decision_details: dict[str, dict[str, Any]] = {}
-    include_details = settings.mode == "backtest" or strategy.strategy_id == "scalping"
     lookback_bars = strategy_diagnostic_lookback_bars(strategy)
+    scalping_details = _scalping_param_details(strategy) if is_scalping else None
+    # One clock read per cycle: every decision event shares the time targets were decided.
+    decided_at = event_timestamp()
 
-    for symbol, target in sorted(targets.items()):
-        current_qty = positions.get(symbol, Position(symbol=symbol, qty=0)).qty
+    for symbol, target in sorted_targets.items():
+        current_qty = held_qty(positions, symbol)
         target_signal = float(signal_targets.get(symbol, 0.0))
         payload: dict[str, Any] = {
             "symbol": symbol,
@@ -472,34 +594,14 @@ def execute_cycle(
                 current_qty=current_qty,
             )
             details["target_signal"] = target_signal
-            if strategy.strategy_id == "scalping":
-                params = getattr(strategy, "params", None)
-                fast_ema_period = getattr(params, "fast_ema_period", None)
-                slow_ema_period = getattr(params, "slow_ema_period", None)
-                rsi_period = getattr(params, "rsi_period", None)
-                allow_short = getattr(params, "allow_short", None)
-                if fast_ema_period is not None:
-                    details["scalping_fast_ema_period"] = int(fast_ema_period)
-                if slow_ema_period is not None:
-                    details["scalping_slow_ema_period"] = int(slow_ema_period)
-                if rsi_period is not None:
-                    details["scalping_rsi_period"] = int(rsi_period)
-                if allow_short is not None:
-                    details["scalping_allow_short"] = bool(allow_short)
+            if scalping_details:
+                details.update(scalping_details)
             decision_details[symbol] = details
             human_logger.decision(symbol, target, current_qty, details=details)
             payload.update(details)
         else:
             human_logger.decision(symbol, target, current_qty)
-        event_sink.emit(
-            TradeEvent(
-                run_id=run_id,
-                mode=settings.mode,
-                strategy_id=strategy.strategy_id,
-                event_type="decision",
-                payload=payload,
-            )
-        )
+        pending_events.append(make_event(event_type="decision", payload=payload, ts=decided_at))
 
     raw_orders = compute_orders(
         current_positions=positions,
@@ -542,28 +644,23 @@ def execute_cycle(
             status=f"blocked_{blocked['reason']}",
             client_order_id=f"{blocked['symbol']}:{blocked['side']}:{blocked['qty']}",
         )
-        event_sink.emit(
-            TradeEvent(
-                run_id=run_id,
-                mode=settings.mode,
-                strategy_id=strategy.strategy_id,
-                event_type="order_update",
-                payload=blocked_payload,
-            )
-        )
+        pending_events.append(make_event(event_type="order_update", payload=blocked_payload))
 
-    prepared_orders, duplicate_blocked = prepare_orders(
-        orders=orders,
-        run_id=run_id,
-        state_store=state_store,
-        event_sink=event_sink,
-        human_logger=human_logger,
-        settings=settings,
-        strategy=strategy,
-        reference_prices=latest_prices,
-    )
+    # Intents are committed together, and always before the broker sees the orders.
+    with state_transaction(state_store):
+        prepared_orders, duplicate_blocked = prepare_orders(
+            orders=orders,
+            run_id=run_id,
+            state_store=state_store,
+            event_sink=event_sink,
+            human_logger=human_logger,
+            settings=settings,
+            strategy=strategy,
+            reference_prices=latest_prices,
+            pending_events=pending_events,
+        )
     human_logger.cycle_summary(
-        strategy_id=strategy.strategy_id,
+        strategy_id=strategy_id,
         raw_orders=len(raw_orders),
         risk_orders=len(orders),
         prepared_orders=len(prepared_orders),
@@ -572,14 +669,15 @@ def execute_cycle(
         details=pnl_metrics,
     )
 
+    positions_payload = serialize_positions(positions)
     pre_submit_payload: dict[str, Any] = {
         "stage": "pre_submit",
-        "portfolio": serialize_portfolio(portfolio),
+        "portfolio": serialize_portfolio(portfolio, positions_payload=positions_payload),
         "pnl": pnl_metrics,
         "latest_prices": latest_prices,
-        "target_signals": dict(sorted(signal_targets.items())),
-        "positions": serialize_positions(positions),
-        "targets": dict(sorted(targets.items())),
+        "target_signals": in_symbol_order(signal_targets, copy=True),
+        "positions": positions_payload,
+        "targets": sorted_targets,
         "raw_orders": serialize_orders(raw_orders),
         "risk_orders": serialize_orders(orders),
         "prepared_orders": serialize_orders(prepared_orders),
@@ -592,41 +690,37 @@ def execute_cycle(
     if decision_details:
         pre_submit_payload["decisions"] = decision_details
 
-    event_sink.emit(
-        TradeEvent(
-            run_id=run_id,
-            mode=settings.mode,
-            strategy_id=strategy.strategy_id,
-            event_type="cycle_summary",
-            payload=pre_submit_payload,
-        )
-    )
+    pending_events.append(make_event(event_type="cycle_summary", payload=pre_submit_payload))
 
     if not prepared_orders:
-        event_sink.emit(
-            TradeEvent(
-                run_id=run_id,
-                mode=settings.mode,
-                strategy_id=strategy.strategy_id,
+        if mode == "backtest" and isinstance(broker, BacktestBroker):
+            # Nothing was submitted, so the simulated book still matches the pre-trade snapshot.
+            positions_after = positions_payload
+            portfolio_after_payload = pre_submit_payload["portfolio"]
+        else:
+            portfolio_after = broker.get_portfolio()
+            positions_after = serialize_positions(portfolio_after.positions)
+            portfolio_after_payload = serialize_portfolio(portfolio_after, positions_after)
+        pending_events.append(
+            make_event(
                 event_type="cycle_summary",
                 payload={
                     "stage": "post_submit",
                     "submitted_order_count": 0,
-                    "positions_after": serialize_positions(broker.get_positions()),
-                    "portfolio_after": serialize_portfolio(broker.get_portfolio()),
+                    "positions_after": positions_after,
+                    "portfolio_after": portfolio_after_payload,
                 },
             )
         )
         return
 
+    # Persist decisions and submit intents before the broker round trip.
+    event_sink.emit_many(pending_events)
+    pending_events.clear()
+    if mode == "live":
+        event_sink.flush()
     receipts = broker.submit_orders(prepared_orders)
     for receipt in receipts:
-        if receipt.client_order_id:
-            state_store.mark_submitted(
-                client_order_id=receipt.client_order_id,
-                broker_order_id=receipt.order_id,
-                status=receipt.status,
-            )
         price_details = extract_receipt_price_details(receipt)
         human_logger.order_update(
             receipt.order_id,
@@ -643,32 +737,55 @@ def execute_cycle(
             "status": receipt.status,
         }
         payload.update(price_details)
-        event_sink.emit(
-            TradeEvent(
-                run_id=run_id,
-                mode=settings.mode,
-                strategy_id=strategy.strategy_id,
-                event_type="order_update",
-                payload=payload,
-            )
-        )
-    event_sink.emit(
-        TradeEvent(
-            run_id=run_id,
-            mode=settings.mode,
-            strategy_id=strategy.strategy_id,
+        pending_events.append(make_event(event_type="order_update", payload=payload))
+    if mode == "live":
+        # Receipts are durable in the event log before the state store records them.
+        event_sink.emit_many(pending_events)
+        pending_events.clear()
+        event_sink.flush()
+    with state_transaction(state_store):
+        for receipt in receipts:
+            if receipt.client_order_id:
+                state_store.mark_submitted(
+                    client_order_id=receipt.client_order_id,
+                    broker_order_id=receipt.order_id,
+                    status=receipt.status,
+                )
+    portfolio_after = broker.get_portfolio()
+    positions_after = serialize_positions(portfolio_after.positions)
+    pending_events.append(
+        make_event(
             event_type="cycle_summary",
             payload={
                 "stage": "post_submit",
                 "submitted_order_count": len(receipts),
                 "receipts": serialize_receipts(receipts),
-                "positions_after": serialize_positions(broker.get_positions()),
-                "portfolio_after": serialize_portfolio(broker.get_portfolio()),
+                "positions_after": positions_after,
+                "portfolio_after": serialize_portfolio(portfolio_after, positions_after),
             },
         )
     )
 
 
+def _scalping_param_details(strategy: Strategy) -> dict[str, Any]:
+    """Collect scalping parameter diagnostics attached to every decision."""
+    params = getattr(strategy, "params", None)
+    fast_ema_period = getattr(params, "fast_ema_period", None)
+    slow_ema_period = getattr(params, "slow_ema_period", None)
+    rsi_period = getattr(params, "rsi_period", None)
+    allow_short = getattr(params, "allow_short", None)
+    details: dict[str, Any] = {}
+    if fast_ema_period is not None:
+        details["scalping_fast_ema_period"] = int(fast_ema_period)
+    if slow_ema_period is not None:
+        details["scalping_slow_ema_period"] = int(slow_ema_period)
+    if rsi_period is not None:
+        details["scalping_rsi_period"] = int(rsi_period)
+    if allow_short is not None:
+        details["scalping_allow_short"] = bool(allow_short)
+    return details
+
+
 def prepare_orders(
     orders: list[OrderRequest],
     run_id: str,
@@ -678,12 +795,33 @@ def prepare_orders(
     settings: Settings,
     strategy: Strategy,
     reference_prices: dict[str, float] | None = None,
+    pending_events: list[TradeEvent] | None = None,
 ) -> tuple[list[OrderRequest], list[dict[str, Any]]]:
-    """Attach client ids and persist intent before submission."""
+    """Attach client ids and persist intent before submission.
+
+    When ``pending_events`` is given, events are appended to it for a later batched
+    write instead of being emitted one by one.
+    """
+    emit = event_sink.emit if pending_events is None else pending_events.append
+    mode = settings.mode
+    strategy_id = strategy.strategy_id
+    make_event = partial(TradeEvent, run_id=run_id, mode=mode, strategy_id=strategy_id)
     prepared: list[OrderRequest] = []
     duplicate_blocked: list[dict[str, Any]] = []
+    refresh_active_cache = getattr(state_store, "refresh_active_cache", None)
+    if orders and callable(refresh_active_cache):
+        # One query per cycle; duplicate checks below are then in-memory lookups.
+        refresh_active_cache()
+    save_intended_orders = getattr(state_store, "save_intended_orders", None)
+    batch_save = callable(save_intended_orders)
+    # Intents saved in one batch after the loop are not yet visible to has_active_intent,
+    # so repeats within this call are caught against the keys prepared so far.
+    batch_keys: set[tuple[str, str, float]] = set()
     for index, order in enumerate(orders):
-        if state_store.has_active_intent(order.symbol, order.side.value, order.qty):
+        batch_key = (order.symbol_key, order.side.value, round(order.qty, 8))
+        if batch_key in batch_keys or state_store.has_active_intent(
+            order.symbol, order.side.value, order.qty
+        ):
             blocked_payload = {
                 "symbol": order.symbol,
                 "side": order.side.value,
@@ -696,20 +834,15 @@ def prepare_orders(
                 status="duplicate_blocked",
                 client_order_id=f"{order.symbol}:{order.side.value}:{order.qty}",
             )
-            event_sink.emit(
-                TradeEvent(
-                    run_id=run_id,
-                    mode=settings.mode,
-                    strategy_id=strategy.strategy_id,
-                    event_type="order_update",
-                    payload=blocked_payload,
-                )
-            )
+            emit(make_event(event_type="order_update", payload=blocked_payload))
             duplicate_blocked.append(blocked_payload)
             continue
         client_order_id = build_client_order_id(run_id, index, order.symbol)
-        order_with_id = replace(order, client_order_id=client_order_id)
-        state_store.save_intended_order(run_id, order_with_id)
+        order_with_id = order.with_client_order_id(client_order_id)
+        if batch_save:
+            batch_keys.add(batch_key)
+        else:
+            state_store.save_intended_order(run_id, order_with_id)
         reference_price = None
         if reference_prices is not None:
             reference_price = reference_prices.get(order.symbol)
@@ -732,22 +865,23 @@ def prepare_orders(
             "client_order_id": order_with_id.client_order_id,
         }
         payload.update(submit_details)
-        event_sink.emit(
-            TradeEvent(
-                run_id=run_id,
-                mode=settings.mode,
-                strategy_id=strategy.strategy_id,
-                event_type="order_submit",
-                payload=payload,
-            )
-        )
+        emit(make_event(event_type="order_submit", payload=payload))
         prepared.append(order_with_id)
+    if batch_save and prepared:
+        save_intended_orders(run_id, prepared)
     return prepared, duplicate_blocked
 
 
 def build_client_order_id(run_id: str, index: int, symbol: str) -> str:
     """Generate unique client order id to satisfy broker uniqueness requirements."""
-    return f"{run_id[:10]}-{symbol.upper()}-{index}-{uuid4().hex[:8]}"
+    # Eight random hex chars, same as uuid4().hex[:8] without building a UUID.
+    return f"{_client_order_id_prefix(run_id, symbol)}{index}-{os.urandom(4).hex()}"
+
+
+@lru_cache(maxsize=1024)
+def _client_order_id_prefix(run_id: str, symbol: str) -> str:
+    """Run and symbol part of a client order id; stable for the whole run."""
+    return f"{run_id[:10]}-{symbol.upper()}-"
 
 
 def summarize_decision_details(
@@ -767,13 +901,12 @@ def summarize_decision_details(
     except TypeError:
         return details
     details["bars"] = bar_count
-    if bar_count <= 0 or not hasattr(bars, "columns"):
-        return details
-    if "close" not in bars.columns:
+    columns = getattr(bars, "columns", None)
+    if bar_count <= 0 or columns is None or "close" not in columns:
         return details
 
-    close = bars["close"]
-    latest_close = float(close.iloc[-1])
+    close = bars["close"].to_numpy(dtype=np.float64, copy=False)
+    latest_close = float(close[-1])
     details["close"] = round(latest_close, 6)
 
     index = getattr(bars, "index", None)
@@ -783,16 +916,16 @@ def summarize_decision_details(
             last_index.isoformat() if hasattr(last_index, "isoformat") else str(last_index)
         )
 
-    if "volume" in bars.columns:
-        details["volume"] = float(bars["volume"].iloc[-1])
+    if "volume" in columns:
+        details["volume"] = float(bars["volume"].to_numpy(copy=False)[-1])
 
     if bar_count > 1:
-        previous_close = float(close.iloc[-2])
+        previous_close = float(close[-2])
         if previous_close != 0:
             details["ret_1"] = round((latest_close - previous_close) / previous_close, 6)
 
     if lookback_bars > 0 and bar_count > lookback_bars:
-        reference_close = float(close.iloc[-1 - lookback_bars])
+        reference_close = float(close[-1 - lookback_bars])
         if reference_close != 0:
             details["ret_lb"] = round((latest_close - reference_close) / reference_close, 6)
 
@@ -828,16 +961,17 @@ def compute_equity_metrics(
 
 def build_latest_prices(bars_by_symbol: dict[str, Any]) -> dict[str, float]:
     """Build latest close price map for reference pricing diagnostics."""
-    latest_prices: dict[str, float] = {}
-    for symbol, bars in sorted(bars_by_symbol.items()):
-        if not hasattr(bars, "columns"):
-            continue
-        if "close" not in bars.columns:
-            continue
-        if len(bars) == 0:
-            continue
-        latest_prices[symbol] = round(float(bars["close"].iloc[-1]), 6)
-    return latest_prices
+    symbols = [
+        symbol
+        for symbol, bars in sorted(bars_by_symbol.items())
+        if "close" in getattr(bars, "columns", ()) and len(bars) > 0
+    ]
+    closes = np.fromiter(
+        (bars_by_symbol[symbol]["close"].to_numpy(copy=False)[-1] for symbol in symbols),
+        dtype=np.float64,
+        count=len(symbols),
+    )
+    return dict(zip(symbols, np.round(closes, 6).tolist(), strict=True))
 
 
 def resolve_target_quantities(
@@ -848,46 +982,47 @@ def resolve_target_quantities(
     portfolio_snapshot: PortfolioSnapshot | None = None,
 ) -> dict[str, float]:
     """Convert strategy targets into broker-facing position quantities."""
-    resolved: dict[str, float] = {}
+    symbols = sorted(signal_targets)
+    if not symbols:
+        return {}
+    count = len(symbols)
+    signals = np.fromiter(
+        (float(signal_targets[symbol]) for symbol in symbols),
+        dtype=np.float64,
+        count=count,
+    )
     sizing_method = settings.order_sizing_method.strip().lower()
-    strategy_trade_bounds = strategy_trade_size_bounds(strategy)
-    strategy_signal_cap = strategy_signal_scale(strategy)
-    equity = _resolve_equity(portfolio_snapshot)
-    for symbol, signal in sorted(signal_targets.items()):
-        signal_value = float(signal)
-        target_qty: float
-        if sizing_method == "notional":
-            if signal_value == 0:
-                target_qty = 0.0
-            elif strategy_trade_bounds is not None and equity is not None:
-                price = latest_prices.get(symbol)
-                if price is None or price <= 0:
-                    target_qty = 0.0
-                else:
-                    min_fraction, max_fraction = strategy_trade_bounds
-                    signal_strength = _signal_strength(
-                        signal_value=signal_value,
-                        signal_cap=strategy_signal_cap,
-                    )
-                    target_fraction = min_fraction + (
-                        (max_fraction - min_fraction) * signal_strength
-                    )
-                    target_notional = equity * target_fraction
-                    target_qty = (target_notional / price) * (1 if signal_value > 0 else -1)
-            else:
-                price = latest_prices.get(symbol)
-                if price is None or price <= 0:
-                    target_qty = 0.0
-                else:
-                    target_qty = (signal_value * settings.order_notional_usd) / price
+    if sizing_method == "notional":
+        prices = np.fromiter(
+            (latest_prices.get(symbol, 0.0) for symbol in symbols),
+            dtype=np.float64,
+            count=count,
+        )
+        strategy_trade_bounds = strategy_trade_size_bounds(strategy)
+        equity = _resolve_equity(portfolio_snapshot)
+        if strategy_trade_bounds is not None and equity is not None:
+            min_fraction, max_fraction = strategy_trade_bounds
+            target_qty = bounded_notional_quantities(
+                signals,
+                prices,
+                equity=equity,
+                min_fraction=min_fraction,
+                max_fraction=max_fraction,
+                signal_cap=strategy_signal_scale(strategy),
+            )
         else:
-            target_qty = signal_value
+            tradable = (prices > 0) & (signals != 0)
+            safe_prices = np.where(tradable, prices, 1.0)
+            target_qty = np.where(
+                tradable, (signals * settings.order_notional_usd) / safe_prices, 0.0
+            )
+    else:
+        target_qty = signals
 
-        rounded_target = _round_qty(target_qty, settings.qty_precision)
-        if abs(rounded_target) < settings.min_trade_qty:
-            rounded_target = 0.0
-        resolved[symbol] = rounded_target
-    return resolved
+    rounded = np.round(target_qty, max(0, int(settings.qty_precision)))
+    min_qty = max(float(settings.min_trade_qty), 1e-9)
+    rounded = np.where(np.abs(rounded) < min_qty, 0.0, rounded)
+    return dict(zip(symbols, rounded.tolist(), strict=True))
 
 
 def extract_receipt_price_details(receipt: Any) -> dict[str, Any]:
@@ -918,49 +1053,65 @@ def _parse_optional_float(value: Any) -> float | None:
     """Parse optional numeric field from mixed broker payload values."""
     if value is None:
         return None
-    if isinstance(value, (int, float)):
+    if isinstance(value, str):
+        return _parse_float_text(value)
+    try:
         return float(value)
-    text = str(value).strip()
-    if not text or text.lower() in {"none", "null"}:
+    except (TypeError, ValueError):
         return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_float_text(text: str) -> float | None:
+    # float() accepts padded numeric strings directly; blanks and "none"/"null"
+    # markers fail conversion and fall through to None. Broker payloads repeat these
+    # strings heavily, so the raise-and-catch path is cached.
     try:
         return float(text)
     except ValueError:
         return None
 
 
-def _round_qty(value: float, precision: int) -> float:
-    rounded = round(float(value), max(0, int(precision)))
-    if abs(rounded) < 1e-9:
-        return 0.0
-    return rounded
-
-
-def _qty_key(value: float, precision: int = 8) -> str:
-    return f"{_round_qty(value, precision):.{max(0, precision)}f}"
+def _qty_ticks(value: float) -> int:
+    """Quantize a quantity to integer 1e-8 ticks for hashing and equality checks."""
+    return int(round(float(value) * 100_000_000.0))
 
 
 def serialize_positions(positions: dict[str, Position]) -> dict[str, float]:
     """Convert position objects into a deterministic, JSON-friendly mapping."""
-    return {symbol: _round_qty(position.qty, 8) for symbol, position in sorted(positions.items())}
+    if not positions:
+        return {}
+    arrays = PositionArrays.from_positions(positions)
+    rounded = np.round(arrays.qty, 8)
+    rounded[np.abs(rounded) < 1e-9] = 0.0
+    return dict(zip(arrays.symbols, rounded.tolist(), strict=True))
 
 
-def serialize_portfolio(portfolio: Any) -> dict[str, Any]:
-    """Convert a portfolio snapshot into a stable event payload."""
+def serialize_portfolio(
+    portfolio: Any,
+    positions_payload: dict[str, float] | None = None,
+) -> dict[str, Any]:
+    """Convert a portfolio snapshot into a stable event payload.
+
+    ``positions_payload`` lets callers reuse positions they already serialized.
+    """
+    if positions_payload is None:
+        positions_payload = serialize_positions(getattr(portfolio, "positions", {}))
     return {
         "cash": round(float(portfolio.cash), 4),
         "equity": round(float(portfolio.equity), 4),
         "buying_power": round(float(portfolio.buying_power), 4),
-        "positions": serialize_positions(getattr(portfolio, "positions", {})),
+        "positions": positions_payload,
     }
 
 
 def serialize_orders(orders: list[OrderRequest]) -> list[dict[str, Any]]:
     """Convert order requests into structured event payloads."""
+    side_value = _SIDE_VALUE
     return [
         {
             "symbol": order.symbol,
-            "side": order.side.value,
+            "side": side_value[order.side],
             "qty": order.qty,
             "order_type": order.order_type,
             "time_in_force": order.time_in_force,
@@ -972,11 +1123,12 @@ def serialize_orders(orders: list[OrderRequest]) -> list[dict[str, Any]]:
 
 def serialize_receipts(receipts: list[Any]) -> list[dict[str, Any]]:
     """Convert broker receipts into structured event payloads."""
+    side_value = _SIDE_VALUE
     return [
         {
             "order_id": receipt.order_id,
             "symbol": receipt.symbol,
-            "side": receipt.side.value,
+            "side": side_value[receipt.side],
             "qty": receipt.qty,
             "status": receipt.status,
             "client_order_id": receipt.client_order_id,
@@ -995,7 +1147,7 @@ def resolve_non_shortable_symbols(settings: Settings, orders: list[OrderRequest]
 
     blocked_symbols: set[str] = set()
     for order in orders:
-        symbol = str(order.symbol).strip().upper()
+        symbol = order.symbol_key
         if not symbol:
             continue
         if AlpacaPaperBroker._is_crypto_symbol(symbol):
@@ -1011,23 +1163,32 @@ def find_risk_blocked_orders(
     non_shortable_symbols: set[str] | None = None,
 ) -> list[dict[str, Any]]:
     """Compute which raw orders were removed by risk filters and why."""
+    # Risk gates only drop orders, so equal lengths mean nothing was filtered.
+    if len(raw_orders) == len(safe_orders):
+        return []
     blocked_short_symbols = {symbol.upper() for symbol in (non_shortable_symbols or set())}
-    safe_counts = Counter(_order_signature(order) for order in safe_orders)
+    safe_counts: dict[tuple[str, str, int, str, str], int] = {}
+    for order in safe_orders:
+        signature = _order_signature(order)
+        safe_counts[signature] = safe_counts.get(signature, 0) + 1
+    position_arrays = (
+        portfolio.position_arrays
+        if isinstance(portfolio, PortfolioSnapshot)
+        else PositionArrays.from_positions(portfolio.positions)
+    )
     blocked: list[dict[str, Any]] = []
 
     for order in raw_orders:
         signature = _order_signature(order)
-        if safe_counts[signature] > 0:
-            safe_counts[signature] -= 1
+        remaining = safe_counts.get(signature, 0)
+        if remaining:
+            safe_counts[signature] = remaining - 1
             continue
 
-        current_qty = portfolio.positions.get(
-            order.symbol,
-            Position(symbol=order.symbol, qty=0),
-        ).qty
+        current_qty = position_arrays.qty_for(order.symbol)
         signed_delta = order.qty if order.side is OrderSide.BUY else -order.qty
         proposed_qty = current_qty + signed_delta
-        symbol_forbids_short = order.symbol.upper() in blocked_short_symbols
+        symbol_forbids_short = order.symbol_key in blocked_short_symbols
         if symbol_forbids_short and proposed_qty < 0:
             reason = "asset_not_shortable"
         elif not limits.allow_short and proposed_qty < 0:
@@ -1053,12 +1214,24 @@ def find_risk_blocked_orders(
     return blocked
 
 
-def _order_signature(order: OrderRequest) -> tuple[str, str, str, str, str]:
+def in_symbol_order(mapping: dict[str, Any], copy: bool = False) -> dict[str, Any]:
+    """Return ``mapping`` ordered by symbol, skipping the sort when keys are already ordered.
+
+    Targets are usually built in sorted symbol order, so the common case is a linear check.
+    Pass ``copy=True`` for caller-owned mappings that must not be aliased into event payloads.
+    """
+    keys = list(mapping)
+    if all(left <= right for left, right in zip(keys, keys[1:], strict=False)):
+        return dict(mapping) if copy else mapping
+    return {symbol: mapping[symbol] for symbol in sorted(keys)}
+
+
+def _order_signature(order: OrderRequest) -> tuple[str, str, int, str, str]:
     """Build a deterministic order signature for multiset comparisons."""
     return (
         order.symbol,
         order.side.value,
-        _qty_key(order.qty),
+        _qty_ticks(order.qty),
         order.order_type,
         order.time_in_force,
     )
@@ -1069,12 +1242,34 @@ def _is_fractional_position_qty(value: float, epsilon: float = 1e-9) -> bool:
     return abs(float(value) - float(rounded)) > epsilon
 
 
-def build_bars_by_symbol(symbols: list[str], data_provider: MarketDataProvider) -> dict[str, Any]:
-    """Fetch bar data for all symbols."""
-    bars_by_symbol: dict[str, Any] = {}
-    for symbol in symbols:
-        bars_by_symbol[symbol] = data_provider.get_bars(symbol)
-    return bars_by_symbol
+def build_bars_by_symbol(
+    symbols: Sequence[str],
+    data_provider: MarketDataProvider,
+    max_workers: int = 1,
+) -> dict[str, Any]:
+    """Fetch bar data for all symbols, optionally overlapping provider calls."""
+    workers = min(32, max_workers, len(symbols))
+    # Local CSV reads are CPU-bound parsing under the GIL; threads only add overhead.
+    if workers <= 1 or isinstance(data_provider, CsvDataProvider):
+        return {symbol: data_provider.get_bars(symbol) for symbol in symbols}
+    results = list(_bar_fetch_executor(workers).map(data_provider.get_bars, symbols))
+    return dict(zip(symbols, results, strict=True))
+
+
+@lru_cache(maxsize=8)
+def symbols_in_order(symbols: tuple[str, ...]) -> tuple[str, ...]:
+    """Return configured symbols in sorted order, computed once per symbol universe.
+
+    Bars are fetched in this order so every per-symbol mapping handed to strategies and
+    diagnostics is already symbol-ordered, which keeps their own ``sorted`` calls linear.
+    """
+    return tuple(sorted(symbols))
+
+
+@lru_cache(maxsize=4)
+def _bar_fetch_executor(workers: int) -> ThreadPoolExecutor:
+    """Return a long-lived fetch pool so live passes do not respawn threads every cycle."""
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bars")
 
 
 def resolve_backtest_total_steps(settings: Settings, data_provider: MarketDataProvider) -> int:
@@ -1118,36 +1313,57 @@ def reconcile_state(
     settings: Settings,
 ) -> None:
     """Reconcile unresolved intents on startup and avoid duplicate submissions."""
+    if settings.mode == "backtest":
+        return
     active_intents = state_store.list_active_intents()
     if not active_intents:
         return
 
     open_orders = broker.get_open_orders()
     open_client_ids = {order.client_order_id for order in open_orders if order.client_order_id}
-    positions = broker.get_positions()
-    get_order_status = getattr(broker, "get_order_status", None)
+    submitted = [intent for intent in active_intents if intent.broker_order_id]
+    created = [intent.created_ts for intent in submitted if intent.created_ts]
+    broker_statuses = fetch_broker_order_statuses(
+        broker,
+        [intent.broker_order_id for intent in submitted],
+        # Every order of interest was sent after its intent was saved.
+        after=min(created) if created and len(created) == len(submitted) else None,
+    )
+    intent_statuses = [
+        (intent, broker_statuses.get(intent.broker_order_id) if intent.broker_order_id else None)
+        for intent in active_intents
+    ]
+    # Positions are only a fallback signal, so skip the broker read when every intent is
+    # still open or already has a terminal broker status.
+    needs_positions = any(
+        intent.client_order_id not in open_client_ids
+        and (broker_status is None or broker_status not in _BROKER_STATUS_MAP)
+        for intent, broker_status in intent_statuses
+    )
+    positions = broker.get_positions() if needs_positions else {}
 
-    for intent in active_intents:
-        broker_status: str | None = None
-        if callable(get_order_status) and intent.broker_order_id:
-            try:
-                value = get_order_status(intent.broker_order_id)
-                if isinstance(value, str):
-                    broker_status = value.strip().lower() or None
-            except Exception:
-                broker_status = None
-        status = resolve_intent_status(
+    resolved = [
+        (
             intent,
-            open_client_ids,
-            positions,
-            broker_status=broker_status,
+            resolve_intent_status(intent, open_client_ids, positions, broker_status=broker_status),
         )
-        state_store.mark_reconciled(intent.client_order_id, status)
-        event_sink.emit(
-            TradeEvent(
-                run_id=run_id,
-                mode=settings.mode,
-                strategy_id=settings.strategy,
+        for intent, broker_status in intent_statuses
+    ]
+    updates = [(intent.client_order_id, status) for intent, status in resolved]
+    mark_reconciled_many = getattr(state_store, "mark_reconciled_many", None)
+    if callable(mark_reconciled_many):
+        mark_reconciled_many(updates)
+    else:
+        with state_transaction(state_store):
+            for client_order_id, status in updates:
+                state_store.mark_reconciled(client_order_id, status)
+
+    make_event = partial(
+        TradeEvent, run_id=run_id, mode=settings.mode, strategy_id=settings.strategy
+    )
+    event_sink.emit_many(
+        [
+            make_event(
                 event_type="order_update",
                 payload={
                     "client_order_id": intent.client_order_id,
@@ -1157,7 +1373,10 @@ def reconcile_state(
                     "status": status,
                 },
             )
-        )
+            for intent, status in resolved
+        ]
+    )
+    for intent, status in resolved:
         human_logger.order_update(
             order_id="reconcile",
             status=status,
@@ -1165,6 +1384,48 @@ def reconcile_state(
         )
 
 
+def state_transaction(state_store: StateStore) -> AbstractContextManager[Any]:
+    """Group state writes when the store supports transactions; otherwise a no-op context."""
+    transaction = getattr(state_store, "transaction", None)
+    if callable(transaction):
+        return transaction()
+    return nullcontext()
+
+
+def fetch_broker_order_statuses(
+    broker: Broker, order_ids: list[str], after: str | None = None
+) -> dict[str, str]:
+    """Resolve normalized broker statuses, preferring a single bulk lookup when supported.
+
+    Ids the bulk lookup leaves out, or every id when it fails, fall back to per-id calls.
+    ``after`` bounds the bulk lookup to orders submitted after that timestamp.
+    """
+    if not order_ids:
+        return {}
+    raw_statuses: dict[str, Any] = {}
+    get_order_statuses = getattr(broker, "get_order_statuses", None)
+    get_order_status = getattr(broker, "get_order_status", None)
+    if callable(get_order_statuses):
+        try:
+            raw_statuses = dict(get_order_statuses(order_ids, after=after))
+        except Exception:
+            raw_statuses = {}
+    if callable(get_order_status):
+        for order_id in order_ids:
+            if order_id in raw_statuses:
+                continue
+            try:
+                raw_statuses[order_id] = get_order_status(order_id)
+            except Exception:
+                continue
+
+    statuses: dict[str, str] = {}
+    for order_id, value in raw_statuses.items():
+        if isinstance(value, str) and value.strip():
+            statuses[order_id] = value.strip().lower()
+    return statuses
+
+
 def resolve_intent_status(
     intent: OrderIntentRecord,
     open_client_ids: set[str],
@@ -1175,11 +1436,10 @@ def resolve_intent_status(
     epsilon = 1e-6
     if intent.client_order_id in open_client_ids:
         return "submitted"
-    if broker_status in {"filled", "partially_filled"}:
-        return "filled_reconciled"
-    if broker_status in {"canceled", "cancelled", "rejected", "expired"}:
-        return "closed_reconciled"
-    position_qty = positions.get(intent.symbol, Position(symbol=intent.symbol, qty=0)).qty
+    reconciled_status = _BROKER_STATUS_MAP.get(broker_status) if broker_status else None
+    if reconciled_status is not None:
+        return reconciled_status
+    position_qty = held_qty(positions, intent.symbol)
     if intent.side == OrderSide.BUY.value and position_qty + epsilon >= intent.qty:
         return "filled_reconciled"
     if intent.side == OrderSide.SELL.value and position_qty - epsilon <= -intent.qty:
@@ -1224,18 +1484,13 @@ def build_data_provider(settings: Settings, strategy: Strategy) -> MarketDataPro
         secret_key=settings.alpaca_secret_key,
         data_base_url=settings.alpaca_data_url,
         timeframe=settings.timeframe,
+        pool_size=max(10, settings.parallel_fetch_workers),
     )
 
 
 def strategy_diagnostic_lookback_bars(strategy: Strategy) -> int:
     """Resolve lookback horizon from strategy params for decision diagnostics."""
-    params = getattr(strategy, "params", None)
-    candidates = [1]
-    for field in ("lookback_bars", "slow_ema_period", "rsi_period"):
-        value = getattr(params, field, None)
-        if isinstance(value, (int, float)) and value > 0:
-            candidates.append(int(value))
-    return max(candidates)
+    return max([1, *_strategy_lookback_periods(strategy)])
 
 
 def strategy_trade_size_bounds(strategy: Strategy | None) -> tuple[float, float] | None:
@@ -1292,24 +1547,20 @@ def normalize_symbol_list(symbols: list[str] | tuple[str, ...] | None) -> list[s
     """Normalize symbols to uppercase and de-duplicate while preserving order."""
     if symbols is None:
         return []
+    return list(_normalize_symbol_tuple(tuple(str(raw_symbol) for raw_symbol in symbols)))
+
+
+@lru_cache(maxsize=32)
+def _normalize_symbol_tuple(symbols: tuple[str, ...]) -> tuple[str, ...]:
     normalized: list[str] = []
     seen: set[str] = set()
     for raw_symbol in symbols:
-        symbol = str(raw_symbol).strip().upper()
+        symbol = raw_symbol.strip().upper()
         if not symbol or symbol in seen:
             continue
         seen.add(symbol)
         normalized.append(symbol)
-    return normalized
-
-
-def _signal_strength(signal_value: float, signal_cap: float) -> float:
-    """Convert signed signal into a normalized 0..1 strength score."""
-    if abs(signal_value) <= 1e-12:
-        return 0.0
-    if signal_cap <= 0:
-        return 1.0
-    return max(0.0, min(abs(float(signal_value)) / float(signal_cap), 1.0))
+    return tuple(normalized)
 
 
 def _resolve_equity(portfolio_snapshot: PortfolioSnapshot | None) -> float | None:
@@ -1323,13 +1574,18 @@ def _resolve_equity(portfolio_snapshot: PortfolioSnapshot | None) -> float | Non
 
 def strategy_warmup_bars(strategy: Strategy) -> int:
     """Resolve minimum historical bars needed to run the strategy."""
+    return max([2, *(period + 1 for period in _strategy_lookback_periods(strategy))])
+
+
+def _strategy_lookback_periods(strategy: Strategy) -> list[int]:
+    """Collect positive lookback-style periods declared on strategy params."""
     params = getattr(strategy, "params", None)
-    candidates = [2]
-    for field in ("lookback_bars", "slow_ema_period", "rsi_period"):
+    periods: list[int] = []
+    for field in _LOOKBACK_FIELDS:
         value = getattr(params, field, None)
         if isinstance(value, (int, float)) and value > 0:
-            candidates.append(int(value) + 1)
-    return max(candidates)
+            periods.append(int(value))
+    return periods
 
 
 def build_state_store(settings: Settings) -> StateStore:
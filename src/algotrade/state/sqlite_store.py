@@ -3,12 +3,73 @@
 from __future__ import annotations
 
 import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 
 from algotrade.domain.models import OrderRequest
 from algotrade.state.store import OrderIntentRecord
 
+_ACTIVE_STATUSES = frozenset({"intended", "submitted"})
+
+_SQL_INSERT_RUN = """
+INSERT OR REPLACE INTO runs(run_id, mode, strategy_id, symbols, started_ts)
+VALUES(?, ?, ?, ?, ?)
+"""
+
+_SQL_SAVE_INTENT = """
+INSERT OR REPLACE INTO order_intents(
+    client_order_id,
+    run_id,
+    symbol,
+    side,
+    qty,
+    order_type,
+    status,
+    broker_order_id,
+    fingerprint,
+    created_ts,
+    updated_ts
+)
+VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_MARK_SUBMITTED = """
+UPDATE order_intents
+SET broker_order_id = ?, status = ?, updated_ts = ?
+WHERE client_order_id = ?
+"""
+
+_SQL_MARK_RECONCILED = """
+UPDATE order_intents
+SET status = ?, updated_ts = ?
+WHERE client_order_id = ?
+"""
+
+_SQL_LIST_ACTIVE = """
+SELECT
+    client_order_id,
+    run_id,
+    symbol,
+    side,
+    qty,
+    status,
+    broker_order_id,
+    fingerprint,
+    created_ts
+FROM order_intents
+WHERE status IN ('intended', 'submitted')
+ORDER BY created_ts ASC, rowid ASC
+"""
+
+_SQL_ACTIVE_FINGERPRINTS = """
+SELECT client_order_id, fingerprint
+FROM order_intents
+WHERE status IN ('intended', 'submitted')
+"""
+
 
 class SqliteStateStore:
     """SQLite-backed implementation of runtime state persistence."""
@@ -16,10 +77,35 @@ class SqliteStateStore:
     def __init__(self, db_path: str) -> None:
         path = Path(db_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        self.connection = sqlite3.connect(path)
-        self.connection.row_factory = sqlite3.Row
+        # SQL text is held in module constants, so every call hits the statement cache.
+        self.connection = sqlite3.connect(path, cached_statements=256)
+        # WAL with synchronous=NORMAL keeps commits durable across process crashes while
+        # avoiding an fsync of the main database file on every write.
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA temp_store=MEMORY")
+        self._transaction_depth = 0
+        # Write timestamps share one formatted string per wall-clock second; rows written in
+        # the same second keep insertion order through the rowid tie-break on reads.
+        self._now_second = -1
+        self._now_prefix = ""
+        # Active intents mirrored in memory (client_order_id -> fingerprint, and a count per
+        # fingerprint) so duplicate checks avoid a query per order. Loaded lazily.
+        self._active_intents: dict[str, str] | None = None
+        self._active_fingerprints: dict[str, int] = {}
         self._initialize_schema()
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into one commit issued when the outermost block exits."""
+        self._transaction_depth += 1
+        try:
+            yield
+        finally:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.connection.commit()
+
     def record_run(
         self,
         run_id: str,
@@ -27,84 +113,93 @@ class SqliteStateStore:
         strategy_id: str,
         symbols: list[str],
     ) -> None:
-        now = self._utc_now()
+        now = self._now_text()
         symbols_text = ",".join(symbols)
         self.connection.execute(
-            """
-            INSERT OR REPLACE INTO runs(run_id, mode, strategy_id, symbols, started_ts)
-            VALUES(?, ?, ?, ?, ?)
-            """,
+            _SQL_INSERT_RUN,
             (run_id, mode, strategy_id, symbols_text, now),
         )
-        self.connection.commit()
+        self._commit()
 
     def save_intended_order(self, run_id: str, request: OrderRequest) -> None:
-        if request.client_order_id is None:
+        self.save_intended_orders(run_id, [request])
+
+    def save_intended_orders(self, run_id: str, requests: list[OrderRequest]) -> None:
+        """Persist several order intents with one executemany and a single commit."""
+        if any(request.client_order_id is None for request in requests):
             raise ValueError("request.client_order_id is required for persistence")
-        now = self._utc_now()
-        fingerprint = self._fingerprint(request.symbol, request.side.value, request.qty)
-        self.connection.execute(
-            """
-            INSERT OR REPLACE INTO order_intents(
-                client_order_id,
-                run_id,
-                symbol,
-                side,
-                qty,
-                order_type,
-                status,
-                broker_order_id,
-                fingerprint,
-                created_ts,
-                updated_ts
-            )
-            VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                request.client_order_id,
-                run_id,
-                request.symbol,
-                request.side.value,
-                request.qty,
-                request.order_type,
-                "intended",
-                None,
-                fingerprint,
-                now,
-                now,
-            ),
+        if not requests:
+            return
+        now = self._now_text()
+        fingerprints = [
+            self._fingerprint(request.symbol, request.side.value, request.qty)
+            for request in requests
+        ]
+        self.connection.executemany(
+            _SQL_SAVE_INTENT,
+            [
+                (
+                    request.client_order_id,
+                    run_id,
+                    request.symbol,
+                    request.side.value,
+                    request.qty,
+                    request.order_type,
+                    "intended",
+                    None,
+                    fingerprint,
+                    now,
+                    now,
+                )
+                for request, fingerprint in zip(requests, fingerprints, strict=True)
+            ],
         )
-        self.connection.commit()
+        self._commit()
+        for request, fingerprint in zip(requests, fingerprints, strict=True):
+            self._track_active(str(request.client_order_id), fingerprint)
 
     def mark_submitted(self, client_order_id: str, broker_order_id: str, status: str) -> None:
-        now = self._utc_now()
+        now = self._now_text()
         normalized_status = self._normalize_submission_status(status)
         self.connection.execute(
-            """
-            UPDATE order_intents
-            SET broker_order_id = ?, status = ?, updated_ts = ?
-            WHERE client_order_id = ?
-            """,
+            _SQL_MARK_SUBMITTED,
             (broker_order_id, normalized_status, now, client_order_id),
         )
-        self.connection.commit()
+        self._commit()
+        self._track_status(client_order_id, normalized_status)
 
     def mark_reconciled(self, client_order_id: str, status: str) -> None:
-        now = self._utc_now()
-        self.connection.execute(
-            """
-            UPDATE order_intents
-            SET status = ?, updated_ts = ?
-            WHERE client_order_id = ?
-            """,
-            (status, now, client_order_id),
+        self.mark_reconciled_many([(client_order_id, status)])
+
+    def mark_reconciled_many(self, updates: list[tuple[str, str]]) -> None:
+        """Apply (client_order_id, status) reconciliations with one executemany and commit."""
+        if not updates:
+            return
+        now = self._now_text()
+        self.connection.executemany(
+            _SQL_MARK_RECONCILED,
+            [(status, now, client_order_id) for client_order_id, status in updates],
         )
-        self.connection.commit()
+        self._commit()
+        for client_order_id, status in updates:
+            self._track_status(client_order_id, status)
 
     def list_active_intents(self) -> list[OrderIntentRecord]:
-        rows = self.connection.execute(
-            """
-            SELECT
+        # Rows are plain tuples in _SQL_LIST_ACTIVE column order.
+        rows = self.connection.execute(_SQL_LIST_ACTIVE).fetchall()
+        return [
+            OrderIntentRecord(
+                client_order_id=str(client_order_id),
+                run_id=str(run_id),
+                symbol=str(symbol),
+                side=str(side),
+                qty=float(qty),
+                status=str(status),
+                broker_order_id=str(broker_order_id) if broker_order_id else None,
+                fingerprint=str(fingerprint),
+                created_ts=str(created_ts) if created_ts else None,
+            )
+            for (
                 client_order_id,
                 run_id,
                 symbol,
@@ -112,45 +207,69 @@ class SqliteStateStore:
                 qty,
                 status,
                 broker_order_id,
-                fingerprint
-            FROM order_intents
-            WHERE status IN ('intended', 'submitted')
-            ORDER BY created_ts ASC
-            """
-        ).fetchall()
-        records: list[OrderIntentRecord] = []
-        for row in rows:
-            records.append(
-                OrderIntentRecord(
-                    client_order_id=str(row["client_order_id"]),
-                    run_id=str(row["run_id"]),
-                    symbol=str(row["symbol"]),
-                    side=str(row["side"]),
-                    qty=float(row["qty"]),
-                    status=str(row["status"]),
-                    broker_order_id=str(row["broker_order_id"]) if row["broker_order_id"] else None,
-                    fingerprint=str(row["fingerprint"]),
-                )
-            )
-        return records
+                fingerprint,
+                created_ts,
+            ) in rows
+        ]
 
     def has_active_intent(self, symbol: str, side: str, qty: float) -> bool:
-        fingerprint = self._fingerprint(symbol, side, qty)
-        row = self.connection.execute(
-            """
-            SELECT 1
-            FROM order_intents
-            WHERE fingerprint = ?
-              AND status IN ('intended', 'submitted')
-            LIMIT 1
-            """,
-            (fingerprint,),
-        ).fetchone()
-        return row is not None
+        if self._active_intents is None:
+            self.refresh_active_cache()
+        return self._fingerprint(symbol, side, qty) in self._active_fingerprints
+
+    def refresh_active_cache(self) -> None:
+        """Reload the in-memory active-intent fingerprints with a single query."""
+        rows = self.connection.execute(_SQL_ACTIVE_FINGERPRINTS).fetchall()
+        self._active_intents = {}
+        self._active_fingerprints = {}
+        for client_order_id, fingerprint in rows:
+            self._track_active(str(client_order_id), str(fingerprint))
 
     def close(self) -> None:
         self.connection.close()
 
+    def _track_active(self, client_order_id: str, fingerprint: str) -> None:
+        if self._active_intents is None:
+            return
+        self._untrack(client_order_id)
+        self._active_intents[client_order_id] = fingerprint
+        self._active_fingerprints[fingerprint] = self._active_fingerprints.get(fingerprint, 0) + 1
+
+    def _track_status(self, client_order_id: str, status: str) -> None:
+        if self._active_intents is None:
+            return
+        if status not in _ACTIVE_STATUSES:
+            self._untrack(client_order_id)
+        elif client_order_id not in self._active_intents:
+            # A stored intent became active again; its fingerprint lives only in the table.
+            self._active_intents = None
+
+    def _untrack(self, client_order_id: str) -> None:
+        fingerprint = self._active_intents.pop(client_order_id, None)
+        if fingerprint is None:
+            return
+        remaining = self._active_fingerprints[fingerprint] - 1
+        if remaining:
+            self._active_fingerprints[fingerprint] = remaining
+        else:
+            del self._active_fingerprints[fingerprint]
+
+    def _now_text(self) -> str:
+        """Return the current UTC time in ISO format with microseconds.
+
+        The date and time-of-day prefix is formatted once per second; only the microseconds
+        are rendered on every call.
+        """
+        second, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+        if second != self._now_second:
+            self._now_second = second
+            self._now_prefix = datetime.fromtimestamp(second, tz=UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        return f"{self._now_prefix}.{nanoseconds // 1000:06d}+00:00"
+
+    def _commit(self) -> None:
+        if self._transaction_depth == 0:
+            self.connection.commit()
+
     def _initialize_schema(self) -> None:
         self.connection.execute(
             """
@@ -192,6 +311,13 @@ class SqliteStateStore:
             ON order_intents(fingerprint)
             """
         )
+        # Covers the active-intent scan (status filter plus returned columns) without table reads.
+        self.connection.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_order_intents_status_fingerprint
+            ON order_intents(status, fingerprint, client_order_id)
+            """
+        )
         self.connection.commit()
 
     @staticmethod
@@ -206,10 +332,6 @@ class SqliteStateStore:
             return "0"
         return text
 
-    @staticmethod
-    def _utc_now() -> str:
-        return datetime.now(tz=UTC).isoformat()
-
     @staticmethod
     def _normalize_submission_status(status: str) -> str:
         terminal = {"filled", "canceled", "cancelled", "rejected"}
@@ -20,6 +20,7 @@ class OrderIntentRecord:
     status: str
     broker_order_id: str | None
     fingerprint: str
+    created_ts: str | None = None
 
 
 class StateStore(Protocol):
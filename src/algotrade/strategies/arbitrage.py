@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import math
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 
 import numpy as np
 import pandas as pd
 
-from algotrade.domain.models import PortfolioSnapshot, Position
-from algotrade.strategy_core.base import Strategy
+from algotrade.domain.models import PortfolioSnapshot
+from algotrade.jit import njit
+from algotrade.strategy_core.base import Strategy, symbol_order, validate_trade_size_pct
+from algotrade.strategy_core.closes import close_series
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArbitrageParams:
     """Parameter set for simple pairs trading."""
 
@@ -31,28 +36,28 @@ def default_arbitrage_params() -> ArbitrageParams:
     return ArbitrageParams()
 
 
+@lru_cache(maxsize=128)
+def _validate_params(params: ArbitrageParams) -> None:
+    if params.lookback_bars <= 1:
+        raise ValueError("lookback_bars must be greater than 1")
+    if params.entry_zscore <= 0:
+        raise ValueError("entry_zscore must be positive")
+    if params.exit_zscore < 0:
+        raise ValueError("exit_zscore must be non-negative")
+    if params.exit_zscore >= params.entry_zscore:
+        raise ValueError("exit_zscore must be smaller than entry_zscore")
+    if params.max_abs_qty <= 0:
+        raise ValueError("max_abs_qty must be positive")
+    validate_trade_size_pct(params.min_trade_size_pct, params.max_trade_size_pct)
+
+
 class ArbitrageStrategy(Strategy):
     """Trade mean reversion in the log-price spread of two symbols."""
 
     strategy_id = "arbitrage"
 
     def __init__(self, params: ArbitrageParams) -> None:
-        if params.lookback_bars <= 1:
-            raise ValueError("lookback_bars must be greater than 1")
-        if params.entry_zscore <= 0:
-            raise ValueError("entry_zscore must be positive")
-        if params.exit_zscore < 0:
-            raise ValueError("exit_zscore must be non-negative")
-        if params.exit_zscore >= params.entry_zscore:
-            raise ValueError("exit_zscore must be smaller than entry_zscore")
-        if params.max_abs_qty <= 0:
-            raise ValueError("max_abs_qty must be positive")
-        if params.min_trade_size_pct <= 0 or params.max_trade_size_pct <= 0:
-            raise ValueError("trade size percentages must be positive")
-        if params.min_trade_size_pct > params.max_trade_size_pct:
-            raise ValueError("min_trade_size_pct must be <= max_trade_size_pct")
-        if params.max_trade_size_pct > 100:
-            raise ValueError("max_trade_size_pct must be <= 100")
+        _validate_params(params)
         self.params = params
 
     def decide_targets(
@@ -60,18 +65,17 @@ class ArbitrageStrategy(Strategy):
         bars_by_symbol: Mapping[str, pd.DataFrame],
         portfolio_snapshot: PortfolioSnapshot,
     ) -> dict[str, float]:
+        positions = portfolio_snapshot.positions
         targets = {
-            symbol: float(
-                portfolio_snapshot.positions.get(symbol, Position(symbol=symbol, qty=0)).qty
-            )
-            for symbol in sorted(bars_by_symbol)
+            symbol: float(positions[symbol].qty) if symbol in positions else 0.0
+            for symbol in symbol_order(bars_by_symbol)
         }
         pair = self._pick_pair(bars_by_symbol)
         if pair is None:
             return targets
 
-        symbol_a, symbol_b = pair
-        zscore = self._spread_zscore(bars_by_symbol[symbol_a], bars_by_symbol[symbol_b])
+        symbol_a, symbol_b, close_a, close_b = pair
+        zscore = self._spread_zscore(close_a, close_b)
         if zscore is None:
             return targets
         if abs(zscore) <= self.params.exit_zscore:
@@ -89,38 +93,113 @@ class ArbitrageStrategy(Strategy):
             targets[symbol_b] = -self.params.max_abs_qty
         return targets
 
-    def _pick_pair(self, bars_by_symbol: Mapping[str, pd.DataFrame]) -> tuple[str, str] | None:
-        valid = [
-            symbol
-            for symbol in sorted(bars_by_symbol)
-            if self._has_usable_close(bars_by_symbol[symbol])
-        ]
-        if len(valid) < 2:
+    def _pick_pair(
+        self, bars_by_symbol: Mapping[str, pd.DataFrame]
+    ) -> tuple[str, str, pd.Series, pd.Series] | None:
+        """Return the first two symbols with enough closes, plus their numeric close series."""
+        symbols = symbol_order(bars_by_symbol)
+        for symbol in symbols:
+            if "close" not in bars_by_symbol[symbol].columns:
+                raise ValueError("bars must include close column")
+        picked = list(islice(self._iter_usable(bars_by_symbol, symbols), 2))
+        if len(picked) < 2:
             return None
-        return valid[0], valid[1]
-
-    def _has_usable_close(self, bars: pd.DataFrame) -> bool:
-        if "close" not in bars.columns:
-            raise ValueError("bars must include close column")
-        close = pd.to_numeric(bars["close"], errors="coerce").dropna()
-        return len(close) > self.params.lookback_bars
-
-    def _spread_zscore(self, bars_a: pd.DataFrame, bars_b: pd.DataFrame) -> float | None:
-        close_a = pd.to_numeric(bars_a["close"], errors="coerce").dropna()
-        close_b = pd.to_numeric(bars_b["close"], errors="coerce").dropna()
-        aligned = pd.concat([close_a, close_b], axis=1, join="inner").dropna()
-        if len(aligned) <= self.params.lookback_bars:
-            return None
-
-        ratio = aligned.iloc[:, 0] / aligned.iloc[:, 1]
-        ratio = ratio.replace([np.inf, -np.inf], np.nan).dropna()
-        if len(ratio) <= self.params.lookback_bars:
+        (symbol_a, close_a), (symbol_b, close_b) = picked
+        return symbol_a, symbol_b, close_a, close_b
+
+    def _iter_usable(
+        self, bars_by_symbol: Mapping[str, pd.DataFrame], symbols: Iterable[str]
+    ) -> Iterator[tuple[str, pd.Series]]:
+        """Yield ``(symbol, closes)`` for symbols with enough history, coercing each once."""
+        for symbol in symbols:
+            close = close_series(bars_by_symbol[symbol])
+            if len(close) > self.params.lookback_bars:
+                yield symbol, close
+
+    def _spread_zscore(self, close_a: pd.Series, close_b: pd.Series) -> float | None:
+        values_a, values_b = _aligned_values(close_a, close_b)
+        if len(values_a) <= self.params.lookback_bars:
             return None
 
-        spread = np.log(ratio)
-        window = spread.iloc[-self.params.lookback_bars :]
-        mean = float(window.mean())
-        std = float(window.std(ddof=0))
-        if std <= 0:
+        zscore = _spread_zscore_kernel(values_a, values_b, self.params.lookback_bars)
+        if not math.isfinite(zscore):
             return None
-        return (float(spread.iloc[-1]) - mean) / std
+        return zscore
+
+
+def _aligned_values(close_a: pd.Series, close_b: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Float64 closes on the index labels both series share, in index order."""
+    index_a = close_a.index
+    index_b = close_b.index
+    values_a = close_a.to_numpy(dtype=np.float64, copy=False)
+    values_b = close_b.to_numpy(dtype=np.float64, copy=False)
+    if index_a.equals(index_b) and index_a.is_unique:
+        # Already aligned; nothing to gather.
+        return values_a, values_b
+    keys_a = _sorted_index_keys(index_a)
+    keys_b = _sorted_index_keys(index_b)
+    if keys_a is not None and keys_b is not None and index_a.dtype == index_b.dtype:
+        # Strictly increasing keys: the sorted intersection keeps the inner join's row order.
+        _, rows_a, rows_b = np.intersect1d(keys_a, keys_b, assume_unique=True, return_indices=True)
+        return values_a[rows_a], values_b[rows_b]
+    aligned = pd.concat([close_a, close_b], axis=1, join="inner")
+    return (
+        aligned.iloc[:, 0].to_numpy(dtype=np.float64, copy=False),
+        aligned.iloc[:, 1].to_numpy(dtype=np.float64, copy=False),
+    )
+
+
+def _sorted_index_keys(index: pd.Index) -> np.ndarray | None:
+    """Integer keys for a unique, increasing datetime or integer index; otherwise ``None``."""
+    if not (index.is_unique and index.is_monotonic_increasing):
+        return None
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8
+    if index.dtype.kind in "iu":
+        return index.to_numpy()
+    return None
+
+
+@njit(cache=True, nogil=True)
+def _spread_zscore_kernel(close_a: np.ndarray, close_b: np.ndarray, lookback_bars: int) -> float:
+    """Z-score of the latest log price ratio against the trailing ``lookback_bars`` window.
+
+    Rows whose ratio is not finite are skipped, and at least ``lookback_bars + 1`` usable rows
+    are required. The window's log ratios, mean and population variance are accumulated in a
+    single backward pass (Welford). Returns NaN when the score is undefined (short history or
+    flat spread).
+    """
+    found = 0
+    usable = 0
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    latest = math.nan
+    offset = close_a.shape[0] - 1
+    while offset >= 0 and usable <= lookback_bars:
+        denominator = close_b[offset]
+        # A zero denominator gives an infinite or NaN ratio, which is skipped either way.
+        ratio = close_a[offset] / denominator if denominator != 0 else math.nan
+        if math.isfinite(ratio):
+            if found < lookback_bars:
+                # Match np.log: zero ratios map to -inf, negative ratios to NaN (skipped).
+                if ratio > 0:
+                    value = math.log(ratio)
+                else:
+                    value = -math.inf if ratio == 0 else math.nan
+                if found == 0:
+                    latest = value
+                if not math.isnan(value):
+                    count += 1
+                    delta = value - mean
+                    mean += delta / count
+                    m2 += delta * (value - mean)
+                found += 1
+            usable += 1
+        offset -= 1
+    if usable <= lookback_bars or count == 0:
+        return math.nan
+    std = math.sqrt(m2 / count)
+    if std <= 0:
+        return math.nan
+    return (latest - mean) / std
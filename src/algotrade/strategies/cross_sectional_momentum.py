@@ -4,14 +4,16 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
 from algotrade.domain.models import PortfolioSnapshot
-from algotrade.strategy_core.base import Strategy
+from algotrade.strategy_core.base import Strategy, symbol_order, validate_trade_size_pct
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CrossSectionalMomentumParams:
     """Parameter set for cross-sectional momentum."""
 
@@ -29,24 +31,24 @@ def default_cross_sectional_momentum_params() -> CrossSectionalMomentumParams:
     return CrossSectionalMomentumParams()
 
 
+@lru_cache(maxsize=128)
+def _validate_params(params: CrossSectionalMomentumParams) -> None:
+    if params.lookback_bars <= 0:
+        raise ValueError("lookback_bars must be positive")
+    if params.top_k <= 0:
+        raise ValueError("top_k must be positive")
+    if params.max_abs_qty <= 0:
+        raise ValueError("max_abs_qty must be positive")
+    validate_trade_size_pct(params.min_trade_size_pct, params.max_trade_size_pct)
+
+
 class CrossSectionalMomentumStrategy(Strategy):
     """Long recent winners and optionally short recent losers."""
 
     strategy_id = "cross_sectional_momentum"
 
     def __init__(self, params: CrossSectionalMomentumParams) -> None:
-        if params.lookback_bars <= 0:
-            raise ValueError("lookback_bars must be positive")
-        if params.top_k <= 0:
-            raise ValueError("top_k must be positive")
-        if params.max_abs_qty <= 0:
-            raise ValueError("max_abs_qty must be positive")
-        if params.min_trade_size_pct <= 0 or params.max_trade_size_pct <= 0:
-            raise ValueError("trade size percentages must be positive")
-        if params.min_trade_size_pct > params.max_trade_size_pct:
-            raise ValueError("min_trade_size_pct must be <= max_trade_size_pct")
-        if params.max_trade_size_pct > 100:
-            raise ValueError("max_trade_size_pct must be <= 100")
+        _validate_params(params)
         self.params = params
 
     def decide_targets(
@@ -55,38 +57,51 @@ class CrossSectionalMomentumStrategy(Strategy):
         portfolio_snapshot: PortfolioSnapshot,
     ) -> dict[str, float]:
         _ = portfolio_snapshot
-        targets = {symbol: 0.0 for symbol in sorted(bars_by_symbol)}
-        scores: list[tuple[str, float]] = []
-
-        for symbol, bars in sorted(bars_by_symbol.items()):
-            score = self._momentum_score(bars)
-            if score is not None:
-                scores.append((symbol, score))
-
-        if not scores:
+        symbols = symbol_order(bars_by_symbol)
+        targets = {symbol: 0.0 for symbol in symbols}
+        endpoints = np.full((len(symbols), 2), np.nan, dtype=np.float64)
+        for row, symbol in enumerate(symbols):
+            window = self._score_window(bars_by_symbol[symbol])
+            if window is not None:
+                endpoints[row] = window
+
+        reference = endpoints[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            all_scores = (endpoints[:, 1] - reference) / reference
+        # Undefined scores (missing history, zero or infinite closes) are left out of the ranking.
+        scored = np.flatnonzero(np.isfinite(all_scores))
+        if scored.size == 0:
             return targets
+        # Rank by (score, symbol); ``scored`` indexes the sorted symbol list, so it breaks ties.
+        order = scored[np.lexsort((scored, all_scores[scored]))]
 
-        ranked = sorted(scores, key=lambda item: (item[1], item[0]))
-        k = min(self.params.top_k, len(ranked))
-        for symbol, _score in ranked[-k:]:
-            targets[symbol] = self.params.max_abs_qty
+        k = min(self.params.top_k, order.size)
+        for row in order[-k:].tolist():
+            targets[symbols[row]] = self.params.max_abs_qty
 
         if self.params.allow_short:
-            for symbol, _score in ranked[:k]:
+            for row in order[:k].tolist():
+                symbol = symbols[row]
                 if targets[symbol] > 0:
                     continue
                 targets[symbol] = -self.params.max_abs_qty
 
         return targets
 
-    def _momentum_score(self, bars: pd.DataFrame) -> float | None:
+    def _score_window(self, bars: pd.DataFrame) -> tuple[float, float] | None:
+        """Return (reference, latest) closes ``lookback_bars`` apart, ignoring missing closes."""
         if "close" not in bars.columns:
             raise ValueError("bars must include close column")
-        close = pd.to_numeric(bars["close"], errors="coerce").dropna()
-        if len(close) <= self.params.lookback_bars:
-            return None
-        latest = float(close.iloc[-1])
-        reference = float(close.iloc[-1 - self.params.lookback_bars])
-        if reference == 0:
-            return None
-        return (latest - reference) / reference
+        column = bars["close"]
+        if column.dtype.kind == "f":
+            close = column.to_numpy(dtype=np.float64, copy=False)
+        else:
+            close = pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64)
+        span = self.params.lookback_bars + 1
+        window = close[-span:]
+        if len(window) < span or np.isnan(window).any():
+            close = close[~np.isnan(close)]
+            if len(close) < span:
+                return None
+            window = close[-span:]
+        return float(window[0]), float(window[-1])
@@ -2,21 +2,39 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from algotrade.domain.models import PortfolioSnapshot, Position
-from algotrade.strategy_core.base import Strategy
+from algotrade.domain.models import PortfolioSnapshot
+from algotrade.jit import NUMBA_AVAILABLE, njit, prange
+from algotrade.strategy_core.base import Strategy, symbol_order, validate_trade_size_pct
+from algotrade.strategy_core.closes import close_series
+from algotrade.strategy_core.kernels import (
+    advance_rsi_states,
+    ema_step,
+    rolling_mean_value,
+    rsi_averages,
+    rsi_states,
+)
 
 try:  # pragma: no cover - optional acceleration when TA-Lib is installed.
     import talib as _talib
 except ImportError:  # pragma: no cover - fallback path used in tests/CI.
     _talib = None
 
+# Below this many symbols the per-symbol EMA kernel beats packing a shared buffer.
+_PARALLEL_MIN_SYMBOLS = 32
+# TA-Lib sees this many multiples of the longest period; older bars no longer move its output.
+_TALIB_TAIL_PERIODS = 5
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ScalpingParams:
     """Parameter set for EMA/RSI scalping."""
 
@@ -37,52 +55,74 @@ def default_scalping_params() -> ScalpingParams:
     return ScalpingParams()
 
 
+@lru_cache(maxsize=128)
+def _validate_params(params: ScalpingParams) -> None:
+    if params.fast_ema_period <= 1 or params.slow_ema_period <= 1:
+        raise ValueError("EMA periods must be greater than 1")
+    if params.fast_ema_period >= params.slow_ema_period:
+        raise ValueError("fast_ema_period must be less than slow_ema_period")
+    if params.rsi_period <= 1:
+        raise ValueError("rsi_period must be greater than 1")
+    if not (0 <= params.rsi_oversold < params.rsi_overbought <= 100):
+        raise ValueError("RSI thresholds must satisfy 0 <= oversold < overbought <= 100")
+    if params.max_abs_qty <= 0:
+        raise ValueError("max_abs_qty must be positive")
+    validate_trade_size_pct(params.min_trade_size_pct, params.max_trade_size_pct)
+
+
 class ScalpingStrategy(Strategy):
     """Trade fast trend shifts with EMA crossover confirmed by RSI."""
 
     strategy_id = "scalping"
 
     def __init__(self, params: ScalpingParams) -> None:
-        if params.fast_ema_period <= 1 or params.slow_ema_period <= 1:
-            raise ValueError("EMA periods must be greater than 1")
-        if params.fast_ema_period >= params.slow_ema_period:
-            raise ValueError("fast_ema_period must be less than slow_ema_period")
-        if params.rsi_period <= 1:
-            raise ValueError("rsi_period must be greater than 1")
-        if not (0 <= params.rsi_oversold < params.rsi_overbought <= 100):
-            raise ValueError("RSI thresholds must satisfy 0 <= oversold < overbought <= 100")
-        if params.max_abs_qty <= 0:
-            raise ValueError("max_abs_qty must be positive")
-        if params.min_trade_size_pct <= 0 or params.max_trade_size_pct <= 0:
-            raise ValueError("trade size percentages must be positive")
-        if params.min_trade_size_pct > params.max_trade_size_pct:
-            raise ValueError("min_trade_size_pct must be <= max_trade_size_pct")
-        if params.max_trade_size_pct > 100:
-            raise ValueError("max_trade_size_pct must be <= 100")
+        _validate_params(params)
         self.params = params
+        self._fast_alpha = 2.0 / (params.fast_ema_period + 1.0)
+        self._slow_alpha = 2.0 / (params.slow_ema_period + 1.0)
+        # symbol -> (fast, slow, length, first label, last label, last close) of the last call.
+        self._ema_state: dict[str, tuple[float, float, int, Any, Any, float]] = {}
+        # symbol -> (gain state, loss state, length, first label, last label, last close).
+        self._rsi_state: dict[str, tuple[np.ndarray, np.ndarray, int, Any, Any, float]] = {}
 
     def decide_targets(
         self,
         bars_by_symbol: Mapping[str, pd.DataFrame],
         portfolio_snapshot: PortfolioSnapshot,
     ) -> dict[str, float]:
+        symbols = symbol_order(bars_by_symbol)
+        closes = {symbol: self._close(bars_by_symbol[symbol]) for symbol in symbols}
+        emas = self._ema_values(closes)
+        rsi_inputs = self._rsi_values(closes)
+        positions = portfolio_snapshot.positions
         targets: dict[str, float] = {}
-        for symbol, bars in sorted(bars_by_symbol.items()):
-            current_qty = float(
-                portfolio_snapshot.positions.get(symbol, Position(symbol=symbol, qty=0)).qty
+        for symbol in symbols:
+            current_qty = float(positions[symbol].qty) if symbol in positions else 0.0
+            targets[symbol] = self._target_from_close(
+                closes[symbol], current_qty, emas.get(symbol), rsi_inputs.get(symbol)
             )
-            targets[symbol] = self._target_for_symbol(bars, current_qty)
         return targets
 
-    def _target_for_symbol(self, bars: pd.DataFrame, current_qty: float) -> float:
+    def _min_rows(self) -> int:
+        return max(self.params.slow_ema_period, self.params.rsi_period) + 1
+
+    @staticmethod
+    def _close(bars: pd.DataFrame) -> pd.Series:
         if "close" not in bars.columns:
             raise ValueError("bars must include close column")
-        close = pd.to_numeric(bars["close"], errors="coerce").dropna()
-        min_rows = max(self.params.slow_ema_period, self.params.rsi_period) + 1
-        if len(close) < min_rows:
+        return close_series(bars)
+
+    def _target_from_close(
+        self,
+        close: pd.Series,
+        current_qty: float,
+        emas: tuple[float, float] | None = None,
+        rsi_inputs: tuple[float, float] | None = None,
+    ) -> float:
+        if len(close) < self._min_rows():
             return current_qty
 
-        fast_ema, slow_ema, rsi = self._latest_indicators(close)
+        fast_ema, slow_ema, rsi = self._latest_indicators(close, emas, rsi_inputs)
         if fast_ema is None or slow_ema is None or rsi is None:
             return current_qty
         if fast_ema > slow_ema and rsi < self.params.rsi_overbought:
@@ -91,36 +131,244 @@ class ScalpingStrategy(Strategy):
             return -self.params.max_abs_qty
         return current_qty
 
+    def _ema_values(self, closes: Mapping[str, pd.Series]) -> dict[str, tuple[float, float]]:
+        """Fast/slow EMAs for every symbol with enough history.
+
+        A symbol whose closes extend the previous call's by exactly one bar is advanced from
+        the cached state in O(1); the rest are recomputed in full, batched across symbols for
+        large universes when Numba is available. Returns an empty mapping when TA-Lib computes
+        the indicators.
+        """
+        if _talib is not None:
+            return {}
+        min_rows = self._min_rows()
+        emas: dict[str, tuple[float, float]] = {}
+        pending: dict[str, pd.Series] = {}
+        for symbol, close in closes.items():
+            if len(close) < min_rows:
+                continue
+            advanced = self._advance_ema_state(symbol, close)
+            if advanced is None:
+                pending[symbol] = close
+            else:
+                emas[symbol] = advanced
+        if NUMBA_AVAILABLE and len(pending) >= _PARALLEL_MIN_SYMBOLS:
+            emas.update(self._batched_emas(pending))
+        else:
+            for symbol, close in pending.items():
+                emas[symbol] = self._full_emas(close)
+        for symbol, (fast, slow) in emas.items():
+            close = closes[symbol]
+            index = close.index
+            self._ema_state[symbol] = (
+                fast,
+                slow,
+                len(close),
+                index[0],
+                index[-1],
+                float(close.to_numpy(dtype=np.float64)[-1]),
+            )
+        return emas
+
+    def _advance_ema_state(self, symbol: str, close: pd.Series) -> tuple[float, float] | None:
+        state = self._ema_state.get(symbol)
+        if state is None:
+            return None
+        fast, slow = state[0], state[1]
+        # Positional reads on the backing array skip the Series indexing machinery.
+        values = close.to_numpy(dtype=np.float64)
+        if not _extends_by_one_bar(state[2:], close, values):
+            return None
+        value = float(values[-1])
+        return (
+            ema_step(fast, value, self._fast_alpha),
+            ema_step(slow, value, self._slow_alpha),
+        )
+
+    def _full_emas(self, close: pd.Series) -> tuple[float, float]:
+        """Fast/slow EMAs over all of ``close``; pandas' ``ewm`` when Numba is unavailable."""
+        if NUMBA_AVAILABLE:
+            return _dual_ema_last(
+                close.to_numpy(dtype=np.float64), self._fast_alpha, self._slow_alpha
+            )
+        fast = close.ewm(span=self.params.fast_ema_period, adjust=False).mean()
+        slow = close.ewm(span=self.params.slow_ema_period, adjust=False).mean()
+        return float(fast.iloc[-1]), float(slow.iloc[-1])
+
+    def _batched_emas(self, closes: Mapping[str, pd.Series]) -> dict[str, tuple[float, float]]:
+        """Fast/slow EMAs for every given symbol from one parallel kernel call."""
+        symbols, buffer, lengths = _pack_closes(closes)
+        fast, slow = _dual_ema_last_batch(buffer, lengths, self._fast_alpha, self._slow_alpha)
+        return {symbol: (float(fast[row]), float(slow[row])) for row, symbol in enumerate(symbols)}
+
+    def _rsi_values(self, closes: Mapping[str, pd.Series]) -> dict[str, tuple[float, float]]:
+        """RSI gain/loss averages for every symbol with enough history.
+
+        Like ``_ema_values``, a symbol whose closes extend the previous call's by one bar
+        advances its cached rolling-mean states; the rest are replayed in full, batched
+        across symbols for large universes. Replaying is only worth it compiled, so this
+        returns an empty mapping without Numba (``_latest_indicators`` then uses pandas'
+        rolling windows) as well as under TA-Lib.
+        """
+        if _talib is not None or not NUMBA_AVAILABLE:
+            return {}
+        period = self.params.rsi_period
+        min_rows = self._min_rows()
+        states: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        pending: dict[str, pd.Series] = {}
+        for symbol, close in closes.items():
+            if len(close) < min_rows:
+                continue
+            state = self._rsi_state.get(symbol)
+            values = close.to_numpy(dtype=np.float64)
+            if state is not None and _extends_by_one_bar(state[2:], close, values):
+                advance_rsi_states(state[0], state[1], values, period)
+                states[symbol] = (state[0], state[1])
+            else:
+                pending[symbol] = close
+        if len(pending) >= _PARALLEL_MIN_SYMBOLS:
+            symbols, buffer, lengths = _pack_closes(pending)
+            gain_states, loss_states = _rsi_states_batch(buffer, lengths, period)
+            for row, symbol in enumerate(symbols):
+                states[symbol] = (gain_states[row], loss_states[row])
+        else:
+            for symbol, close in pending.items():
+                states[symbol] = rsi_states(close.to_numpy(dtype=np.float64), period)
+
+        averages: dict[str, tuple[float, float]] = {}
+        for symbol, (gain_state, loss_state) in states.items():
+            close = closes[symbol]
+            index = close.index
+            self._rsi_state[symbol] = (
+                gain_state,
+                loss_state,
+                len(close),
+                index[0],
+                index[-1],
+                float(close.to_numpy(dtype=np.float64)[-1]),
+            )
+            averages[symbol] = (
+                rolling_mean_value(gain_state, period),
+                rolling_mean_value(loss_state, period),
+            )
+        return averages
+
+    def _full_rsi_averages(self, close: pd.Series) -> tuple[float, float]:
+        """Latest RSI gain/loss averages over all of ``close``; pandas without Numba."""
+        period = self.params.rsi_period
+        if NUMBA_AVAILABLE:
+            return rsi_averages(close.to_numpy(dtype=np.float64), period)
+        delta = close.diff()
+        avg_gain = delta.clip(lower=0.0).rolling(window=period).mean().iloc[-1]
+        avg_loss = (-delta.clip(upper=0.0)).rolling(window=period).mean().iloc[-1]
+        return float(avg_gain), float(avg_loss)
+
     def _latest_indicators(
         self,
         close: pd.Series,
+        emas: tuple[float, float] | None = None,
+        rsi_inputs: tuple[float, float] | None = None,
     ) -> tuple[float | None, float | None, float | None]:
-        values = close.astype(float)
+        values = close.to_numpy(dtype=np.float64)
         if _talib is not None:
-            raw = values.to_numpy()
-            fast_ema = _to_float(_talib.EMA(raw, timeperiod=self.params.fast_ema_period)[-1])
-            slow_ema = _to_float(_talib.EMA(raw, timeperiod=self.params.slow_ema_period)[-1])
-            rsi = _to_float(_talib.RSI(raw, timeperiod=self.params.rsi_period)[-1])
+            tail = values[-self._min_rows() * _TALIB_TAIL_PERIODS :]
+            fast_ema = _to_float(_talib.EMA(tail, timeperiod=self.params.fast_ema_period)[-1])
+            slow_ema = _to_float(_talib.EMA(tail, timeperiod=self.params.slow_ema_period)[-1])
+            rsi = _to_float(_talib.RSI(tail, timeperiod=self.params.rsi_period)[-1])
             return fast_ema, slow_ema, rsi
 
-        fast_ema_series = values.ewm(span=self.params.fast_ema_period, adjust=False).mean()
-        slow_ema_series = values.ewm(span=self.params.slow_ema_period, adjust=False).mean()
-        fast_ema = _to_float(fast_ema_series.iloc[-1])
-        slow_ema = _to_float(slow_ema_series.iloc[-1])
-        delta = values.diff()
-        gains = delta.clip(lower=0.0)
-        losses = -delta.clip(upper=0.0)
-        avg_gain = gains.rolling(window=self.params.rsi_period).mean().iloc[-1]
-        avg_loss = losses.rolling(window=self.params.rsi_period).mean().iloc[-1]
-        if pd.isna(avg_gain) or pd.isna(avg_loss):
+        if emas is None:
+            emas = self._full_emas(close)
+        fast_ema_value, slow_ema_value = emas
+        fast_ema = _to_float(fast_ema_value)
+        slow_ema = _to_float(slow_ema_value)
+        if rsi_inputs is None:
+            rsi_inputs = self._full_rsi_averages(close)
+        avg_gain, avg_loss = rsi_inputs
+        if math.isnan(avg_gain) or math.isnan(avg_loss):
             return fast_ema, slow_ema, None
-        if float(avg_loss) == 0:
+        if avg_loss == 0:
             return fast_ema, slow_ema, 100.0
-        rs = float(avg_gain) / float(avg_loss)
+        rs = avg_gain / avg_loss
         rsi = 100.0 - (100.0 / (1.0 + rs))
         return fast_ema, slow_ema, rsi
 
 
+@njit(cache=True, nogil=True)
+def _dual_ema_last(values: np.ndarray, fast_alpha: float, slow_alpha: float) -> tuple[float, float]:
+    """Final fast and slow EMA values, matching ``Series.ewm(span, adjust=False).mean()``.
+
+    Mirrors pandas' normalized update (including its no-op when the value is unchanged) so
+    results agree bit for bit on NaN-free input.
+    """
+    fast = values[0]
+    slow = values[0]
+    fast_decay = 1.0 - fast_alpha
+    slow_decay = 1.0 - slow_alpha
+    for index in range(1, values.shape[0]):
+        value = values[index]
+        if fast != value:
+            fast = (fast_decay * fast + fast_alpha * value) / (fast_decay + fast_alpha)
+        if slow != value:
+            slow = (slow_decay * slow + slow_alpha * value) / (slow_decay + slow_alpha)
+    return fast, slow
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _dual_ema_last_batch(
+    buffer: np.ndarray,
+    lengths: np.ndarray,
+    fast_alpha: float,
+    slow_alpha: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run ``_dual_ema_last`` over the first ``lengths[row]`` values of each buffer row."""
+    count = buffer.shape[0]
+    fast = np.empty(count)
+    slow = np.empty(count)
+    for row in prange(count):
+        fast_value, slow_value = _dual_ema_last(buffer[row, : lengths[row]], fast_alpha, slow_alpha)
+        fast[row] = fast_value
+        slow[row] = slow_value
+    return fast, slow
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _rsi_states_batch(
+    buffer: np.ndarray, lengths: np.ndarray, period: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Run ``rsi_states`` over the first ``lengths[row]`` values of each buffer row."""
+    count = buffer.shape[0]
+    gain_states = np.empty((count, 7))
+    loss_states = np.empty((count, 7))
+    for row in prange(count):
+        gain_state, loss_state = rsi_states(buffer[row, : lengths[row]], period)
+        gain_states[row] = gain_state
+        loss_states[row] = loss_state
+    return gain_states, loss_states
+
+
+def _pack_closes(closes: Mapping[str, pd.Series]) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Stack closes into a padded ``(symbols, bars)`` buffer with each row's length."""
+    symbols = list(closes)
+    lengths = np.fromiter((len(closes[symbol]) for symbol in symbols), dtype=np.int64)
+    # Kernels read each row only up to its length, so the padding is left unset.
+    buffer = np.empty((len(symbols), int(lengths.max())), dtype=np.float64)
+    for row, symbol in enumerate(symbols):
+        buffer[row, : lengths[row]] = closes[symbol].to_numpy(dtype=np.float64)
+    return symbols, buffer, lengths
+
+
+def _extends_by_one_bar(
+    state: tuple[int, Any, Any, float], close: pd.Series, values: np.ndarray
+) -> bool:
+    """Whether ``close`` is the cached (length, first label, last label, last close) plus a bar."""
+    length, first_label, last_label, last_close = state
+    if len(values) != length + 1:
+        return False
+    index = close.index
+    return index[0] == first_label and index[-2] == last_label and float(values[-2]) == last_close
+
+
 def _to_float(value: object) -> float | None:
     if value is None or pd.isna(value):
         return None
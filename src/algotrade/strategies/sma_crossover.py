@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from algotrade.domain.models import PortfolioSnapshot, Position
-from algotrade.strategy_core.base import Strategy
+from algotrade.domain.models import PortfolioSnapshot
+from algotrade.jit import NUMBA_AVAILABLE
+from algotrade.strategy_core.base import Strategy, symbol_order, validate_trade_size_pct
+from algotrade.strategy_core.kernels import (
+    advance_rolling_mean,
+    replay_rolling_mean,
+    rolling_mean_value,
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SmaCrossoverParams:
     """Parameter set for SMA crossover."""
 
@@ -28,52 +38,98 @@ def default_sma_crossover_params() -> SmaCrossoverParams:
     return SmaCrossoverParams()
 
 
+@lru_cache(maxsize=128)
+def _validate_params(params: SmaCrossoverParams) -> None:
+    if params.short_window <= 0 or params.long_window <= 0:
+        raise ValueError("SMA windows must be positive")
+    if params.short_window >= params.long_window:
+        raise ValueError("short_window must be less than long_window")
+    if params.target_qty <= 0:
+        raise ValueError("target_qty must be positive")
+    validate_trade_size_pct(params.min_trade_size_pct, params.max_trade_size_pct)
+
+
 class SmaCrossoverStrategy(Strategy):
     """Move between long, short, and flat by SMA regime."""
 
     strategy_id = "sma_crossover"
 
     def __init__(self, params: SmaCrossoverParams) -> None:
-        if params.short_window <= 0 or params.long_window <= 0:
-            raise ValueError("SMA windows must be positive")
-        if params.short_window >= params.long_window:
-            raise ValueError("short_window must be less than long_window")
-        if params.target_qty <= 0:
-            raise ValueError("target_qty must be positive")
-        if params.min_trade_size_pct <= 0 or params.max_trade_size_pct <= 0:
-            raise ValueError("trade size percentages must be positive")
-        if params.min_trade_size_pct > params.max_trade_size_pct:
-            raise ValueError("min_trade_size_pct must be <= max_trade_size_pct")
-        if params.max_trade_size_pct > 100:
-            raise ValueError("max_trade_size_pct must be <= 100")
+        _validate_params(params)
         self.params = params
+        # symbol -> (short state, long state, length, last label, last close) of the last call.
+        self._sma_state: dict[str, tuple[np.ndarray, np.ndarray, int, Any, float]] = {}
 
     def decide_targets(
         self,
         bars_by_symbol: Mapping[str, pd.DataFrame],
         portfolio_snapshot: PortfolioSnapshot,
     ) -> dict[str, float]:
+        positions = portfolio_snapshot.positions
         targets: dict[str, float] = {}
-        for symbol, bars in sorted(bars_by_symbol.items()):
-            current_qty = float(
-                portfolio_snapshot.positions.get(symbol, Position(symbol=symbol, qty=0)).qty
-            )
-            targets[symbol] = self._target_for_symbol(bars, current_qty)
+        for symbol in symbol_order(bars_by_symbol):
+            current_qty = float(positions[symbol].qty) if symbol in positions else 0.0
+            targets[symbol] = self._target_for_symbol(symbol, bars_by_symbol[symbol], current_qty)
         return targets
 
-    def _target_for_symbol(self, bars: pd.DataFrame, current_qty: float) -> float:
+    def _target_for_symbol(self, symbol: str, bars: pd.DataFrame, current_qty: float) -> float:
         if "close" not in bars.columns:
             raise ValueError("bars must include close column")
         min_rows = self.params.long_window + 1
         if len(bars) < min_rows:
             return current_qty
-        close = bars["close"]
-        short_sma = close.rolling(window=self.params.short_window).mean()
-        long_sma = close.rolling(window=self.params.long_window).mean()
-        current_short = float(short_sma.iloc[-1])
-        current_long = float(long_sma.iloc[-1])
+        current_short, current_long = self._latest_smas(symbol, bars["close"])
         if current_short > current_long:
             return self.params.target_qty
         if current_short < current_long:
             return -self.params.target_qty
         return current_qty
+
+    def _latest_smas(self, symbol: str, close: pd.Series) -> tuple[float, float]:
+        """Latest short/long SMAs, advanced by one bar from the cached state when possible.
+
+        The state replays pandas' rolling-mean accumulators, so results match
+        ``close.rolling(window).mean().iloc[-1]`` bit for bit. Replaying is only worth it
+        compiled; without Numba every call goes through pandas' rolling windows.
+        """
+        short_window = self.params.short_window
+        long_window = self.params.long_window
+        if not NUMBA_AVAILABLE or close.dtype.kind != "f":
+            self._sma_state.pop(symbol, None)
+            short_sma = close.rolling(window=short_window).mean()
+            long_sma = close.rolling(window=long_window).mean()
+            return float(short_sma.iloc[-1]), float(long_sma.iloc[-1])
+
+        values = close.to_numpy(dtype=np.float64, copy=False)
+        length = len(values)
+        state = self._sma_state.get(symbol)
+        if state is not None and _extends_by_one_bar(state, close, values):
+            short_state, long_state = state[0], state[1]
+            advance_rolling_mean(short_state, values, length - 1, short_window)
+            advance_rolling_mean(long_state, values, length - 1, long_window)
+        else:
+            short_state = replay_rolling_mean(values, short_window)
+            long_state = replay_rolling_mean(values, long_window)
+        self._sma_state[symbol] = (
+            short_state,
+            long_state,
+            length,
+            close.index[-1],
+            float(values[-1]),
+        )
+        return (
+            rolling_mean_value(short_state, short_window),
+            rolling_mean_value(long_state, long_window),
+        )
+
+
+def _extends_by_one_bar(
+    state: tuple[np.ndarray, np.ndarray, int, Any, float],
+    close: pd.Series,
+    values: np.ndarray,
+) -> bool:
+    _, _, length, last_label, last_close = state
+    if len(values) != length + 1 or close.index[-2] != last_label:
+        return False
+    previous = float(values[-2])
+    return previous == last_close or (math.isnan(previous) and math.isnan(last_close))
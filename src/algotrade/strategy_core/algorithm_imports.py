@@ -6,16 +6,37 @@ The registry aliases this module to ``AlgorithmImports`` before loading strategi
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+import math
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from types import SimpleNamespace
 from typing import Any
 
+import numpy as np
 import pandas as pd
-
-from algotrade.domain.models import PortfolioSnapshot, Position
-from algotrade.strategy_core.base import Strategy
+from numpy.lib.stride_tricks import sliding_window_view
+
+from algotrade.domain.models import PortfolioSnapshot
+from algotrade.jit import NUMBA_AVAILABLE
+from algotrade.strategy_core.base import Strategy, symbol_order
+from algotrade.strategy_core.closes import last_close
+from algotrade.strategy_core.kernels import (
+    advance_rolling_mean,
+    advance_rsi_states,
+    ema_last_two,
+    ema_step,
+    gains_and_losses,
+    rolling_mean_last_two,
+    rolling_mean_tail,
+    rolling_mean_value,
+)
+
+# Rows scanned back from the end of an indicator series before masking the rest.
+_TAIL_SCAN_ROWS = 8
+# pandas 3 always copies on write; pandas 2 only with ``mode.copy_on_write`` enabled.
+_PANDAS_ALWAYS_COPY_ON_WRITE = int(pd.__version__.split(".", 1)[0]) >= 3
 
 
 class Resolution:
@@ -26,7 +47,7 @@ class Resolution:
     MINUTE = "minute"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _IndicatorPoint:
     value: float
 
@@ -49,7 +70,7 @@ class _IndicatorLine:
         self._current = float(current)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeBar:
     """Latest trade-bar snapshot exposed in ``data.bars``."""
 
@@ -92,7 +113,7 @@ class Slice:
         return self.bars[symbol.strip().upper()]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Holdings:
     qty: float
 
@@ -125,10 +146,27 @@ class Security:
 class _BaseIndicator:
     def __init__(self, symbol: str) -> None:
         self.symbol = symbol.strip().upper()
+        self._length = 0
+        self._last_label: Any = None
+        self._last_value = float("nan")
 
     def update(self, bars_by_symbol: Mapping[str, pd.DataFrame]) -> None:
         raise NotImplementedError
 
+    def _extends_last_update(self, index: pd.Index, values: np.ndarray) -> bool:
+        """Whether ``values`` is the previously seen series plus exactly one new bar."""
+        if not self._length or len(values) != self._length + 1 or index[-2] != self._last_label:
+            return False
+        previous = float(values[-2])
+        return previous == self._last_value or (
+            math.isnan(previous) and math.isnan(self._last_value)
+        )
+
+    def _remember_tail(self, index: pd.Index, values: np.ndarray) -> None:
+        self._length = len(values)
+        self._last_label = index[-1]
+        self._last_value = float(values[-1])
+
 
 class DonchianChannel(_BaseIndicator):
     def __init__(self, symbol: str, upper_period: int, lower_period: int) -> None:
@@ -139,6 +177,8 @@ class DonchianChannel(_BaseIndicator):
         self.lower_period = int(lower_period)
         self.upper_band = _IndicatorLine()
         self.lower_band = _IndicatorLine()
+        self._upper = _SlidingExtreme(self.upper_period, use_max=True)
+        self._lower = _SlidingExtreme(self.lower_period, use_max=False)
 
     def update(self, bars_by_symbol: Mapping[str, pd.DataFrame]) -> None:
         frame = bars_by_symbol.get(self.symbol)
@@ -146,12 +186,8 @@ class DonchianChannel(_BaseIndicator):
             return
         high_source = frame["high"] if "high" in frame.columns else frame["close"]
         low_source = frame["low"] if "low" in frame.columns else frame["close"]
-        high = pd.to_numeric(high_source, errors="coerce")
-        low = pd.to_numeric(low_source, errors="coerce")
-        upper = high.rolling(window=self.upper_period).max()
-        lower = low.rolling(window=self.lower_period).min()
-        upper_prev, upper_cur = _previous_and_current(upper)
-        lower_prev, lower_cur = _previous_and_current(lower)
+        upper_prev, upper_cur = self._upper.update(frame.index, _numeric_values(high_source))
+        lower_prev, lower_cur = self._lower.update(frame.index, _numeric_values(low_source))
         self.upper_band.update(previous=upper_prev, current=upper_cur)
         self.lower_band.update(previous=lower_prev, current=lower_cur)
 
@@ -163,14 +199,27 @@ class SimpleMovingAverage(_BaseIndicator):
         super().__init__(symbol)
         self.period = int(period)
         self.current = _IndicatorLine()
+        self._state = np.zeros(7)
+        self._tail = (float("nan"), float("nan"), 0)
 
     def update(self, bars_by_symbol: Mapping[str, pd.DataFrame]) -> None:
         frame = bars_by_symbol.get(self.symbol)
         if frame is None or frame.empty or "close" not in frame.columns:
             return
-        close = pd.to_numeric(frame["close"], errors="coerce")
-        sma = close.rolling(window=self.period).mean()
-        previous, current = _previous_and_current(sma)
+        values = _numeric_values(frame["close"])
+        # Rolling-mean states are only replayed compiled; uncompiled, pandas' window is faster.
+        if NUMBA_AVAILABLE and self._extends_last_update(frame.index, values):
+            advance_rolling_mean(self._state, values, len(values) - 1, self.period)
+            mean = rolling_mean_value(self._state, self.period)
+            if not math.isnan(mean):
+                self._tail = (self._tail[1], mean, self._tail[2] + 1)
+        elif NUMBA_AVAILABLE:
+            self._tail = rolling_mean_tail(self._state, values, self.period)
+        else:
+            sma = pd.Series(values).rolling(window=self.period).mean()
+            self._tail = _last_two_valid(sma.to_numpy())
+        self._remember_tail(frame.index, values)
+        previous, current = _tail_pair(*self._tail)
         self.current.update(previous=previous, current=current)
 
 
@@ -181,14 +230,29 @@ class ExponentialMovingAverage(_BaseIndicator):
         super().__init__(symbol)
         self.period = int(period)
         self.current = _IndicatorLine()
+        self._alpha = 2.0 / (self.period + 1.0)
+        self._last_ema = float("nan")
 
     def update(self, bars_by_symbol: Mapping[str, pd.DataFrame]) -> None:
         frame = bars_by_symbol.get(self.symbol)
         if frame is None or frame.empty or "close" not in frame.columns:
             return
-        close = pd.to_numeric(frame["close"], errors="coerce")
-        ema = close.ewm(span=self.period, adjust=False).mean()
-        previous, current = _previous_and_current(ema)
+        values = _numeric_values(frame["close"])
+        # Only NaN-free histories are cached; pandas weights bars after a gap differently.
+        if self._extends_last_update(frame.index, values) and not math.isnan(values[-1]):
+            previous = self._last_ema
+            current = ema_step(previous, float(values[-1]), self._alpha)
+        elif NUMBA_AVAILABLE and not np.isnan(values).any():
+            previous, current = ema_last_two(values, self._alpha)
+        else:
+            ema = pd.Series(values).ewm(span=self.period, adjust=False).mean()
+            previous, current = _previous_and_current(ema)
+            if np.isnan(values).any():
+                self._length = 0
+                self.current.update(previous=previous, current=current)
+                return
+        self._last_ema = current
+        self._remember_tail(frame.index, values)
         self.current.update(previous=previous, current=current)
 
 
@@ -199,21 +263,37 @@ class RelativeStrengthIndex(_BaseIndicator):
         super().__init__(symbol)
         self.period = int(period)
         self.current = _IndicatorLine()
+        self._gain_state = np.zeros(7)
+        self._loss_state = np.zeros(7)
+        self._last_rsi = 100.0
 
     def update(self, bars_by_symbol: Mapping[str, pd.DataFrame]) -> None:
         frame = bars_by_symbol.get(self.symbol)
         if frame is None or frame.empty or "close" not in frame.columns:
             return
-        close = pd.to_numeric(frame["close"], errors="coerce")
-        delta = close.diff()
-        gains = delta.clip(lower=0.0)
-        losses = -delta.clip(upper=0.0)
-        avg_gain = gains.rolling(window=self.period).mean()
-        avg_loss = losses.rolling(window=self.period).mean()
-        rs = avg_gain / avg_loss.replace(0.0, pd.NA)
-        rsi = 100.0 - (100.0 / (1.0 + rs))
-        rsi = rsi.fillna(100.0)
-        previous, current = _previous_and_current(rsi)
+        values = _numeric_values(frame["close"])
+        period = self.period
+        extends = len(values) >= period + 2 and self._extends_last_update(frame.index, values)
+        # As for the SMA, states are only replayed and advanced when Numba compiles them.
+        if NUMBA_AVAILABLE and extends:
+            advance_rsi_states(self._gain_state, self._loss_state, values, period)
+            previous = self._last_rsi
+            current = _rsi_value(
+                rolling_mean_value(self._gain_state, period),
+                rolling_mean_value(self._loss_state, period),
+            )
+        else:
+            gains, losses = gains_and_losses(values)
+            if NUMBA_AVAILABLE:
+                prev_gain, cur_gain = rolling_mean_last_two(self._gain_state, gains, period)
+                prev_loss, cur_loss = rolling_mean_last_two(self._loss_state, losses, period)
+            else:
+                prev_gain, cur_gain = _rolling_mean_last_two(gains, period)
+                prev_loss, cur_loss = _rolling_mean_last_two(losses, period)
+            current = _rsi_value(cur_gain, cur_loss)
+            previous = current if len(values) == 1 else _rsi_value(prev_gain, prev_loss)
+        self._last_rsi = current
+        self._remember_tail(frame.index, values)
         self.current.update(previous=previous, current=current)
 
 
@@ -307,9 +387,8 @@ class QCAlgorithm:
         frame = self._bars_by_symbol.get(symbol)
         if frame is None:
             return pd.DataFrame()
-        if bar_count <= 0:
-            return frame.iloc[0:0].copy()
-        return frame.tail(int(bar_count)).copy()
+        tail = frame.iloc[0:0] if bar_count <= 0 else frame.tail(int(bar_count))
+        return tail if _copy_on_write_active() else tail.copy()
 
     def plot(self, chart: str, series: str, value: float) -> None:
         _ = (chart, series, value)
@@ -369,8 +448,11 @@ class QCAlgorithm:
         target_qty_scale: float,
     ) -> None:
         self._target_qty_scale = float(target_qty_scale)
+        # Pasted code may write to these frames; share them only when pandas isolates writes.
+        share_frames = _copy_on_write_active()
         self._bars_by_symbol = {
-            symbol.strip().upper(): frame.copy() for symbol, frame in bars_by_symbol.items()
+            symbol.strip().upper(): frame if share_frames else frame.copy()
+            for symbol, frame in bars_by_symbol.items()
         }
         self._current_positions = {
             symbol.strip().upper(): float(position.qty)
@@ -380,10 +462,9 @@ class QCAlgorithm:
         for symbol, frame in self._bars_by_symbol.items():
             if "close" not in frame.columns or frame.empty:
                 continue
-            close = pd.to_numeric(frame["close"], errors="coerce").dropna()
-            if close.empty:
-                continue
-            self._latest_prices[symbol] = float(close.iloc[-1])
+            latest = last_close(frame)
+            if latest is not None:
+                self._latest_prices[symbol] = latest
         for indicator in self._indicators.values():
             indicator.update(self._bars_by_symbol)
 
@@ -393,12 +474,13 @@ class QCAlgorithm:
         portfolio_snapshot: PortfolioSnapshot,
     ) -> dict[str, float]:
         targets: dict[str, float] = {}
-        symbols = sorted({*bars_by_symbol.keys(), *portfolio_snapshot.positions.keys()})
+        positions = portfolio_snapshot.positions
+        symbols: Sequence[str] = symbol_order(bars_by_symbol)
+        if not positions.keys() <= bars_by_symbol.keys():
+            symbols = sorted({*symbols, *positions})
         for raw_symbol in symbols:
             symbol = raw_symbol.strip().upper()
-            current_qty = float(
-                portfolio_snapshot.positions.get(symbol, Position(symbol=symbol, qty=0)).qty
-            )
+            current_qty = float(positions[symbol].qty) if symbol in positions else 0.0
             targets[symbol] = self._targets.get(symbol, current_qty)
         for symbol, target in sorted(self._targets.items()):
             targets.setdefault(symbol, target)
@@ -475,19 +557,138 @@ class QCAlgorithmStrategyAdapter(Strategy):
 
 
 def _coerce_float(value: Any, default: float | None = None) -> float | None:
-    parsed = pd.to_numeric(pd.Series([value]), errors="coerce").iloc[0]
-    if pd.isna(parsed):
+    if value is None:
+        return default
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
         return default
-    return float(parsed)
+    return default if parsed != parsed else parsed
+
+
+class _SlidingExtreme:
+    """Previous and current rolling max/min of a growing series via a monotonic deque.
+
+    When a series extends the last one by a single bar, the window advances in O(1)
+    amortized time; otherwise it is rebuilt from the last ``period + 1`` values. Missing
+    values in the trailing windows fall back to a vectorized pass over every window, since
+    the previous valid band then lies further back in the series.
+    """
+
+    def __init__(self, period: int, use_max: bool) -> None:
+        self.period = period
+        self.use_max = use_max
+        self._window: deque[tuple[int, float]] = deque()
+        self._length = 0
+        self._last_label: Any = None
+        self._last_value = float("nan")
+        self._current = float("nan")
+
+    def update(self, labels: pd.Index, values: np.ndarray) -> tuple[float, float]:
+        length = len(values)
+        period = self.period
+        if length < period:
+            self._length = 0
+            return 0.0, 0.0
+        if np.isnan(values[-(period + 1) :]).any():
+            # NaN anywhere in a window makes that window NaN, as with ``rolling`` defaults.
+            self._length = 0
+            windows = sliding_window_view(values, period)
+            extremes = windows.max(axis=1) if self.use_max else windows.min(axis=1)
+            return _tail_pair(*_last_two_valid(extremes))
+
+        if (
+            self._length
+            and length == self._length + 1
+            and labels[-2] == self._last_label
+            and values[-2] == self._last_value
+        ):
+            previous = self._current
+        else:
+            self._window.clear()
+            for index in range(max(0, length - period - 1), length - 1):
+                self._push(index, float(values[index]))
+            previous = self._window[0][1] if length > period else float("nan")
+        self._push(length - 1, float(values[-1]))
+        current = self._window[0][1]
+        if length == period:
+            previous = current
+
+        self._length = length
+        self._last_label = labels[-1]
+        self._last_value = float(values[-1])
+        self._current = current
+        return previous, current
+
+    def _push(self, index: int, value: float) -> None:
+        window = self._window
+        if self.use_max:
+            while window and window[-1][1] <= value:
+                window.pop()
+        else:
+            while window and window[-1][1] >= value:
+                window.pop()
+        window.append((index, value))
+        while window[0][0] <= index - self.period:
+            window.popleft()
+
+
+def _copy_on_write_active() -> bool:
+    """Whether writes through a shared frame or slice leave the caller's bars untouched."""
+    return _PANDAS_ALWAYS_COPY_ON_WRITE or pd.get_option("mode.copy_on_write") is True
+
+
+def _numeric_values(column: pd.Series) -> np.ndarray:
+    if column.dtype.kind == "f":
+        return column.to_numpy(dtype=np.float64, copy=False)
+    return pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _tail_pair(previous: float, current: float, found: int) -> tuple[float, float]:
+    if found == 0:
+        return 0.0, 0.0
+    return (current, current) if found == 1 else (previous, current)
+
+
+def _last_two_valid(values: np.ndarray) -> tuple[float, float, int]:
+    """Last two non-NaN values and how many were found, capped at two.
+
+    Indicator outputs are NaN only in warm-up rows and around gaps, so a short scan back
+    from the end usually settles it; longer NaN runs fall back to one vectorized mask.
+    """
+    tail: list[float] = []
+    for index in range(len(values) - 1, max(-1, len(values) - 1 - _TAIL_SCAN_ROWS), -1):
+        value = float(values[index])
+        if value == value:
+            tail.append(value)
+            if len(tail) == 2:
+                return tail[1], tail[0], 2
+    if len(values) > _TAIL_SCAN_ROWS:
+        valid = values[: len(values) - _TAIL_SCAN_ROWS]
+        valid = valid[~np.isnan(valid)][len(tail) - 2 :]
+        tail.extend(float(value) for value in valid[::-1])
+    found = min(len(tail), 2)
+    current = tail[0] if found else float("nan")
+    previous = tail[1] if found > 1 else float("nan")
+    return previous, current, found
+
+
+def _rolling_mean_last_two(values: np.ndarray, window: int) -> tuple[float, float]:
+    """``rolling_mean_last_two`` through pandas' rolling window, for runs without Numba."""
+    means = pd.Series(values).rolling(window=window).mean().to_numpy()
+    previous = float(means[-2]) if len(means) > 1 else float("nan")
+    return previous, float(means[-1])
+
+
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    # Incomplete windows and loss-free windows read as 100, like the pandas ``fillna``.
+    if math.isnan(avg_gain) or math.isnan(avg_loss) or avg_loss == 0.0:
+        return 100.0
+    return 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
 
 
 def _previous_and_current(series: pd.Series) -> tuple[float, float]:
-    numeric = pd.to_numeric(series, errors="coerce").dropna()
-    if numeric.empty:
-        return 0.0, 0.0
-    current = float(numeric.iloc[-1])
-    previous = current if len(numeric) == 1 else float(numeric.iloc[-2])
-    return previous, current
+    return _tail_pair(*_last_two_valid(_numeric_values(series)))
 
 
 __all__ = [
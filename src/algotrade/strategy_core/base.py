@@ -5,6 +5,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
 import pandas as pd
 
@@ -30,4 +32,33 @@ class Strategy(ABC):
         bars_by_symbol: Mapping[str, pd.DataFrame],
         portfolio_snapshot: PortfolioSnapshot,
     ) -> dict[str, float]:
-        """Return target quantities by symbol."""
+        """Return target quantities by symbol.
+
+        The runtime passes ``bars_by_symbol`` in sorted symbol order, so sorting it again is
+        a linear pass; implementations should still not depend on the incoming order.
+        """
+
+
+def symbol_order(bars_by_symbol: Mapping[str, Any]) -> tuple[str, ...]:
+    """Return the mapping's symbols sorted, reusing the result while the key set is unchanged."""
+    return _sorted_symbols(tuple(bars_by_symbol))
+
+
+@lru_cache(maxsize=32)
+def _sorted_symbols(symbols: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(sorted(symbols))
+
+
+@lru_cache(maxsize=128)
+def validate_trade_size_pct(min_trade_size_pct: float, max_trade_size_pct: float) -> None:
+    """Reject invalid trade-size percentage bounds shared by every strategy parameter set.
+
+    Strategies validate their frozen params through ``lru_cache``-wrapped helpers as well, so
+    constructing many strategies from identical params (parameter sweeps) checks them once.
+    """
+    if min_trade_size_pct <= 0 or max_trade_size_pct <= 0:
+        raise ValueError("trade size percentages must be positive")
+    if min_trade_size_pct > max_trade_size_pct:
+        raise ValueError("min_trade_size_pct must be <= max_trade_size_pct")
+    if max_trade_size_pct > 100:
+        raise ValueError("max_trade_size_pct must be <= 100")
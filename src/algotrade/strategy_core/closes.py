@@ -0,0 +1,46 @@
+"""Numeric close-price views shared by strategies."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def close_series(bars: pd.DataFrame) -> pd.Series:
+    """Return numeric closes without missing values.
+
+    Equivalent to ``pd.to_numeric(bars["close"], errors="coerce").dropna()``, but float
+    columns skip the coercion and NaN-free columns are returned without a copy.
+    """
+    column = bars["close"]
+    if column.dtype.kind != "f":
+        return pd.to_numeric(column, errors="coerce").dropna()
+    if column.isna().to_numpy().any():
+        return column.dropna()
+    return column
+
+
+def close_array(bars: pd.DataFrame) -> np.ndarray:
+    """Return numeric closes without missing values as a float64 array."""
+    column = bars["close"]
+    if column.dtype.kind == "f":
+        values = column.to_numpy(dtype=np.float64, copy=False)
+    else:
+        values = pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    missing = np.isnan(values)
+    return values[~missing] if missing.any() else values
+
+
+def last_close(bars: pd.DataFrame) -> float | None:
+    """Return the latest non-missing close, or ``None`` when there is none.
+
+    Matches ``close_array(bars)[-1]`` but only looks at the tail for float columns whose last
+    close is present, which is the usual case.
+    """
+    column = bars["close"]
+    if column.dtype.kind == "f" and len(column):
+        latest = float(column.iat[-1])
+        if latest == latest:
+            return latest
+    closes = close_array(bars)
+    return float(closes[-1]) if closes.size else None
@@ -0,0 +1,201 @@
+"""Compiled indicator kernels shared by strategies.
+
+Rolling means replay pandas' fixed-window ``roll_mean`` accumulators (Kahan-compensated sums,
+sign and repeated-value counts), so they agree bit for bit with ``Series.rolling(w).mean()``
+and can be advanced one bar at a time from a saved state. The EMA kernel follows pandas'
+``adjust=False`` recurrence the same way.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from algotrade.jit import njit
+
+# Slots of a rolling-mean state vector.
+_NOBS, _SUM, _NEG_CT, _COMP_ADD, _COMP_REMOVE, _SAME_CT, _PREV = range(7)
+
+
+@njit(cache=True, nogil=True)
+def _add_mean(state: np.ndarray, value: float) -> None:
+    if value == value:
+        state[_NOBS] += 1
+        y = value - state[_COMP_ADD]
+        total = state[_SUM] + y
+        state[_COMP_ADD] = total - state[_SUM] - y
+        state[_SUM] = total
+        if math.copysign(1.0, value) < 0:
+            state[_NEG_CT] += 1
+        if value == state[_PREV]:
+            state[_SAME_CT] += 1
+        else:
+            state[_SAME_CT] = 1
+        state[_PREV] = value
+
+
+@njit(cache=True, nogil=True)
+def _remove_mean(state: np.ndarray, value: float) -> None:
+    if value == value:
+        state[_NOBS] -= 1
+        y = -value - state[_COMP_REMOVE]
+        total = state[_SUM] + y
+        state[_COMP_REMOVE] = total - state[_SUM] - y
+        state[_SUM] = total
+        if math.copysign(1.0, value) < 0:
+            state[_NEG_CT] -= 1
+
+
+@njit(cache=True, nogil=True)
+def advance_rolling_mean(state: np.ndarray, values: np.ndarray, index: int, window: int) -> None:
+    """Move a rolling-mean state so its window ends at ``values[index]``."""
+    if index == 0 or window == 1:
+        start = max(0, index + 1 - window)
+        state[:] = 0.0
+        state[_PREV] = values[start]
+        for offset in range(start, index + 1):
+            _add_mean(state, values[offset])
+        return
+    if index >= window:
+        _remove_mean(state, values[index - window])
+    _add_mean(state, values[index])
+
+
+@njit(cache=True, nogil=True)
+def replay_rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling-mean state after the window has slid across all of ``values``."""
+    state = np.zeros(7)
+    for index in range(values.shape[0]):
+        advance_rolling_mean(state, values, index, window)
+    return state
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_value(state: np.ndarray, window: int) -> float:
+    """Mean for a full ``window`` (pandas' default ``min_periods``), else NaN."""
+    nobs = state[_NOBS]
+    if nobs < window or nobs <= 0:
+        return math.nan
+    result = float(state[_SUM] / nobs)
+    if state[_SAME_CT] >= nobs:
+        return float(state[_PREV])
+    if state[_NEG_CT] == 0 and result < 0:
+        return 0.0
+    if state[_NEG_CT] == nobs and result > 0:
+        return 0.0
+    return result
+
+
+def rolling_mean_last(values: np.ndarray, window: int) -> float:
+    """Return ``pd.Series(values).rolling(window).mean().iloc[-1]`` without building Series."""
+    return rolling_mean_value(replay_rolling_mean(values, window), window)
+
+
+@njit(cache=True, nogil=True)
+def rsi_states(values: np.ndarray, period: int) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling-mean states of the RSI gains and losses after replaying ``values``."""
+    count = values.shape[0]
+    gains = np.empty(count)
+    losses = np.empty(count)
+    gains[0] = math.nan
+    losses[0] = math.nan
+    for index in range(1, count):
+        delta = values[index] - values[index - 1]
+        gains[index] = 0.0 if delta < 0 else delta
+        losses[index] = -(0.0 if delta > 0 else delta)
+    return replay_rolling_mean(gains, period), replay_rolling_mean(losses, period)
+
+
+@njit(cache=True, nogil=True)
+def rsi_averages(values: np.ndarray, period: int) -> tuple[float, float]:
+    """Latest simple-average gain and loss, equal to ``gains_and_losses`` plus ``rolling``."""
+    gain_state, loss_state = rsi_states(values, period)
+    return rolling_mean_value(gain_state, period), rolling_mean_value(loss_state, period)
+
+
+def advance_rsi_states(
+    gain_state: np.ndarray, loss_state: np.ndarray, values: np.ndarray, period: int
+) -> None:
+    """Move RSI states replayed over ``values[:-1]`` forward by the final bar.
+
+    Needs at least ``period + 2`` values: the trailing ``period + 1`` price changes cover the
+    change leaving the window and the new one.
+    """
+    gains, losses = gains_and_losses(values[-(period + 2) :])
+    advance_rolling_mean(gain_state, gains[1:], period, period)
+    advance_rolling_mean(loss_state, losses[1:], period, period)
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_last_two(
+    state: np.ndarray, values: np.ndarray, window: int
+) -> tuple[float, float]:
+    """Replay ``values`` into ``state`` and return the rolling means at the final two rows.
+
+    Rows with an incomplete window read as NaN.
+    """
+    state[:] = 0.0
+    previous = math.nan
+    current = math.nan
+    for index in range(values.shape[0]):
+        advance_rolling_mean(state, values, index, window)
+        previous = current
+        current = rolling_mean_value(state, window)
+    return previous, current
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_tail(
+    state: np.ndarray, values: np.ndarray, window: int
+) -> tuple[float, float, int]:
+    """Replay ``values`` into ``state``; return the last two non-NaN means and their count."""
+    state[:] = 0.0
+    previous = math.nan
+    current = math.nan
+    found = 0
+    for index in range(values.shape[0]):
+        advance_rolling_mean(state, values, index, window)
+        value = rolling_mean_value(state, window)
+        if not math.isnan(value):
+            previous = current
+            current = value
+            found += 1
+    return previous, current, found
+
+
+@njit(cache=True, nogil=True)
+def ema_last_two(values: np.ndarray, alpha: float) -> tuple[float, float]:
+    """Final two values of ``Series.ewm(alpha=alpha, adjust=False).mean()``.
+
+    Expects NaN-free ``values``; pandas' weighting after missing rows is not reproduced.
+    """
+    decay = 1.0 - alpha
+    weighted = values[0]
+    previous = weighted
+    for index in range(1, values.shape[0]):
+        value = values[index]
+        previous = weighted
+        if weighted != value:
+            weighted = (decay * weighted + alpha * value) / (decay + alpha)
+    return previous, weighted
+
+
+def ema_step(previous: float, value: float, alpha: float) -> float:
+    """One ``adjust=False`` EMA update, bit-identical to the compiled recurrences."""
+    if previous == value:
+        return previous
+    decay = 1.0 - alpha
+    return (decay * previous + alpha * value) / (decay + alpha)
+
+
+def gains_and_losses(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Bar-to-bar gains and losses, equal to pandas' ``diff``/``clip`` chain used for RSI.
+
+    Signed zeros are kept as pandas produces them (losses are ``-clip(upper=0)``), since the
+    rolling-mean sign counts depend on them. The first row is NaN in both arrays.
+    """
+    delta = np.empty_like(values)
+    delta[0] = np.nan
+    np.subtract(values[1:], values[:-1], out=delta[1:])
+    return np.where(delta < 0, 0.0, delta), -np.where(delta > 0, 0.0, delta)
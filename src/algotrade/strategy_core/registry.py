@@ -69,23 +69,26 @@ def _resolved_strategy_id(module_name: str, candidate: type[Strategy]) -> str |
     return normalized_module_name
 
 
-def _default_params_for(
+def _default_params_factory(
     module: ModuleType,
     strategy_id: str,
-) -> object | None:
+) -> Callable[[], object] | None:
     canonical_name = f"default_{_normalize_strategy_id(strategy_id)}_params"
-    candidate = getattr(module, canonical_name, None)
+    namespace = vars(module)
+    candidate = namespace.get(canonical_name)
     if callable(candidate):
-        return candidate()
-
-    fallbacks: list[Callable[[], object]] = []
-    for name, function in inspect.getmembers(module, inspect.isfunction):
-        if function.__module__ != module.__name__:
-            continue
-        if name.startswith("default_") and name.endswith("_params"):
-            fallbacks.append(function)
+        return candidate
+
+    fallbacks = [
+        function
+        for name, function in namespace.items()
+        if name.startswith("default_")
+        and name.endswith("_params")
+        and inspect.isfunction(function)
+        and function.__module__ == module.__name__
+    ]
     if len(fallbacks) == 1:
-        return fallbacks[0]()
+        return fallbacks[0]
     return None
 
 
@@ -95,49 +98,65 @@ def _ensure_algorithm_imports_alias() -> None:
     sys.modules["AlgorithmImports"] = algorithm_imports
 
 
-def _build_strategy(
+def _compile_strategy_factory(
     strategy_type: type[Strategy],
     module: ModuleType,
-    settings: Settings,
     strategy_id: str,
-) -> Strategy:
+) -> StrategyFactory:
+    """Resolve the constructor call pattern once so building a strategy needs no reflection.
+
+    Configuration problems are reported when the factory is called, not at discovery, so one
+    misconfigured module does not hide the other strategies.
+    """
     signature = inspect.signature(strategy_type)
-    kwargs: dict[str, object] = {}
-    args: list[object] = []
+    # (parameter name, positional-only) in signature order, for "settings" and "params".
+    bindings: list[tuple[str, bool]] = []
+    params_factory: Callable[[], object] | None = None
+    error: str | None = None
 
     for parameter in signature.parameters.values():
         if parameter.kind in {inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD}:
             continue
 
+        positional = parameter.kind == inspect.Parameter.POSITIONAL_ONLY
         if parameter.name == "settings":
-            if parameter.kind == inspect.Parameter.POSITIONAL_ONLY:
-                args.append(settings)
-            else:
-                kwargs["settings"] = settings
+            bindings.append(("settings", positional))
             continue
 
         if parameter.name == "params":
             if parameter.default is not inspect.Signature.empty:
                 continue
-            params_object = _default_params_for(module, strategy_id)
-            if params_object is None:
-                raise ValueError(
+            params_factory = _default_params_factory(module, strategy_id)
+            if params_factory is None:
+                error = (
                     f"Strategy '{strategy_id}' requires params but no "
                     "default_*_params() function was found."
                 )
-            if parameter.kind == inspect.Parameter.POSITIONAL_ONLY:
-                args.append(params_object)
-            else:
-                kwargs["params"] = params_object
+                break
+            bindings.append(("params", positional))
             continue
 
         if parameter.default is inspect.Signature.empty:
-            raise ValueError(
+            error = (
                 f"Strategy '{strategy_id}' has unsupported required "
                 f"constructor parameter '{parameter.name}'."
             )
+            break
+
+    def factory(settings: Settings) -> Strategy:
+        if error is not None:
+            raise ValueError(error)
+        args: list[object] = []
+        kwargs: dict[str, object] = {}
+        for name, positional in bindings:
+            value = settings if name == "settings" else params_factory()
+            if positional:
+                args.append(value)
+            else:
+                kwargs[name] = value
+        return strategy_type(*args, **kwargs)
 
-    return strategy_type(*args, **kwargs)
+    return factory
 
 
 def _strategy_types_in_module(module: ModuleType) -> list[tuple[type[Strategy], str]]:
@@ -194,15 +213,7 @@ def _discover_registry() -> tuple[dict[str, StrategyFactory], dict[str, str]]:
             if strategy_id in registry:
                 raise ValueError(f"Duplicate strategy id discovered: '{strategy_id}'")
 
-            def factory(
-                settings: Settings,
-                strategy_cls: type[Strategy] = strategy_type,
-                strategy_module: ModuleType = module,
-                resolved_id: str = strategy_id,
-            ) -> Strategy:
-                return _build_strategy(strategy_cls, strategy_module, settings, resolved_id)
-
-            registry[strategy_id] = factory
+            registry[strategy_id] = _compile_strategy_factory(strategy_type, module, strategy_id)
         if discovered_strategy_types:
             continue
 
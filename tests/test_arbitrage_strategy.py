@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from algotrade.strategies.arbitrage import ArbitrageParams, ArbitrageStrategy, _aligned_values
+
+
+def _closes(closes: list[float]) -> pd.Series:
+    index = pd.date_range("2025-01-01", periods=len(closes), freq="D", tz="UTC")
+    return pd.Series(closes, index=index, name="close")
+
+
+def _pandas_zscore(closes_a: list[float], closes_b: list[float], lookback: int) -> float:
+    ratio = pd.Series(closes_a) / pd.Series(closes_b)
+    with np.errstate(divide="ignore"):
+        spread = np.log(ratio.replace([np.inf, -np.inf], np.nan).dropna())
+    window = spread.iloc[-lookback:]
+    return (float(spread.iloc[-1]) - float(window.mean())) / float(window.std(ddof=0))
+
+
+def test_spread_zscore_matches_pandas_window_statistics() -> None:
+    closes_a = [100.0, 101.0, 99.5, 102.0, 0.0, 103.0, 104.5, 101.0, 100.0, 106.0]
+    closes_b = [50.0, 50.5, 50.0, 0.0, 51.0, 51.0, 51.5, 52.0, 51.0, 50.0]
+    strategy = ArbitrageStrategy(ArbitrageParams(lookback_bars=4))
+
+    zscore = strategy._spread_zscore(_closes(closes_a), _closes(closes_b))
+
+    assert zscore is not None
+    assert abs(zscore - _pandas_zscore(closes_a, closes_b, 4)) < 1e-12
+
+
+def test_spread_zscore_is_undefined_for_flat_or_short_spreads() -> None:
+    strategy = ArbitrageStrategy(ArbitrageParams(lookback_bars=3))
+
+    assert strategy._spread_zscore(_closes([2.0] * 5), _closes([1.0] * 5)) is None
+    assert strategy._spread_zscore(_closes([2.0, 3.0, 4.0]), _closes([1.0, 1.0, 1.0])) is None
+
+
+def test_pick_pair_returns_first_two_usable_symbols_with_closes() -> None:
+    strategy = ArbitrageStrategy(ArbitrageParams(lookback_bars=2))
+    bars_by_symbol = {
+        "CCC": pd.DataFrame({"close": [1.0, 2.0, 3.0]}),
+        "AAA": pd.DataFrame({"close": [1.0, np.nan, 2.0]}),
+        "BBB": pd.DataFrame({"close": [4.0, 5.0, 6.0, 7.0]}),
+        "DDD": pd.DataFrame({"close": [8.0, 9.0, 10.0]}),
+    }
+
+    pair = strategy._pick_pair(bars_by_symbol)
+
+    assert pair is not None
+    symbol_a, symbol_b, close_a, close_b = pair
+    assert (symbol_a, symbol_b) == ("BBB", "CCC")
+    assert close_a.tolist() == [4.0, 5.0, 6.0, 7.0]
+    assert close_b.tolist() == [1.0, 2.0, 3.0]
+
+
+def test_spread_zscore_aligns_mismatched_indexes() -> None:
+    closes_a = [100.0, 101.0, 99.5, 102.0, 103.0, 101.0]
+    closes_b = [50.0, 50.5, 50.0, 51.0, 51.5, 50.0]
+    strategy = ArbitrageStrategy(ArbitrageParams(lookback_bars=3))
+    shifted_b = pd.concat([_closes([49.0]), _closes(closes_b).shift(1, freq="D")])
+
+    zscore = strategy._spread_zscore(_closes(closes_a), shifted_b)
+
+    expected = _pandas_zscore(closes_a[1:], closes_b[:-1], 3)
+    assert zscore is not None
+    assert abs(zscore - expected) < 1e-12
+
+
+def test_aligned_values_match_inner_concat_for_sorted_and_unsorted_indexes() -> None:
+    close_a = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0], index=[1, 3, 4, 7, 9])
+    close_b = pd.Series([10.0, 30.0, 40.0, 90.0], index=[0, 3, 4, 9])
+    shuffled_b = close_b.iloc[[2, 0, 3, 1]]
+
+    for right in (close_b, shuffled_b):
+        aligned = pd.concat([close_a, right], axis=1, join="inner")
+        values_a, values_b = _aligned_values(close_a, right)
+        np.testing.assert_array_equal(values_a, aligned.iloc[:, 0].to_numpy())
+        np.testing.assert_array_equal(values_b, aligned.iloc[:, 1].to_numpy())
+
+
+def test_spread_zscore_skips_infinite_ratios_inside_window() -> None:
+    closes_a = [100.0, 101.0, 99.5, 102.0, 103.0, 104.5, 101.0, 100.0, 106.0]
+    closes_b = [50.0, 50.5, 50.0, 51.0, 51.5, 0.0, 52.0, 0.0, 50.0]
+    strategy = ArbitrageStrategy(ArbitrageParams(lookback_bars=4))
+
+    zscore = strategy._spread_zscore(_closes(closes_a), _closes(closes_b))
+
+    assert zscore is not None
+    assert abs(zscore - _pandas_zscore(closes_a, closes_b, 4)) < 1e-12
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pandas as pd
 
+from algotrade import runtime
 from algotrade.config import Settings
 from algotrade.domain.models import (
     OrderReceipt,
@@ -11,6 +14,8 @@ from algotrade.domain.models import (
     Position,
 )
 from algotrade.runtime import (
+    build_bars_by_symbol,
+    build_client_order_id,
     build_latest_prices,
     compute_equity_metrics,
     extract_receipt_price_details,
@@ -20,6 +25,8 @@ from algotrade.runtime import (
     serialize_portfolio,
     serialize_positions,
     serialize_receipts,
+    strategy_diagnostic_lookback_bars,
+    strategy_warmup_bars,
     summarize_decision_details,
 )
 from algotrade.strategies.scalping import ScalpingParams, ScalpingStrategy
@@ -116,6 +123,18 @@ def test_build_latest_prices_and_equity_metrics() -> None:
     prices = build_latest_prices({"SPY": bars})
     assert prices == {"SPY": 101.0}
 
+    mixed = build_latest_prices(
+        {
+            "QQQ": pd.DataFrame({"close": [50.1234567]}),
+            "EMPTY": pd.DataFrame({"close": []}),
+            "NOCLOSE": pd.DataFrame({"open": [1.0]}),
+            "RAW": [1.0, 2.0],
+            "AAPL": bars,
+        }
+    )
+    assert list(mixed) == ["AAPL", "QQQ"]
+    assert mixed == {"AAPL": 101.0, "QQQ": 50.123457}
+
     run_metrics: dict[str, float | None] = {"start_equity": None, "previous_equity": None}
     first = compute_equity_metrics(run_metrics, equity=1000.0)
     second = compute_equity_metrics(run_metrics, equity=1010.0)
@@ -134,7 +153,8 @@ def test_extract_receipt_price_details() -> None:
         client_order_id="cid-2",
         raw={
             "filled_avg_price": "100.5",
-            "limit_price": "101.2",
+            "limit_price": " 101.2 ",
+            "stop_price": "None",
             "submitted_at": "2026-02-17T18:00:00Z",
         },
     )
@@ -203,6 +223,52 @@ def test_resolve_target_quantities_uses_strategy_trade_size_percent_bounds() ->
     assert targets == {"BTCUSD": 0.002}
 
 
+def test_resolve_target_quantities_zeroes_unpriced_and_sub_minimum_targets() -> None:
+    settings = Settings(
+        order_sizing_method="notional",
+        order_notional_usd=100.0,
+        min_trade_qty=0.001,
+        qty_precision=6,
+    )
+    targets = resolve_target_quantities(
+        signal_targets={"SPY": 1.0, "QQQ": -1.0, "BTCUSD": 1.0},
+        latest_prices={"SPY": 400.0, "BTCUSD": 500_000.0},
+        settings=settings,
+    )
+
+    assert targets == {"BTCUSD": 0.0, "QQQ": 0.0, "SPY": 0.25}
+
+    units = resolve_target_quantities(
+        signal_targets={"SPY": -2.1234567, "QQQ": 0.0004},
+        latest_prices={},
+        settings=settings.with_overrides(order_sizing_method="units"),
+    )
+
+    assert units == {"QQQ": 0.0, "SPY": -2.123457}
+
+
+def test_strategy_lookback_helpers_read_params_periods() -> None:
+    strategy = ScalpingStrategy(ScalpingParams(slow_ema_period=20, rsi_period=14))
+    assert strategy_diagnostic_lookback_bars(strategy) == 20
+    assert strategy_warmup_bars(strategy) == 21
+
+    class _SlottedParams:
+        __slots__ = ("lookback_bars",)
+
+        def __init__(self) -> None:
+            self.lookback_bars = 30
+
+    slotted = SimpleNamespace(params=_SlottedParams())
+    assert strategy_diagnostic_lookback_bars(slotted) == 30
+    assert strategy_warmup_bars(slotted) == 31
+    assert strategy_warmup_bars(SimpleNamespace()) == 2
+
+    class _ClassDefaults:
+        lookback_bars = 50
+
+    assert strategy_warmup_bars(SimpleNamespace(params=_ClassDefaults())) == 51
+
+
 class _DeclaredSymbolStub:
     def __init__(self, symbols: list[str]) -> None:
         self._symbols = symbols
@@ -225,3 +291,60 @@ def test_resolve_strategy_symbols_merges_when_overlap_exists() -> None:
     symbols = resolve_strategy_symbols(["SPY", "QQQ"], strategy)
 
     assert symbols == ["SPY", "QQQ", "XOM"]
+
+
+def test_build_bars_by_symbol_preserves_symbol_order_with_workers() -> None:
+    class StubProvider:
+        def get_bars(self, symbol: str) -> pd.DataFrame:
+            return pd.DataFrame({"close": [float(len(symbol))]})
+
+    symbols = ["SPY", "QQQ", "AAPL", "BTCUSD"]
+    serial = build_bars_by_symbol(symbols, StubProvider())
+    parallel = build_bars_by_symbol(symbols, StubProvider(), max_workers=4)
+
+    assert list(serial) == symbols
+    assert list(parallel) == symbols
+    assert {symbol: float(bars["close"].iloc[-1]) for symbol, bars in parallel.items()} == {
+        "SPY": 3.0,
+        "QQQ": 3.0,
+        "AAPL": 4.0,
+        "BTCUSD": 6.0,
+    }
+
+
+def test_build_client_order_id_has_random_hex_suffix() -> None:
+    first = build_client_order_id("0123456789abcdef", 2, "spy")
+    second = build_client_order_id("0123456789abcdef", 2, "spy")
+
+    prefix, suffix = first.rsplit("-", 1)
+    assert prefix == "0123456789-SPY-2"
+    assert len(suffix) == 8
+    int(suffix, 16)
+    assert first != second
+
+
+def test_summarize_decision_details_skips_returns_from_zero_closes() -> None:
+    bars = pd.DataFrame({"close": [100.0, 0.0, 99.5, 101.25]})
+
+    details = summarize_decision_details(bars, lookback_bars=2, target_qty=1.0, current_qty=0.0)
+
+    assert details["close"] == 101.25
+    assert details["ret_1"] == round((101.25 - 99.5) / 99.5, 6)
+    assert "ret_lb" not in details
+
+
+def test_symbols_in_order_sorts_once_per_universe() -> None:
+    first = runtime.symbols_in_order(("SPY", "AAPL", "MSFT"))
+
+    assert first == ("AAPL", "MSFT", "SPY")
+    assert runtime.symbols_in_order(("SPY", "AAPL", "MSFT")) is first
+
+
+def test_in_symbol_order_reuses_sorted_mappings() -> None:
+    ordered = {"AAPL": 1.0, "MSFT": 2.0}
+    unordered = {"MSFT": 2.0, "AAPL": 1.0}
+
+    assert runtime.in_symbol_order(ordered) is ordered
+    assert runtime.in_symbol_order(ordered, copy=True) == ordered
+    assert runtime.in_symbol_order(ordered, copy=True) is not ordered
+    assert list(runtime.in_symbol_order(unordered)) == ["AAPL", "MSFT"]
@@ -11,6 +11,7 @@ ENV_KEYS = [
     "CYCLES",
     "INTERVAL_SECONDS",
     "POLLING_INTERVAL_SECONDS",
+    "PARALLEL_FETCH_WORKERS",
 ]
 
 
@@ -90,3 +91,17 @@ def test_from_env_rejects_non_positive_backtest_max_steps(
 
     with pytest.raises(ValueError, match="backtest_max_steps must be positive"):
         Settings.from_env()
+
+
+def test_from_env_parses_parallel_fetch_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("algotrade.config.load_dotenv", lambda *args, **kwargs: None)
+    _clear_env(monkeypatch)
+
+    assert Settings.from_env().parallel_fetch_workers == 1
+
+    monkeypatch.setenv("PARALLEL_FETCH_WORKERS", "8")
+    assert Settings.from_env().parallel_fetch_workers == 8
+
+    monkeypatch.setenv("PARALLEL_FETCH_WORKERS", "0")
+    with pytest.raises(ValueError, match="parallel_fetch_workers must be positive"):
+        Settings.from_env()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from algotrade.domain.models import PortfolioSnapshot
+from algotrade.strategies.cross_sectional_momentum import (
+    CrossSectionalMomentumParams,
+    CrossSectionalMomentumStrategy,
+)
+
+SNAPSHOT = PortfolioSnapshot(cash=0.0, equity=0.0, buying_power=0.0)
+
+
+def _bars(closes: list[float]) -> pd.DataFrame:
+    return pd.DataFrame({"close": closes})
+
+
+def test_momentum_ranks_winners_and_losers_skipping_missing_closes() -> None:
+    strategy = CrossSectionalMomentumStrategy(
+        CrossSectionalMomentumParams(lookback_bars=2, top_k=2, allow_short=True)
+    )
+
+    targets = strategy.decide_targets(
+        {
+            "AAA": _bars([100.0, 101.0, 120.0]),
+            "BBB": _bars([100.0, np.nan, 99.0, 90.0]),
+            "CCC": _bars([50.0, 60.0, 55.0]),
+            "DDD": _bars([10.0, 11.0, 10.0]),
+            "EEE": _bars([0.0, 5.0, 6.0]),
+            "FFF": _bars([1.0, 2.0]),
+        },
+        SNAPSHOT,
+    )
+
+    assert targets == {
+        "AAA": 1.0,
+        "BBB": -1.0,
+        "CCC": 1.0,
+        "DDD": -1.0,
+        "EEE": 0.0,
+        "FFF": 0.0,
+    }
+
+
+def test_momentum_breaks_score_ties_by_symbol() -> None:
+    strategy = CrossSectionalMomentumStrategy(
+        CrossSectionalMomentumParams(lookback_bars=1, top_k=1, allow_short=True)
+    )
+
+    targets = strategy.decide_targets(
+        {"YYY": _bars([10.0, 10.0]), "XXX": _bars([10.0, 10.0]), "ZZZ": _bars([10.0, 10.0])},
+        SNAPSHOT,
+    )
+
+    assert targets == {"XXX": -1.0, "YYY": 0.0, "ZZZ": 1.0}
+
+
+def test_momentum_scores_skip_missing_closes() -> None:
+    strategy = CrossSectionalMomentumStrategy(
+        CrossSectionalMomentumParams(lookback_bars=2, top_k=1, allow_short=True)
+    )
+    bars_by_symbol = {
+        "AAA": _bars([100.0, np.nan, 101.0, 120.0]),
+        "BBB": _bars([100.0, 99.0, 90.0]),
+        "CCC": _bars([50.0, 60.0]),
+    }
+
+    targets = strategy.decide_targets(bars_by_symbol, SNAPSHOT)
+
+    assert targets == {"AAA": 1.0, "BBB": -1.0, "CCC": 0.0}
@@ -164,3 +164,31 @@ def test_csv_provider_reports_fallback_error_once(tmp_path: Path) -> None:
         provider.get_bars("BTCUSD")
 
     assert calls["count"] == 1
+
+
+def test_csv_provider_shares_parsed_bars_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "SPY.csv"
+    _write_csv(path)
+    reads: list[str] = []
+    original_read_csv = pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        reads.append(str(args[0]))
+        return original_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr("algotrade.data.csv_data.pd.read_csv", counting_read_csv)
+
+    first = CsvDataProvider(data_dir=str(tmp_path)).get_bars("SPY")
+    second = CsvDataProvider(data_dir=str(tmp_path)).get_bars("SPY")
+    assert len(reads) == 1
+    assert float(second["close"].iloc[-1]) == float(first["close"].iloc[-1])
+
+    frame = original_read_csv(path)
+    frame.loc[len(frame)] = ["2025-01-05", 104.0, 105.0, 103.0, 104.5, 1400.0]
+    frame.to_csv(path, index=False)
+
+    third = CsvDataProvider(data_dir=str(tmp_path)).get_bars("SPY")
+    assert len(reads) == 2
+    assert len(third) == 5
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from algotrade.domain.events import TradeEvent
+from algotrade.logging import event_sink
+from algotrade.logging.event_sink import AsyncJsonlEventSink, JsonlEventSink, load_events
+
+
+def test_event_sink_emit_many_appends_events_in_order(tmp_path) -> None:
+    sink = JsonlEventSink(str(tmp_path / "events.jsonl"))
+    sink.emit_many([])
+    assert not sink.path.exists()
+
+    sink.emit(TradeEvent("run-1", "backtest", "scalping", "cycle_started"))
+    sink.emit_many(
+        [
+            TradeEvent("run-1", "backtest", "scalping", "decision", {"symbol": "BTCUSD"}),
+            TradeEvent("run-1", "backtest", "scalping", "order_intent"),
+        ]
+    )
+
+    events = load_events(sink.path)
+    assert [event["event_type"] for event in events] == [
+        "cycle_started",
+        "decision",
+        "order_intent",
+    ]
+    assert events[1]["payload"] == {"symbol": "BTCUSD"}
+
+
+def test_event_records_encode_identically_with_and_without_orjson(monkeypatch) -> None:
+    record = {"b": [float("nan"), 1.5, float("-inf")], "a": "caf\u00e9", "c": {"d": None}}
+    expected = '{"a":"caf\u00e9","b":[null,1.5,null],"c":{"d":null}}'.encode()
+
+    encoded = event_sink._encode_record(record)
+    monkeypatch.setattr(event_sink, "_orjson", None)
+
+    assert encoded == expected
+    assert event_sink._encode_record(record) == expected
+
+
+def test_async_event_sink_writes_in_order_and_drains_on_close(tmp_path) -> None:
+    sink = AsyncJsonlEventSink(str(tmp_path / "events.jsonl"))
+    sink.emit(TradeEvent("run-1", "live", "scalping", "run_started"))
+    sink.emit_many(
+        [
+            TradeEvent("run-1", "live", "scalping", "decision", {"index": index})
+            for index in range(50)
+        ]
+    )
+    sink.flush()
+    assert len(load_events(sink.path)) == 51
+
+    sink.emit(TradeEvent("run-1", "live", "scalping", "cycle_summary"))
+    sink.close()
+    sink.close()
+    sink.emit(TradeEvent("run-1", "live", "scalping", "error"))
+
+    events = load_events(sink.path)
+    assert [event["event_type"] for event in events[:2]] == ["run_started", "decision"]
+    assert [event["payload"].get("index") for event in events[1:51]] == list(range(50))
+    assert [event["event_type"] for event in events[-2:]] == ["cycle_summary", "error"]
+
+
+def test_async_event_sink_completes_partial_vectored_writes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    real_write = os.write
+
+    def short_writev(fd: int, chunks: list[bytes]) -> int:
+        # Simulate the kernel accepting only part of the first buffer.
+        return real_write(fd, chunks[0][:5])
+
+    monkeypatch.setattr(os, "writev", short_writev, raising=False)
+    sink = AsyncJsonlEventSink(str(tmp_path / "events.jsonl"))
+    sink.emit_many([TradeEvent("run-1", "live", "scalping", "decision", {"index": 0})])
+    sink.emit(TradeEvent("run-1", "live", "scalping", "cycle_summary"))
+    sink.close()
+
+    events = load_events(sink.path)
+    assert [event["event_type"] for event in events] == ["decision", "cycle_summary"]
+
+
+def test_async_event_sink_surfaces_write_errors_without_hanging(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    def failing_write_chunks(fd: int, chunks: list[bytes]) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(event_sink, "_write_chunks", failing_write_chunks)
+    sink = AsyncJsonlEventSink(str(tmp_path / "events.jsonl"))
+    sink.emit(TradeEvent("run-1", "live", "scalping", "decision"))
+
+    with pytest.raises(OSError, match="disk full"):
+        sink.flush()
+    sink.flush()
+
+    sink.emit(TradeEvent("run-1", "live", "scalping", "cycle_summary"))
+    with pytest.raises(OSError, match="disk full"):
+        sink.close()
+    assert not sink._writer.is_alive()
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from algotrade.domain.models import OrderSide, PortfolioSnapshot, Position, RiskLimits
+import numpy as np
+
+from algotrade.domain.models import (
+    OrderRequest,
+    OrderSide,
+    PortfolioSnapshot,
+    Position,
+    RiskLimits,
+)
+from algotrade.execution import sizing
 from algotrade.execution.engine import apply_risk_gates, compute_orders
 
 
@@ -107,6 +116,23 @@ def test_compute_orders_handles_fractional_deltas() -> None:
     assert orders[0].qty == 0.998
 
 
+def test_compute_orders_only_emits_symbols_with_tradeable_deltas() -> None:
+    orders = compute_orders(
+        current_positions={
+            "AAPL": Position(symbol="AAPL", qty=5),
+            "MSFT": Position(symbol="MSFT", qty=2),
+            "TSLA": Position(symbol="TSLA", qty=1.00000001),
+        },
+        targets={"TSLA": 1.0, "MSFT": 2.0, "NVDA": 3.0, "AAPL": 1.0},
+        default_order_type="market",
+    )
+
+    assert [(order.symbol, order.side, order.qty) for order in orders] == [
+        ("AAPL", OrderSide.SELL, 4.0),
+        ("NVDA", OrderSide.BUY, 3.0),
+    ]
+
+
 def test_compute_orders_truncates_fractional_qty_to_avoid_oversell() -> None:
     orders = compute_orders(
         current_positions={"BTCUSD": Position(symbol="BTCUSD", qty=0.001035924)},
@@ -118,3 +144,47 @@ def test_compute_orders_truncates_fractional_qty_to_avoid_oversell() -> None:
     assert len(orders) == 1
     assert orders[0].side is OrderSide.SELL
     assert orders[0].qty == 0.001035
+
+
+def test_bounded_notional_quantities_matches_numpy_fallback(monkeypatch) -> None:
+    signals = np.array([2.0, -0.5, 0.0, 1.0, 1e-13])
+    prices = np.array([50_000.0, 100.0, 10.0, 0.0, 20.0])
+    kwargs = {"equity": 100_000.0, "min_fraction": 0.0005, "max_fraction": 0.001}
+
+    compiled = sizing.bounded_notional_quantities(signals, prices, signal_cap=2.0, **kwargs)
+    monkeypatch.setattr(sizing, "NUMBA_AVAILABLE", False)
+    fallback = sizing.bounded_notional_quantities(signals, prices, signal_cap=2.0, **kwargs)
+
+    np.testing.assert_allclose(compiled, fallback)
+    np.testing.assert_allclose(fallback, [0.002, -0.625, 0.0, 0.0, 2.5])
+
+
+def test_order_request_symbol_key_is_normalized_and_ignored_for_equality() -> None:
+    order = OrderRequest(symbol=" btcusd ", qty=1, side=OrderSide.BUY)
+
+    assert order.symbol_key == "BTCUSD"
+    assert order == OrderRequest(symbol=" btcusd ", qty=1, side=OrderSide.BUY)
+
+
+def test_order_request_with_client_order_id_copies_fields() -> None:
+    order = OrderRequest(
+        symbol="SPY",
+        qty=2.5,
+        side=OrderSide.SELL,
+        order_type="limit",
+        time_in_force="gtc",
+    )
+
+    tagged = order.with_client_order_id("run-0-SPY")
+
+    assert tagged.client_order_id == "run-0-SPY"
+    assert tagged.symbol_key == "SPY"
+    assert tagged == OrderRequest(
+        symbol="SPY",
+        qty=2.5,
+        side=OrderSide.SELL,
+        order_type="limit",
+        time_in_force="gtc",
+        client_order_id="run-0-SPY",
+    )
+    assert order.client_order_id is None
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from types import SimpleNamespace
 
+import pandas as pd
 import pytest
 
 from algotrade import runtime
+from algotrade.brokers.backtest_broker import BacktestBroker
 from algotrade.config import Settings
-from algotrade.domain.models import PortfolioSnapshot
+from algotrade.domain.models import PortfolioSnapshot, Position
+from algotrade.logging.event_sink import JsonlEventSink, load_events
 
 
 @dataclass
@@ -38,15 +42,23 @@ class StubEventSink:
     def __init__(self, path: str) -> None:
         self.path = path
         self.events: list[object] = []
+        self.closed = False
 
     def emit(self, event: object) -> None:
         self.events.append(event)
 
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
 
 class StubLogger:
     def __init__(self) -> None:
         self.pnl_calls: list[tuple[float, float, float, float | None]] = []
         self.progress_calls: list[tuple[int, int, float, float, float | None]] = []
+        self.errors: list[str] = []
 
     def run_started(
         self,
@@ -67,7 +79,7 @@ class StubLogger:
         self.pnl_calls.append((equity, pnl, pnl_pct, start_equity))
 
     def error(self, message: str) -> None:
-        _ = message
+        self.errors.append(message)
 
     def backtest_progress(
         self,
@@ -103,7 +115,7 @@ def _patch_runtime_dependencies(
     monkeypatch.setattr(runtime, "build_data_provider", lambda _settings, _strategy: object())
     monkeypatch.setattr(runtime, "build_broker", lambda _settings: broker)
     monkeypatch.setattr(runtime, "build_state_store", lambda _settings: state_store)
-    monkeypatch.setattr(runtime, "JsonlEventSink", StubEventSink)
+    monkeypatch.setattr(runtime, "AsyncJsonlEventSink", StubEventSink)
     monkeypatch.setattr(runtime, "generate_plotly_report", lambda _events, _report: None)
     monkeypatch.setattr(
         runtime,
@@ -230,3 +242,312 @@ def test_run_backtest_respects_step_cap_and_logs_progress(
     assert len(logger_instances) == 1
     assert logger_instances[0].progress_calls
     assert logger_instances[0].progress_calls[-1][0:2] == (3, 3)
+
+
+def test_run_renders_report_off_main_thread_and_waits_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    broker = StubBroker(equity=1000.0)
+    state_store = StubStateStore()
+    logger_instances: list[StubLogger] = []
+    _patch_runtime_dependencies(
+        monkeypatch,
+        broker=broker,
+        state_store=state_store,
+        logger_instances=logger_instances,
+    )
+    monkeypatch.setattr(runtime, "execute_cycle", lambda **_kwargs: None)
+    report_threads: list[str] = []
+
+    def fake_report(_events: str, _report: str) -> None:
+        report_threads.append(threading.current_thread().name)
+
+    monkeypatch.setattr(runtime, "generate_plotly_report", fake_report)
+
+    exit_code = runtime.run(
+        Settings(
+            mode="backtest",
+            strategy="scalping",
+            symbols=["BTCUSD"],
+            backtest_max_steps=1,
+            events_dir=str(tmp_path),
+        )
+    )
+
+    assert exit_code == 0
+    assert state_store.closed is True
+    assert len(report_threads) == 1
+    assert report_threads[0] != threading.main_thread().name
+
+
+def test_run_skips_report_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    broker = StubBroker(equity=1000.0)
+    state_store = StubStateStore()
+    _patch_runtime_dependencies(
+        monkeypatch,
+        broker=broker,
+        state_store=state_store,
+        logger_instances=[],
+    )
+    monkeypatch.setattr(runtime, "execute_cycle", lambda **_kwargs: None)
+
+    def fail_report(_events: str, _report: str) -> None:
+        raise AssertionError("report should not render")
+
+    monkeypatch.setattr(runtime, "generate_plotly_report", fail_report)
+
+    exit_code = runtime.run(
+        Settings(
+            mode="backtest",
+            strategy="scalping",
+            symbols=["BTCUSD"],
+            backtest_max_steps=1,
+            events_dir=str(tmp_path),
+            emit_report=False,
+        )
+    )
+
+    assert exit_code == 0
+    assert state_store.closed is True
+
+
+def test_run_closes_data_provider_on_exit(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    _patch_runtime_dependencies(
+        monkeypatch,
+        broker=StubBroker(equity=1000.0),
+        state_store=StubStateStore(),
+        logger_instances=[],
+    )
+    closed: list[bool] = []
+    provider = SimpleNamespace(close=lambda: closed.append(True))
+    monkeypatch.setattr(runtime, "build_data_provider", lambda _settings, _strategy: provider)
+    monkeypatch.setattr(runtime, "execute_cycle", lambda **_kwargs: None)
+
+    runtime.run(
+        Settings(
+            mode="backtest",
+            strategy="scalping",
+            symbols=["BTCUSD"],
+            backtest_max_steps=1,
+            events_dir=str(tmp_path),
+        )
+    )
+
+    assert closed == [True]
+
+
+def test_run_closes_event_sink_when_startup_reconcile_fails(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    state_store = StubStateStore()
+    logger_instances: list[StubLogger] = []
+    _patch_runtime_dependencies(
+        monkeypatch,
+        broker=StubBroker(equity=1000.0),
+        state_store=state_store,
+        logger_instances=logger_instances,
+    )
+    sinks: list[StubEventSink] = []
+    monkeypatch.setattr(
+        runtime, "AsyncJsonlEventSink", lambda path: sinks.append(StubEventSink(path)) or sinks[-1]
+    )
+
+    def failing_reconcile(**_kwargs) -> None:
+        raise RuntimeError("broker unavailable")
+
+    monkeypatch.setattr(runtime, "reconcile_state", failing_reconcile)
+
+    exit_code = runtime.run(
+        Settings(
+            mode="live",
+            strategy="scalping",
+            symbols=["BTCUSD"],
+            max_passes=1,
+            events_dir=str(tmp_path),
+        )
+    )
+
+    assert exit_code == 1
+    assert logger_instances[0].errors == ["broker unavailable"]
+    assert len(sinks) == 1
+    assert sinks[0].closed is True
+    assert [event.event_type for event in sinks[0].events] == ["run_started", "error"]
+    assert state_store.closed is True
+
+
+def test_run_reports_event_sink_close_failure_and_still_renders_report(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    state_store = StubStateStore()
+    logger_instances: list[StubLogger] = []
+    _patch_runtime_dependencies(
+        monkeypatch,
+        broker=StubBroker(equity=1000.0),
+        state_store=state_store,
+        logger_instances=logger_instances,
+    )
+
+    class FailingCloseEventSink(StubEventSink):
+        def close(self) -> None:
+            raise OSError("disk full")
+
+    monkeypatch.setattr(runtime, "AsyncJsonlEventSink", FailingCloseEventSink)
+    monkeypatch.setattr(runtime, "execute_cycle", lambda **_kwargs: None)
+    reports: list[str] = []
+    monkeypatch.setattr(
+        runtime, "generate_plotly_report", lambda _events, report: reports.append(report)
+    )
+
+    exit_code = runtime.run(
+        Settings(
+            mode="backtest",
+            strategy="scalping",
+            symbols=["BTCUSD"],
+            backtest_max_steps=1,
+            events_dir=str(tmp_path),
+        )
+    )
+
+    assert exit_code == 1
+    assert logger_instances[0].errors == ["event sink close failed: disk full"]
+    assert len(reports) == 1
+    assert state_store.closed is True
+
+
+class CountingBacktestBroker(BacktestBroker):
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.position_reads = 0
+
+    def get_positions(self) -> dict[str, Position]:
+        self.position_reads += 1
+        return super().get_positions()
+
+
+class StubBarsProvider:
+    def get_bars(self, symbol: str) -> pd.DataFrame:
+        return pd.DataFrame({"close": [99.0, 100.0], "volume": [10.0, 12.0]})
+
+
+@dataclass
+class StubTargetStrategy:
+    target: float
+    strategy_id: str = "stub"
+
+    def decide_targets(self, bars_by_symbol, portfolio) -> dict[str, float]:
+        return {symbol: self.target for symbol in bars_by_symbol}
+
+
+def _run_backtest_cycle(tmp_path, broker: BacktestBroker, target: float) -> list[dict]:
+    sink = JsonlEventSink(str(tmp_path / "events.jsonl"))
+    runtime.execute_cycle(
+        settings=Settings(mode="backtest", strategy="stub", symbols=["SPY"]),
+        strategy=StubTargetStrategy(target=target),
+        data_provider=StubBarsProvider(),
+        broker=broker,
+        state_store=runtime.NoopStateStore(),
+        run_id="run-1",
+        event_sink=sink,
+        human_logger=runtime.HumanLogger("WARNING"),
+    )
+    return load_events(sink.path)
+
+
+def test_execute_cycle_reads_positions_from_portfolio_snapshot(tmp_path) -> None:
+    broker = CountingBacktestBroker(starting_cash=10_000.0)
+
+    events = _run_backtest_cycle(tmp_path, broker, target=1.0)
+
+    assert [event["event_type"] for event in events] == [
+        "decision",
+        "order_submit",
+        "cycle_summary",
+        "order_update",
+        "cycle_summary",
+    ]
+    assert events[2]["payload"]["positions"] == {}
+    assert events[-1]["payload"]["positions_after"] == {"SPY": 1.0}
+    # One read inside the pre-trade snapshot and one inside the post-submit snapshot.
+    assert broker.position_reads == 2
+
+
+def test_execute_cycle_stamps_all_decisions_with_one_clock_read(tmp_path, monkeypatch) -> None:
+    stamps = iter(["2024-01-02T00:00:00+00:00", "2024-01-02T00:00:01+00:00"])
+    monkeypatch.setattr(runtime, "event_timestamp", lambda: next(stamps))
+    sink = JsonlEventSink(str(tmp_path / "events.jsonl"))
+
+    runtime.execute_cycle(
+        settings=Settings(mode="backtest", strategy="stub", symbols=["SPY", "QQQ", "IWM"]),
+        strategy=StubTargetStrategy(target=0.0),
+        data_provider=StubBarsProvider(),
+        broker=BacktestBroker(starting_cash=10_000.0),
+        state_store=runtime.NoopStateStore(),
+        run_id="run-1",
+        event_sink=sink,
+        human_logger=runtime.HumanLogger("WARNING"),
+    )
+
+    decisions = [event for event in load_events(sink.path) if event["event_type"] == "decision"]
+    assert len(decisions) == 3
+    assert {event["ts"] for event in decisions} == {"2024-01-02T00:00:00+00:00"}
+
+
+def test_execute_cycle_reuses_pre_trade_snapshot_when_backtest_submits_nothing(tmp_path) -> None:
+    broker = CountingBacktestBroker(starting_cash=10_000.0)
+
+    events = _run_backtest_cycle(tmp_path, broker, target=0.0)
+
+    assert [event["event_type"] for event in events] == [
+        "decision",
+        "cycle_summary",
+        "cycle_summary",
+    ]
+    pre_submit, post_submit = events[1]["payload"], events[2]["payload"]
+    assert post_submit["submitted_order_count"] == 0
+    assert post_submit["positions_after"] == pre_submit["positions"]
+    assert post_submit["portfolio_after"] == pre_submit["portfolio"]
+    assert broker.position_reads == 1
+
+
+class LogCheckingStateStore(runtime.NoopStateStore):
+    def __init__(self, sink: JsonlEventSink) -> None:
+        self.sink = sink
+        self.logged_at_submit: list[list[str]] = []
+
+    def mark_submitted(self, client_order_id: str, broker_order_id: str, status: str) -> None:
+        events = load_events(self.sink.path)
+        self.logged_at_submit.append([event["event_type"] for event in events])
+
+
+def test_execute_cycle_flushes_receipts_before_marking_live_orders_submitted(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(runtime, "reconcile_state", lambda **_kwargs: None)
+    broker = BacktestBroker(starting_cash=10_000.0)
+    broker.update_market_prices({"SPY": 100.0})
+    sink = JsonlEventSink(str(tmp_path / "events.jsonl"))
+    state_store = LogCheckingStateStore(sink)
+
+    runtime.execute_cycle(
+        settings=Settings(mode="live", strategy="stub", symbols=["SPY"]),
+        strategy=StubTargetStrategy(target=1.0),
+        data_provider=StubBarsProvider(),
+        broker=broker,
+        state_store=state_store,
+        run_id="run-1",
+        event_sink=sink,
+        human_logger=runtime.HumanLogger("WARNING"),
+    )
+
+    assert state_store.logged_at_submit == [
+        ["decision", "order_submit", "cycle_summary", "order_update"]
+    ]
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+from pathlib import Path
+from types import SimpleNamespace
+
+from algotrade.config import Settings
 from algotrade.domain.models import OrderRequest, OrderSide, PortfolioSnapshot, Position, RiskLimits
-from algotrade.runtime import find_risk_blocked_orders, resolve_intent_status
+from algotrade.runtime import (
+    fetch_broker_order_statuses,
+    find_risk_blocked_orders,
+    prepare_orders,
+    reconcile_state,
+    resolve_intent_status,
+)
+from algotrade.state.sqlite_store import SqliteStateStore
 from algotrade.state.store import OrderIntentRecord
 
 
@@ -148,3 +159,236 @@ def test_find_risk_blocked_orders_reports_fractional_short_unsupported() -> None
             "reason": "fractional_short_unsupported",
         }
     ]
+
+
+def test_find_risk_blocked_orders_matches_duplicate_orders_by_count() -> None:
+    order = OrderRequest(symbol="SPY", qty=3, side=OrderSide.BUY)
+    raw_orders = [order, OrderRequest(symbol="SPY", qty=3, side=OrderSide.BUY)]
+    safe_orders = [order]
+    portfolio = PortfolioSnapshot(
+        cash=1000.0,
+        equity=1000.0,
+        buying_power=1000.0,
+        positions={"SPY": Position(symbol="SPY", qty=5)},
+    )
+    limits = RiskLimits(max_abs_position_per_symbol=10, allow_short=True)
+
+    blocked = find_risk_blocked_orders(raw_orders, safe_orders, portfolio, limits)
+
+    assert blocked == [
+        {
+            "symbol": "SPY",
+            "side": "buy",
+            "qty": 3,
+            "current_qty": 5,
+            "proposed_qty": 8,
+            "reason": "filtered",
+        }
+    ]
+
+
+def test_find_risk_blocked_orders_returns_empty_when_nothing_filtered() -> None:
+    raw_orders = [OrderRequest(symbol="SPY", qty=1, side=OrderSide.BUY)]
+    portfolio = PortfolioSnapshot(cash=1000.0, equity=1000.0, buying_power=1000.0, positions={})
+    limits = RiskLimits(max_abs_position_per_symbol=10, allow_short=True)
+
+    assert find_risk_blocked_orders(raw_orders, list(raw_orders), portfolio, limits) == []
+    assert find_risk_blocked_orders([], [], portfolio, limits) == []
+
+
+def test_fetch_broker_order_statuses_prefers_single_bulk_lookup() -> None:
+    class BulkBroker:
+        def __init__(self) -> None:
+            self.bulk_calls: list[list[str]] = []
+
+        def get_order_statuses(
+            self, order_ids: list[str], after: str | None = None
+        ) -> dict[str, str]:
+            self.bulk_calls.append(list(order_ids))
+            return {"oid-1": " Filled ", "oid-2": ""}
+
+        def get_order_status(self, order_id: str) -> str:
+            raise AssertionError(f"unexpected per-order lookup for {order_id}")
+
+    broker = BulkBroker()
+
+    statuses = fetch_broker_order_statuses(broker, ["oid-1", "oid-2"])
+
+    assert statuses == {"oid-1": "filled"}
+    assert broker.bulk_calls == [["oid-1", "oid-2"]]
+
+
+def test_fetch_broker_order_statuses_falls_back_to_per_order_lookup() -> None:
+    class SingleBroker:
+        def get_order_status(self, order_id: str) -> str:
+            if order_id == "oid-2":
+                raise ValueError("not found")
+            return "canceled"
+
+    statuses = fetch_broker_order_statuses(SingleBroker(), ["oid-1", "oid-2"])
+
+    assert statuses == {"oid-1": "canceled"}
+
+
+def test_fetch_broker_order_statuses_falls_back_when_bulk_lookup_fails() -> None:
+    class FlakyBulkBroker:
+        def get_order_statuses(
+            self, order_ids: list[str], after: str | None = None
+        ) -> dict[str, str]:
+            raise ConnectionError("listing unavailable")
+
+        def get_order_status(self, order_id: str) -> str:
+            return "filled"
+
+    statuses = fetch_broker_order_statuses(FlakyBulkBroker(), ["oid-1", "oid-2"])
+
+    assert statuses == {"oid-1": "filled", "oid-2": "filled"}
+
+
+def test_fetch_broker_order_statuses_looks_up_ids_missing_from_bulk_listing() -> None:
+    class PartialBulkBroker:
+        def __init__(self) -> None:
+            self.single_calls: list[str] = []
+
+        def get_order_statuses(
+            self, order_ids: list[str], after: str | None = None
+        ) -> dict[str, str]:
+            return {"oid-1": "filled"}
+
+        def get_order_status(self, order_id: str) -> str:
+            self.single_calls.append(order_id)
+            return "canceled"
+
+    broker = PartialBulkBroker()
+
+    statuses = fetch_broker_order_statuses(broker, ["oid-1", "oid-2"])
+
+    assert statuses == {"oid-1": "filled", "oid-2": "canceled"}
+    assert broker.single_calls == ["oid-2"]
+
+
+def test_reconcile_state_is_skipped_in_backtest_mode() -> None:
+    class UntouchedDependency:
+        def __getattr__(self, name: str) -> object:
+            raise AssertionError(f"unexpected access to {name}")
+
+    reconcile_state(
+        state_store=UntouchedDependency(),
+        broker=UntouchedDependency(),
+        event_sink=UntouchedDependency(),
+        human_logger=UntouchedDependency(),
+        run_id="run-1",
+        settings=Settings(mode="backtest"),
+    )
+
+
+def test_reconcile_state_skips_position_read_when_broker_statuses_resolve() -> None:
+    intents = [
+        OrderIntentRecord(
+            client_order_id=f"cid-{index}",
+            run_id="run-1",
+            symbol="SPY",
+            side="buy",
+            qty=1,
+            status="submitted",
+            broker_order_id=f"oid-{index}",
+            fingerprint="SPY|buy|1",
+            created_ts=f"2025-01-0{2 - index}T00:00:00.000000+00:00",
+        )
+        for index in range(2)
+    ]
+
+    class StubStore:
+        def __init__(self) -> None:
+            self.reconciled: list[tuple[str, str]] = []
+
+        def list_active_intents(self) -> list[OrderIntentRecord]:
+            return intents
+
+        def mark_reconciled(self, client_order_id: str, status: str) -> None:
+            self.reconciled.append((client_order_id, status))
+
+    class StubBroker:
+        def __init__(self) -> None:
+            self.listed_after: list[str | None] = []
+
+        def get_open_orders(self) -> list[object]:
+            return []
+
+        def get_order_statuses(
+            self, order_ids: list[str], after: str | None = None
+        ) -> dict[str, str]:
+            self.listed_after.append(after)
+            return {"oid-0": "filled", "oid-1": "canceled"}
+
+        def get_positions(self) -> dict[str, Position]:
+            raise AssertionError("positions are not needed")
+
+    class StubSink:
+        def emit(self, event: object) -> None:
+            _ = event
+
+        def emit_many(self, events: list[object]) -> None:
+            _ = events
+
+    class StubLogger:
+        def order_update(self, **_kwargs: object) -> None:
+            return None
+
+    store = StubStore()
+    broker = StubBroker()
+    reconcile_state(
+        state_store=store,
+        broker=broker,
+        event_sink=StubSink(),
+        human_logger=StubLogger(),
+        run_id="run-1",
+        settings=Settings(mode="live"),
+    )
+
+    assert store.reconciled == [
+        ("cid-0", "filled_reconciled"),
+        ("cid-1", "closed_reconciled"),
+    ]
+    assert broker.listed_after == ["2025-01-01T00:00:00.000000+00:00"]
+
+
+def test_prepare_orders_saves_intents_in_one_batch_and_blocks_repeats(tmp_path: Path) -> None:
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    saved_batches: list[int] = []
+    save_intended_orders = store.save_intended_orders
+
+    def record_batch(run_id: str, requests: list[OrderRequest]) -> None:
+        saved_batches.append(len(requests))
+        save_intended_orders(run_id, requests)
+
+    store.save_intended_orders = record_batch  # type: ignore[method-assign]
+
+    class StubLogger:
+        def order_update(self, **_kwargs: object) -> None:
+            return None
+
+        def order_submit(self, *_args: object, **_kwargs: object) -> None:
+            return None
+
+    events: list[object] = []
+    prepared, blocked = prepare_orders(
+        orders=[
+            OrderRequest(symbol="SPY", qty=1, side=OrderSide.BUY),
+            OrderRequest(symbol="QQQ", qty=2, side=OrderSide.SELL),
+            OrderRequest(symbol="spy", qty=1, side=OrderSide.BUY),
+        ],
+        run_id="run-1",
+        state_store=store,
+        event_sink=SimpleNamespace(emit=events.append),
+        human_logger=StubLogger(),
+        settings=Settings(mode="live"),
+        strategy=SimpleNamespace(strategy_id="stub"),
+    )
+
+    assert saved_batches == [2]
+    assert [order.symbol for order in prepared] == ["SPY", "QQQ"]
+    assert [item["symbol"] for item in blocked] == ["spy"]
+    assert len(store.list_active_intents()) == 2
+    assert store.has_active_intent("QQQ", "sell", 2)
+    store.close()
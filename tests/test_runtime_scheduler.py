@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from algotrade.runtime import CycleScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def test_cycle_scheduler_subtracts_cycle_duration_from_sleep() -> None:
+    clock = FakeClock()
+    scheduler = CycleScheduler(10.0, clock=clock, sleeper=clock.sleep)
+
+    clock.now += 3.0
+    assert scheduler.wait() == 0.0
+    clock.now += 4.5
+    assert scheduler.wait() == 0.0
+
+    assert clock.sleeps == [7.0, 5.5]
+    assert clock.now == 120.0
+
+
+def test_cycle_scheduler_skips_missed_slots_after_overrun() -> None:
+    clock = FakeClock()
+    scheduler = CycleScheduler(10.0, clock=clock, sleeper=clock.sleep)
+
+    clock.now += 25.0
+    scheduler.wait()
+
+    assert clock.sleeps == [5.0]
+    assert clock.now == 130.0
+
+
+def test_cycle_scheduler_reports_late_wakeups_in_milliseconds() -> None:
+    clock = FakeClock()
+
+    def oversleep(seconds: float) -> None:
+        clock.now += seconds + 0.002
+
+    scheduler = CycleScheduler(1.0, clock=clock, sleeper=oversleep)
+
+    assert round(scheduler.wait(), 3) == 2.0
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from algotrade.domain.models import PortfolioSnapshot
+from algotrade.strategies import scalping
+from algotrade.strategies.scalping import (
+    _PARALLEL_MIN_SYMBOLS,
+    ScalpingParams,
+    ScalpingStrategy,
+    _dual_ema_last,
+)
+from algotrade.strategy_core.kernels import rsi_averages
+
+
+def test_dual_ema_last_matches_pandas_ewm() -> None:
+    values = np.array([100.0, 101.5, 101.5, 99.25, 102.0, 103.75, 103.75, 98.5, 100.0])
+
+    fast, slow = _dual_ema_last(values, 2.0 / (3 + 1.0), 2.0 / (6 + 1.0))
+
+    series = pd.Series(values)
+    assert fast == series.ewm(span=3, adjust=False).mean().iloc[-1]
+    assert slow == series.ewm(span=6, adjust=False).mean().iloc[-1]
+
+
+def test_batched_targets_match_per_symbol_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scalping, "NUMBA_AVAILABLE", True)
+    rng = np.random.default_rng(7)
+    bars_by_symbol = {
+        f"S{index:02d}": pd.DataFrame(
+            {"close": 100.0 + np.cumsum(rng.normal(0.0, 1.0, size=30 + index))}
+        )
+        for index in range(_PARALLEL_MIN_SYMBOLS + 4)
+    }
+    strategy = ScalpingStrategy(ScalpingParams(allow_short=True))
+    closes = {symbol: strategy._close(bars) for symbol, bars in bars_by_symbol.items()}
+
+    batched = strategy._batched_emas(closes)
+
+    assert set(batched) == set(bars_by_symbol)
+    for symbol, close in closes.items():
+        assert batched[symbol] == _dual_ema_last(
+            close.to_numpy(), 2.0 / (5 + 1.0), 2.0 / (20 + 1.0)
+        )
+    batched_rsi = strategy._rsi_values(closes)
+    assert batched_rsi == {
+        symbol: rsi_averages(close.to_numpy(), 14) for symbol, close in closes.items()
+    }
+    snapshot = PortfolioSnapshot(cash=0.0, equity=0.0, buying_power=0.0, positions={})
+    expected = {
+        symbol: strategy._target_from_close(closes[symbol], 0.0) for symbol in sorted(closes)
+    }
+    assert strategy.decide_targets(bars_by_symbol, snapshot) == expected
+
+
+def test_invalid_params_raise_on_every_construction() -> None:
+    params = ScalpingParams(min_trade_size_pct=0.2, max_trade_size_pct=0.1)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="min_trade_size_pct must be <= max_trade_size_pct"):
+            ScalpingStrategy(params)
+    assert ScalpingStrategy(ScalpingParams()).params == ScalpingParams()
+
+
+def test_cached_ema_state_advances_one_bar_bit_for_bit() -> None:
+    rng = np.random.default_rng(11)
+    closes = pd.Series(
+        100.0 + np.cumsum(rng.normal(0.0, 1.0, size=60)),
+        index=pd.date_range("2025-01-01", periods=60, freq="min", tz="UTC"),
+    )
+    closes.iloc[45] = closes.iloc[44]
+    strategy = ScalpingStrategy(ScalpingParams())
+
+    for end in range(25, 61):
+        window = {"AAA": closes.iloc[:end]}
+        emas = strategy._ema_values(window)
+        expected = _dual_ema_last(closes.iloc[:end].to_numpy(), 2.0 / (5 + 1.0), 2.0 / (20 + 1.0))
+        assert emas["AAA"] == expected
+    assert strategy._ema_state["AAA"][2] == 60
+
+    shifted = {"AAA": closes.iloc[1:]}
+    assert strategy._advance_ema_state("AAA", shifted["AAA"]) is None
+    assert strategy._ema_values(shifted)["AAA"] == _dual_ema_last(
+        closes.iloc[1:].to_numpy(), 2.0 / (5 + 1.0), 2.0 / (20 + 1.0)
+    )
+
+
+def test_ema_values_fall_back_to_pandas_ewm_without_numba(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def unexpected_kernel(*_args: object) -> None:
+        raise AssertionError("the EMA replay kernel should not run without Numba")
+
+    monkeypatch.setattr(scalping, "NUMBA_AVAILABLE", False)
+    monkeypatch.setattr(scalping, "_dual_ema_last", unexpected_kernel)
+    rng = np.random.default_rng(19)
+    closes = pd.Series(100.0 + np.cumsum(rng.normal(0.0, 1.0, size=40)))
+    strategy = ScalpingStrategy(ScalpingParams())
+
+    for end in (30, 31, 40):
+        emas = strategy._ema_values({"AAA": closes.iloc[:end]})
+        assert emas["AAA"] == (
+            closes.iloc[:end].ewm(span=5, adjust=False).mean().iloc[-1],
+            closes.iloc[:end].ewm(span=20, adjust=False).mean().iloc[-1],
+        )
+    assert strategy._ema_state["AAA"][2] == 40
+
+
+def test_cached_rsi_state_advances_one_bar_bit_for_bit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(scalping, "NUMBA_AVAILABLE", True)
+    rng = np.random.default_rng(17)
+    closes = pd.Series(
+        np.round(100.0 + np.cumsum(rng.normal(0.0, 1.0, size=60)), 1),
+        index=pd.date_range("2025-01-01", periods=60, freq="min", tz="UTC"),
+    )
+    closes.iloc[40:44] = closes.iloc[39]
+    strategy = ScalpingStrategy(ScalpingParams())
+
+    for end in range(21, 61):
+        averages = strategy._rsi_values({"AAA": closes.iloc[:end]})
+        assert averages["AAA"] == rsi_averages(closes.iloc[:end].to_numpy(), 14)
+    assert strategy._rsi_state["AAA"][2] == 60
+
+    shifted = closes.iloc[1:]
+    assert strategy._rsi_values({"AAA": shifted})["AAA"] == rsi_averages(shifted.to_numpy(), 14)
+
+
+def test_rsi_falls_back_to_pandas_rolling_without_numba(monkeypatch: pytest.MonkeyPatch) -> None:
+    def unexpected_replay(*_args: object) -> None:
+        raise AssertionError("RSI states should not be replayed without Numba")
+
+    rng = np.random.default_rng(23)
+    closes = pd.Series(np.round(100.0 + np.cumsum(rng.normal(0.0, 1.0, size=40)), 1))
+    compiled = ScalpingStrategy(ScalpingParams())._latest_indicators(closes)
+    monkeypatch.setattr(scalping, "NUMBA_AVAILABLE", False)
+    monkeypatch.setattr(scalping, "rsi_states", unexpected_replay)
+    monkeypatch.setattr(scalping, "rsi_averages", unexpected_replay)
+    strategy = ScalpingStrategy(ScalpingParams())
+
+    assert strategy._rsi_values({"AAA": closes}) == {}
+    assert strategy._latest_indicators(closes) == compiled
+    assert strategy._rsi_state == {}
+
+
+def test_rsi_averages_match_pandas_rolling_chain() -> None:
+    rng = np.random.default_rng(13)
+    values = np.round(100.0 + np.cumsum(rng.normal(0.0, 1.0, size=80)), 1)
+    values[20:30] = values[19]
+    values[50:56] = np.linspace(values[49], values[49] + 5.0, 6)
+    series = pd.Series(values)
+    delta = series.diff()
+    gains = delta.clip(lower=0.0)
+    losses = -delta.clip(upper=0.0)
+
+    for end in (15, 30, 56, 80):
+        avg_gain, avg_loss = rsi_averages(values[:end], 14)
+        assert avg_gain == gains.iloc[:end].rolling(window=14).mean().iloc[-1]
+        assert avg_loss == losses.iloc[:end].rolling(window=14).mean().iloc[-1]
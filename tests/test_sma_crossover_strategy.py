@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from algotrade.strategies import sma_crossover
+from algotrade.strategies.sma_crossover import SmaCrossoverParams, SmaCrossoverStrategy
+
+
+def _closes(values: np.ndarray) -> pd.Series:
+    index = pd.date_range("2025-01-01", periods=len(values), freq="min", tz="UTC")
+    return pd.Series(values, index=index, name="close")
+
+
+def test_incremental_smas_match_pandas_rolling_bar_for_bar(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(sma_crossover, "NUMBA_AVAILABLE", True)
+    rng = np.random.default_rng(5)
+    values = np.round(100.0 + np.cumsum(rng.normal(0.0, 1.0, size=120)), 2)
+    values[30:42] = values[29]
+    values[70] = np.nan
+    closes = _closes(values)
+    strategy = SmaCrossoverStrategy(SmaCrossoverParams(short_window=3, long_window=8))
+
+    for end in range(9, len(closes) + 1):
+        window = closes.iloc[:end]
+        short_sma, long_sma = strategy._latest_smas("AAA", window)
+        expected_short = window.rolling(window=3).mean().iloc[-1]
+        expected_long = window.rolling(window=8).mean().iloc[-1]
+        np.testing.assert_array_equal([short_sma, long_sma], [expected_short, expected_long])
+    assert strategy._sma_state["AAA"][2] == len(closes)
+
+
+def test_sma_state_rebuilds_when_history_rolls(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sma_crossover, "NUMBA_AVAILABLE", True)
+    closes = _closes(np.linspace(100.0, 130.0, 40))
+    strategy = SmaCrossoverStrategy(SmaCrossoverParams(short_window=3, long_window=8))
+    strategy._latest_smas("AAA", closes.iloc[:30])
+
+    rolled = closes.iloc[5:31]
+    short_sma, long_sma = strategy._latest_smas("AAA", rolled)
+
+    assert short_sma == rolled.rolling(window=3).mean().iloc[-1]
+    assert long_sma == rolled.rolling(window=8).mean().iloc[-1]
+
+
+def test_smas_use_pandas_rolling_without_numba(monkeypatch: pytest.MonkeyPatch) -> None:
+    def unexpected_replay(*_args: object) -> None:
+        raise AssertionError("rolling-mean states should not be replayed without Numba")
+
+    monkeypatch.setattr(sma_crossover, "NUMBA_AVAILABLE", False)
+    monkeypatch.setattr(sma_crossover, "replay_rolling_mean", unexpected_replay)
+    closes = _closes(np.linspace(100.0, 130.0, 40))
+    strategy = SmaCrossoverStrategy(SmaCrossoverParams(short_window=3, long_window=8))
+
+    for end in (30, 31):
+        window = closes.iloc[:end]
+        assert strategy._latest_smas("AAA", window) == (
+            window.rolling(window=3).mean().iloc[-1],
+            window.rolling(window=8).mean().iloc[-1],
+        )
+    assert "AAA" not in strategy._sma_state
@@ -3,6 +3,8 @@ from __future__ import annotations
 import sqlite3
 from pathlib import Path
 
+import pytest
+
 from algotrade.domain.models import OrderRequest, OrderSide
 from algotrade.state.sqlite_store import SqliteStateStore
 
@@ -55,3 +57,121 @@ def test_sqlite_store_tracks_fractional_order_qty(tmp_path: Path) -> None:
     assert store.has_active_intent("BTCUSD", "sell", 0.998)
     assert not store.has_active_intent("BTCUSD", "sell", 1.0)
     store.close()
+
+
+def test_sqlite_store_transaction_commits_once_on_exit(tmp_path: Path) -> None:
+    db_path = tmp_path / "state_batch.db"
+    store = SqliteStateStore(str(db_path))
+    journal_mode = store.connection.execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == "wal"
+
+    def committed_intents() -> int:
+        reader = sqlite3.connect(db_path)
+        try:
+            return reader.execute("SELECT COUNT(*) FROM order_intents").fetchone()[0]
+        finally:
+            reader.close()
+
+    with store.transaction():
+        for index in range(3):
+            store.save_intended_order(
+                "run-batch",
+                OrderRequest(
+                    symbol="SPY",
+                    qty=index + 1,
+                    side=OrderSide.BUY,
+                    client_order_id=f"cid-{index}",
+                ),
+            )
+        with store.transaction():
+            store.mark_submitted("cid-0", "oid-0", "accepted")
+        assert committed_intents() == 0
+        assert store.has_active_intent("SPY", "buy", 2)
+
+    assert committed_intents() == 3
+    store.close()
+
+
+def test_sqlite_store_active_intent_cache_tracks_status_changes(tmp_path: Path) -> None:
+    db_path = tmp_path / "state_cache.db"
+    store = SqliteStateStore(str(db_path))
+    for client_order_id in ("cid-a", "cid-b"):
+        store.save_intended_order(
+            "run-cache",
+            OrderRequest(
+                symbol="SPY",
+                qty=1,
+                side=OrderSide.BUY,
+                client_order_id=client_order_id,
+            ),
+        )
+
+    store.refresh_active_cache()
+    assert store.has_active_intent("spy", "BUY", 1.0)
+
+    store.mark_submitted("cid-a", "oid-a", "filled")
+    assert store.has_active_intent("SPY", "buy", 1)
+    store.mark_reconciled("cid-b", "stale_reconciled")
+    assert not store.has_active_intent("SPY", "buy", 1)
+
+    store.mark_reconciled("cid-b", "submitted")
+    assert store.has_active_intent("SPY", "buy", 1)
+
+    other = SqliteStateStore(str(db_path))
+    other.mark_reconciled("cid-b", "closed_reconciled")
+    other.close()
+    assert store.has_active_intent("SPY", "buy", 1)
+    store.refresh_active_cache()
+    assert not store.has_active_intent("SPY", "buy", 1)
+    store.close()
+
+
+def test_sqlite_store_active_scan_uses_covering_index(tmp_path: Path) -> None:
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    plan = store.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT client_order_id, fingerprint FROM order_intents "
+        "WHERE status IN ('intended', 'submitted')"
+    ).fetchall()
+    store.close()
+
+    assert "COVERING INDEX idx_order_intents_status_fingerprint" in plan[0][3]
+
+
+def test_sqlite_store_same_second_writes_keep_insertion_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "algotrade.state.sqlite_store.time.time_ns", lambda: 1_700_000_000_500_000_000
+    )
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    for client_order_id in ("cid-b", "cid-a", "cid-c"):
+        store.save_intended_order(
+            "run-1",
+            OrderRequest(symbol="SPY", qty=1, side=OrderSide.BUY, client_order_id=client_order_id),
+        )
+
+    stamps = store.connection.execute("SELECT DISTINCT created_ts FROM order_intents").fetchall()
+    ordered = [record.client_order_id for record in store.list_active_intents()]
+    store.close()
+
+    assert stamps == [("2023-11-14T22:13:20.500000+00:00",)]
+    assert ordered == ["cid-b", "cid-a", "cid-c"]
+
+
+def test_sqlite_store_mark_reconciled_many_updates_all_intents(tmp_path: Path) -> None:
+    store = SqliteStateStore(str(tmp_path / "state.db"))
+    store.save_intended_orders(
+        "run-1",
+        [
+            OrderRequest(symbol="SPY", qty=1, side=OrderSide.BUY, client_order_id="cid-1"),
+            OrderRequest(symbol="QQQ", qty=2, side=OrderSide.SELL, client_order_id="cid-2"),
+        ],
+    )
+    assert store.has_active_intent("SPY", "buy", 1)
+
+    store.mark_reconciled_many([("cid-1", "filled_reconciled"), ("cid-2", "stale_reconciled")])
+
+    assert store.list_active_intents() == []
+    assert not store.has_active_intent("SPY", "buy", 1)
+    assert not store.has_active_intent("QQQ", "sell", 2)
+    store.close()
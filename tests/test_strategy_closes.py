@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from algotrade.strategy_core.closes import close_array, close_series, last_close
+
+
+def test_close_helpers_match_to_numeric_dropna() -> None:
+    frames = [
+        pd.DataFrame({"close": [1.0, 2.5, 3.0]}),
+        pd.DataFrame({"close": [1.0, np.nan, 3.0]}),
+        pd.DataFrame({"close": ["1.5", "bad", None, "4"]}),
+        pd.DataFrame({"close": [1, 2, 3]}),
+    ]
+    for frame in frames:
+        expected = pd.to_numeric(frame["close"], errors="coerce").dropna()
+
+        pd.testing.assert_series_equal(close_series(frame), expected, check_dtype=False)
+        np.testing.assert_array_equal(close_array(frame), expected.to_numpy(dtype=np.float64))
+        assert last_close(frame) == float(expected.iloc[-1])
+
+
+def test_last_close_skips_trailing_missing_values() -> None:
+    assert last_close(pd.DataFrame({"close": [1.0, 2.0, np.nan]})) == 2.0
+    assert last_close(pd.DataFrame({"close": [np.nan]})) is None
+    assert last_close(pd.DataFrame({"close": ["bad"]})) is None
+    assert last_close(pd.DataFrame({"close": pd.Series([], dtype=float)})) is None
+
+
+def test_close_series_reuses_clean_float_column() -> None:
+    frame = pd.DataFrame({"close": [1.0, 2.0]})
+
+    assert np.shares_memory(close_series(frame).to_numpy(), frame["close"].to_numpy())
+    assert np.shares_memory(close_array(frame), frame["close"].to_numpy())
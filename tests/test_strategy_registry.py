@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from types import ModuleType
 
 import pandas as pd
+import pytest
 
 from algotrade.config import Settings
 from algotrade.strategies.scalping import ScalpingStrategy
 from algotrade.strategy_core import registry
-from algotrade.strategy_core.base import Strategy
+from algotrade.strategy_core.base import Strategy, symbol_order
 from algotrade.strategy_core.registry import available_strategy_ids, create_strategy
 
 
@@ -48,3 +50,43 @@ def test_registry_keeps_explicit_strategy_id_when_not_placeholder() -> None:
     resolved = registry._resolved_strategy_id("scalping", ScalpingStrategy)
 
     assert resolved == "scalping"
+
+
+def test_compiled_factory_builds_fresh_params_and_defers_config_errors() -> None:
+    module = ModuleType("fake_strategies.widget")
+
+    class WidgetStrategy(_TemplatePlaceholderStrategy):
+        def __init__(self, params: dict[str, int], settings: Settings) -> None:
+            self.params = params
+            self.settings = settings
+
+    class BrokenStrategy(_TemplatePlaceholderStrategy):
+        def __init__(self, params: dict[str, int]) -> None:
+            self.params = params
+
+    def default_widget_params() -> dict[str, int]:
+        return {"window": 3}
+
+    module.default_widget_params = default_widget_params
+    factory = registry._compile_strategy_factory(WidgetStrategy, module, "widget")
+    settings = Settings()
+
+    first = factory(settings)
+    second = factory(settings)
+    assert first.params == {"window": 3}
+    assert first.params is not second.params
+    assert first.settings is settings
+
+    broken = registry._compile_strategy_factory(BrokenStrategy, ModuleType("empty"), "broken")
+    with pytest.raises(ValueError, match="requires params"):
+        broken(settings)
+
+
+def test_symbol_order_sorts_once_per_key_sequence() -> None:
+    bars_by_symbol = {"MSFT": None, "AAPL": None, "SPY": None}
+
+    first = symbol_order(bars_by_symbol)
+
+    assert first == ("AAPL", "MSFT", "SPY")
+    assert symbol_order(dict(bars_by_symbol)) is first
+    assert symbol_order({"AAPL": None}) == ("AAPL",)
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from algotrade.domain.models import PortfolioSnapshot, Position
+from algotrade.strategy_core import algorithm_imports
 from algotrade.strategy_core.algorithm_imports import (
+    DonchianChannel,
+    ExponentialMovingAverage,
     QCAlgorithm,
     QCAlgorithmStrategyAdapter,
+    RelativeStrengthIndex,
     Resolution,
+    SimpleMovingAverage,
+    Slice,
+    _previous_and_current,
     timedelta,
 )
 
@@ -129,3 +138,154 @@ def test_pasted_qcalgorithm_persists_target_until_changed() -> None:
 
     assert first_targets["SPY"] == 1.0
     assert second_targets["SPY"] == 1.0
+
+
+def test_pasted_qcalgorithm_keeps_positions_missing_from_bars() -> None:
+    adapter = QCAlgorithmStrategyAdapter(
+        algorithm_type=HoldOnceAlgorithm,
+        strategy_id="hold_once",
+    )
+    bars = pd.DataFrame({"close": [100.0, 101.0]})
+    snapshot = _snapshot({"QQQ": Position(symbol="QQQ", qty=2.0)})
+
+    targets = adapter.decide_targets({"SPY": bars, "IWM": bars}, snapshot)
+
+    assert list(targets) == ["IWM", "QQQ", "SPY"]
+    assert targets["QQQ"] == 2.0
+
+
+def test_donchian_channel_bands_match_pandas_rolling_with_gaps() -> None:
+    frame = pd.DataFrame(
+        {
+            "high": [5.0, 7.0, 6.0, 9.0, float("nan"), 8.0, 4.0, 6.0, 5.0],
+            "low": [1.0, 2.0, 0.5, 3.0, 2.0, 1.5, 2.5, float("nan"), 3.0],
+        }
+    )
+    channel = DonchianChannel("SPY", upper_period=3, lower_period=2)
+
+    channel.update({"SPY": frame})
+    assert (channel.upper_band.previous.value, channel.upper_band.current.value) == (8.0, 6.0)
+    assert (channel.lower_band.previous.value, channel.lower_band.current.value) == (1.5, 1.5)
+
+    channel.update({"SPY": frame.iloc[:4]})
+    assert (channel.upper_band.previous.value, channel.upper_band.current.value) == (7.0, 9.0)
+    assert (channel.lower_band.previous.value, channel.lower_band.current.value) == (0.5, 0.5)
+
+
+def test_donchian_channel_advances_bar_by_bar_like_rolling() -> None:
+    rng = np.random.default_rng(3)
+    high = 100.0 + np.cumsum(rng.normal(0.0, 1.0, size=80))
+    frame = pd.DataFrame({"high": high, "low": high - 2.0})
+    frame.loc[40, "high"] = float("nan")
+    channel = DonchianChannel("SPY", upper_period=5, lower_period=7)
+    upper = frame["high"].rolling(window=5).max()
+    lower = frame["low"].rolling(window=7).min()
+
+    for end in range(8, len(frame) + 1):
+        channel.update({"SPY": frame.iloc[:end]})
+        upper_valid = upper.iloc[:end].dropna()
+        lower_valid = lower.iloc[:end].dropna()
+        assert channel.upper_band.current.value == upper_valid.iloc[-1]
+        assert channel.upper_band.previous.value == upper_valid.iloc[-2]
+        assert channel.lower_band.current.value == lower_valid.iloc[-1]
+        assert channel.lower_band.previous.value == lower_valid.iloc[-2]
+
+
+@pytest.mark.parametrize("numba_available", [True, False])
+def test_moving_average_and_rsi_indicators_match_pandas(
+    monkeypatch: pytest.MonkeyPatch, numba_available: bool
+) -> None:
+    monkeypatch.setattr(algorithm_imports, "NUMBA_AVAILABLE", numba_available)
+    rng = np.random.default_rng(5)
+    close = pd.Series(np.round(100.0 + np.cumsum(rng.normal(0.0, 1.0, size=60)), 2))
+    gapped = close.copy()
+    gapped.iloc[[7, 30]] = float("nan")
+
+    for series in (close, gapped, close.iloc[:1]):
+        bars = {"SPY": pd.DataFrame({"close": series})}
+        sma = SimpleMovingAverage("SPY", 5)
+        ema = ExponentialMovingAverage("SPY", 9)
+        rsi = RelativeStrengthIndex("SPY", 14)
+        for indicator in (sma, ema, rsi):
+            indicator.update(bars)
+
+        delta = series.diff()
+        avg_gain = delta.clip(lower=0.0).rolling(window=14).mean()
+        avg_loss = (-delta.clip(upper=0.0)).rolling(window=14).mean()
+        expected_rsi = (100.0 - 100.0 / (1.0 + avg_gain / avg_loss.replace(0.0, np.nan))).fillna(
+            100.0
+        )
+        expected = {
+            sma: series.rolling(window=5).mean().dropna(),
+            ema: series.ewm(span=9, adjust=False).mean().dropna(),
+            rsi: expected_rsi,
+        }
+        for indicator, values in expected.items():
+            if values.empty:
+                assert (indicator.current.previous.value, indicator.current.current.value) == (0, 0)
+                continue
+            assert indicator.current.current.value == values.iloc[-1]
+            assert indicator.current.previous.value == values.iloc[-min(2, len(values))]
+
+
+@pytest.mark.parametrize("numba_available", [True, False])
+def test_moving_average_and_rsi_indicators_advance_bar_by_bar(
+    monkeypatch: pytest.MonkeyPatch, numba_available: bool
+) -> None:
+    monkeypatch.setattr(algorithm_imports, "NUMBA_AVAILABLE", numba_available)
+    rng = np.random.default_rng(11)
+    close = pd.Series(np.round(100.0 + np.cumsum(rng.normal(0.0, 1.0, size=70)), 2))
+    close.iloc[50] = float("nan")
+    indicators = [
+        SimpleMovingAverage("SPY", 5),
+        ExponentialMovingAverage("SPY", 9),
+        RelativeStrengthIndex("SPY", 14),
+    ]
+
+    for end in range(1, len(close) + 1):
+        bars = {"SPY": pd.DataFrame({"close": close.iloc[:end]})}
+        for indicator in indicators:
+            indicator.update(bars)
+            expected = type(indicator)("SPY", indicator.period)
+            expected.update(bars)
+            assert indicator.current.previous.value == expected.current.previous.value
+            assert indicator.current.current.value == expected.current.current.value
+
+
+def test_slice_coerces_latest_bar_fields() -> None:
+    frames = {
+        "spy": pd.DataFrame({"close": ["101.5"], "open": [None], "high": ["bad"], "volume": [7]}),
+        "qqq": pd.DataFrame({"close": [float("nan")]}),
+    }
+
+    data = Slice(frames)
+
+    assert "QQQ" not in data
+    bar = data["SPY"]
+    assert (bar.open, bar.high, bar.low, bar.close, bar.volume) == (101.5, 101.5, 101.5, 101.5, 7.0)
+
+
+def test_previous_and_current_skips_trailing_and_interior_gaps() -> None:
+    nan = float("nan")
+    assert _previous_and_current(pd.Series([1.0, 2.0, nan, 3.0])) == (2.0, 3.0)
+    assert _previous_and_current(pd.Series([1.0, nan, 2.0] + [nan] * 20)) == (1.0, 2.0)
+    assert _previous_and_current(pd.Series([5.0] + [nan] * 20)) == (5.0, 5.0)
+    assert _previous_and_current(pd.Series([nan] * 20)) == (0.0, 0.0)
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_bar_frames_are_shared_only_under_copy_on_write(
+    monkeypatch: pytest.MonkeyPatch, copy_on_write: bool
+) -> None:
+    monkeypatch.setattr(algorithm_imports, "_copy_on_write_active", lambda: copy_on_write)
+    frame = pd.DataFrame({"close": [1.0, 2.0, 3.0]})
+    algorithm = QCAlgorithm()
+    algorithm._prepare_cycle(
+        {"spy": frame}, PortfolioSnapshot(cash=0.0, equity=0.0, buying_power=0.0), 1.0
+    )
+
+    history = algorithm.history("SPY", 2)
+    history.iloc[-1, 0] = 99.0
+
+    assert (algorithm._bars_by_symbol["SPY"] is frame) is copy_on_write
+    assert frame["close"].tolist() == [1.0, 2.0, 3.0]